@@ -84,11 +84,11 @@ def setup_package():
     # va faire pointer ce nom vers la fonction proclamer(). La commande sera
     # créé automatiquement.
     # La syntaxe est "nom-de-commande-a-creer = package.module:fonction".
-    # entry_points={
-    #     'console_scripts': [
-    #         'exec_multiview = summit.execute:exec',
-    #     ],
-    # },
+    entry_points={
+        'console_scripts': [
+            'summit-analyze = summit.analyze:analyze',
+        ],
+    },
 
     # A fournir uniquement si votre licence n'est pas listée dans "classifiers"
     # ce qui est notre cas
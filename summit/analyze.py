@@ -0,0 +1,28 @@
+"""This is the analysis module, used to analyze again stored results"""
+
+import logging
+
+
+def analyze(arguments=None):  # pragma: no cover
+    import sys
+
+    import matplotlib
+    matplotlib.use('Agg')
+    from summit.multiview_platform.result_analysis.stored_analysis import \
+        analyze_stored_results
+    from summit.multiview_platform.utils import execution
+
+    if arguments is None:
+        arguments = sys.argv[1:]
+    args = execution.parse_the_analysis_args(arguments)
+    logging.basicConfig(format='%(asctime)s %(levelname)s: %(message)s',
+                        level=logging.INFO)
+    analyze_stored_results(args.result_dir, metrics=args.metrics,
+                           metric_princ=args.metric_princ,
+                           output_directory=args.output_dir,
+                           nb_bootstrap=args.nb_bootstrap,
+                           nb_cores=args.nb_cores)
+
+
+if __name__ == "__main__":
+    analyze()
@@ -6,6 +6,14 @@ import os
 def execute(config_path=None):  # pragma: no cover
     import sys
 
+    if config_path is None:
+        from summit.multiview_platform.utils import configuration, execution
+        args = execution.parse_the_args(sys.argv[1:])
+        if args.plan:
+            # Described from the manifests, without the heavy imports
+            print(execution.get_plan(
+                configuration.get_the_args(args.config_path)))
+            return
     from summit.multiview_platform import exec_classif
     if config_path is None:
         exec_classif.exec_classif(sys.argv[1:])
@@ -1,4 +1,20 @@
-from . import exec_classif, result_analysis, metrics, monoview_classifiers, \
-    monoview, multiview, utils, multiview_classifiers
+import importlib
 
 __all__ = ['metrics', 'monoview', 'monoview_classifiers', 'multiview', 'utils']
+
+# The sub-packages are imported when first used, so that importing the
+# platform does not load every classifier and plotting library.
+_submodules = ['exec_classif', 'result_analysis', 'metrics',
+               'monoview_classifiers', 'monoview', 'multiview', 'utils',
+               'multiview_classifiers']
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__,
+                                                                    name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_submodules))
@@ -1,6 +1,5 @@
 import logging
 import os
-import pkgutil
 import time
 import traceback
 
@@ -8,14 +7,19 @@ import matplotlib
 import numpy as np
 
 # Import own modules
+from . import metrics as metrics_package
 from . import monoview_classifiers
 from . import multiview_classifiers
 from .monoview.exec_classif_mono_view import exec_monoview
 from .multiview.exec_multiview import exec_multiview
 from .result_analysis.execution import analyze_iterations, analyze
+from .result_analysis.feature_importances import get_feature_importances
+from .result_analysis.rendering import FigurePool
 from .utils import execution, dataset, configuration
 from .utils.dataset import delete_HDF5
+from .utils.model_registry import ModelRegistry
 from .utils.organization import secure_file_path
+from .utils.results_store import ResultsStore
 
 matplotlib.use(
     'Agg')  # Anti-Grain Geometry C++ library to make a raster (pixel) image of the figure
@@ -54,20 +58,14 @@ def init_benchmark(cl_type, monoview_algos, multiview_algos):
 
     if "monoview" in cl_type:
         if monoview_algos == ['all']:  # pragma: no cover
-            benchmark["monoview"] = [name for _, name, isPackage in
-                                     pkgutil.iter_modules(
-                                         monoview_classifiers.__path__)
-                                     if not isPackage]
+            benchmark["monoview"] = monoview_classifiers.registry.names()
 
         else:
             benchmark["monoview"] = monoview_algos
 
     if "multiview" in cl_type:
         if multiview_algos == ["all"]:  # pragma: no cover
-            benchmark["multiview"] = [name for _, name, isPackage in
-                                      pkgutil.iter_modules(
-                                          multiview_classifiers.__path__)
-                                      if not isPackage]
+            benchmark["multiview"] = multiview_classifiers.registry.names()
         else:
             benchmark["multiview"] = multiview_algos
     return benchmark
@@ -103,8 +101,10 @@ def init_multiview_exps(classifier_names, views_dictionary, nb_class,
                 gen_single_multiview_arg_dictionary(classifier_name,
                                                     arguments,
                                                     nb_class,
-                                                    {"param_grid": hps_kwargs[
+                                                    dict({"param_grid": hps_kwargs[
                                                         classifier_name]},
+                                                        **get_study_hps_args(
+                                                            hps_kwargs)),
                                                     views_dictionary=views_dictionary)]
         elif hps_method == "Random":
             hps_kwargs = get_random_hps_args(hps_kwargs, classifier_name)
@@ -165,9 +165,11 @@ def init_monoview_exps(classifier_names,
                                                                nb_class,
                                                                view_index,
                                                                view_name,
-                                                               {"param_grid":
-                                                                hps_kwargs[
-                                                                    classifier_name]})
+                                                               dict({"param_grid":
+                                                                     hps_kwargs[
+                                                                         classifier_name]},
+                                                                    **get_study_hps_args(
+                                                                        hps_kwargs)))
             elif hps_method == "Random":
                 hps_kwargs = get_random_hps_args(hps_kwargs, classifier_name)
                 arguments = gen_single_monoview_arg_dictionary(classifier_name,
@@ -195,15 +197,22 @@ def init_monoview_exps(classifier_names,
 
 
 def get_random_hps_args(hps_args, classifier_name):
-    hps_dict = {}
+    hps_dict = get_study_hps_args(hps_args)
     for key, value in hps_args.items():
-        if key in ["n_iter", "equivalent_draws"]:
+        if key in ["n_iter", "equivalent_draws", "staged_eval",
+                   "path_eval"]:
             hps_dict[key] = value
         if key==classifier_name:
             hps_dict["param_distributions"] = value
     return hps_dict
 
 
+def get_study_hps_args(hps_args):
+    return dict((key, value) for key, value in hps_args.items()
+                if key in ["study_path", "study_skip_known",
+                           "study_seed_top_k"])
+
+
 def gen_single_monoview_arg_dictionary(classifier_name, arguments, nb_class,
                                        view_index, view_name, hps_kwargs):
     if classifier_name in arguments:
@@ -308,13 +317,12 @@ def init_kwargs(args, classifiers_names, framework="monoview"):
 
     logging.info("Start:\t Initializing monoview classifiers arguments")
     kwargs = {}
+    if framework == "monoview":
+        available_names = monoview_classifiers.registry.names()
+    else:
+        available_names = multiview_classifiers.registry.names()
     for classifiers_name in classifiers_names:
-        try:
-            if framework == "monoview":
-                getattr(monoview_classifiers, classifiers_name)
-            else:
-                getattr(multiview_classifiers, classifiers_name)
-        except AttributeError:
+        if classifiers_name not in available_names:
             raise AttributeError(
                 classifiers_name + " is not implemented in monoview_classifiers, "
                                    "please specify the name of the file in monoview_classifiers")
@@ -410,22 +418,26 @@ def benchmark_init(directory, classification_indices, labels, labels_dictionary,
     """
     logging.info("Start:\t Benchmark initialization")
     secure_file_path(os.path.join(directory, "train_labels.csv"))
-    train_indices = classification_indices[0]
-    train_labels = dataset_var.get_labels(sample_indices=train_indices)
-    np.savetxt(os.path.join(directory, "train_labels.csv"), train_labels,
-               delimiter=",")
-    np.savetxt(os.path.join(directory, "train_indices.csv"),
-               classification_indices[0],
-               delimiter=",")
     results_monoview = []
-    folds = k_folds.split(np.arange(len(train_labels)), train_labels)
-    min_fold_len = int(len(train_labels) / k_folds.n_splits)
-    for fold_index, (train_cv_indices, test_cv_indices) in enumerate(folds):
-        file_name = os.path.join(directory, "folds", "test_labels_fold_" + str(
-            fold_index) + ".csv")
-        secure_file_path(file_name)
-        np.savetxt(file_name, train_labels[test_cv_indices[:min_fold_len]],
+    if ResultsStore.active is None:
+        train_indices = classification_indices[0]
+        train_labels = dataset_var.get_labels(sample_indices=train_indices)
+        np.savetxt(os.path.join(directory, "train_labels.csv"), train_labels,
                    delimiter=",")
+        np.savetxt(os.path.join(directory, "train_indices.csv"),
+                   classification_indices[0],
+                   delimiter=",")
+        folds = k_folds.split(np.arange(len(train_labels)), train_labels)
+        min_fold_len = int(len(train_labels) / k_folds.n_splits)
+        for fold_index, (train_cv_indices, test_cv_indices) in enumerate(
+                folds):
+            file_name = os.path.join(directory, "folds",
+                                     "test_labels_fold_" + str(
+                                         fold_index) + ".csv")
+            secure_file_path(file_name)
+            np.savetxt(file_name,
+                       train_labels[test_cv_indices[:min_fold_len]],
+                       delimiter=",")
     labels_names = list(labels_dictionary.values())
     logging.info("Done:\t Benchmark initialization")
     return results_monoview, labels_names
@@ -447,48 +459,50 @@ def exec_one_benchmark_mono_core(dataset_var=None, labels_dictionary=None,
                                                     labels_dictionary, k_folds,
                                                     dataset_var)
     logging.getLogger('matplotlib.font_manager').disabled = True
-    logging.info("Start:\t monoview benchmark")
-    traceback_outputs = {}
-    for arguments in argument_dictionaries["monoview"]:
-        try:
-            X = dataset_var.get_v(arguments["view_index"])
-            Y = dataset_var.get_labels()
-            results_monoview += [
-                exec_monoview(directory, X, Y, args["name"], labels_names,
-                              classification_indices, k_folds,
-                              nb_cores, args["file_type"], args["pathf"], random_state,
-                              hyper_param_search=hyper_param_search,
-                              metrics=metrics, feature_ids=dataset_var.feature_ids[arguments["view_index"]],
-                              **arguments)]
-        except BaseException:
-            if track_tracebacks:
-                traceback_outputs[
-                    arguments["classifier_name"] + "-" + arguments[
-                        "view_name"]] = traceback.format_exc()
-            else:
-                raise
-    logging.info("Done:\t monoview benchmark")
-
-    logging.info("Start:\t multiview benchmark")
-    results_multiview = []
-    for arguments in argument_dictionaries["multiview"]:
-        try:
-            results_multiview += [
-                exec_multiview(directory, dataset_var, args["name"],
-                               classification_indices,
-                               k_folds, nb_cores, args["file_type"],
-                               args["pathf"], labels_dictionary, random_state,
-                               labels,
-                               hps_method=hyper_param_search,
-                               metrics=metrics, n_iter=args["hps_iter"],
-                               **arguments)]
-        except BaseException:
-            if track_tracebacks:
-                traceback_outputs[
-                    arguments["classifier_name"]] = traceback.format_exc()
-            else:
-                raise
-    logging.info("Done:\t multiview benchmark")
+    # The monoview estimators are registered to be reused by the fusions
+    with ModelRegistry():
+        logging.info("Start:\t monoview benchmark")
+        traceback_outputs = {}
+        for arguments in argument_dictionaries["monoview"]:
+            try:
+                X = dataset_var.get_v(arguments["view_index"])
+                Y = dataset_var.get_labels()
+                results_monoview += [
+                    exec_monoview(directory, X, Y, args["name"], labels_names,
+                                  classification_indices, k_folds,
+                                  nb_cores, args["file_type"], args["pathf"], random_state,
+                                  hyper_param_search=hyper_param_search,
+                                  metrics=metrics, feature_ids=dataset_var.feature_ids[arguments["view_index"]],
+                                  **arguments)]
+            except BaseException:
+                if track_tracebacks:
+                    traceback_outputs[
+                        arguments["classifier_name"] + "-" + arguments[
+                            "view_name"]] = traceback.format_exc()
+                else:
+                    raise
+        logging.info("Done:\t monoview benchmark")
+
+        logging.info("Start:\t multiview benchmark")
+        results_multiview = []
+        for arguments in argument_dictionaries["multiview"]:
+            try:
+                results_multiview += [
+                    exec_multiview(directory, dataset_var, args["name"],
+                                   classification_indices,
+                                   k_folds, nb_cores, args["file_type"],
+                                   args["pathf"], labels_dictionary, random_state,
+                                   labels,
+                                   hps_method=hyper_param_search,
+                                   metrics=metrics, n_iter=args["hps_iter"],
+                                   **arguments)]
+            except BaseException:
+                if track_tracebacks:
+                    traceback_outputs[
+                        arguments["classifier_name"]] = traceback.format_exc()
+                else:
+                    raise
+        logging.info("Done:\t multiview benchmark")
 
     return [flag, results_monoview + results_multiview, traceback_outputs]
 
@@ -546,6 +560,14 @@ def exec_benchmark(nb_cores, stats_iter,
             dataset_var=dataset_var,
             track_tracebacks=track_tracebacks, nb_cores=nb_cores,
             **arguments)
+        if ResultsStore.active is not None:
+            ResultsStore.active.add_iteration(
+                arguments, benchmark_results[1], dataset_var.get_labels(),
+                sample_ids=dataset_var.sample_ids,
+                feature_importances=get_feature_importances(
+                    benchmark_results[1], feature_ids=dataset_var.feature_ids,
+                    view_names=dataset_var.view_names),
+                dataset_name=dataset_var.get_name())
         analyze_iterations([benchmark_results],
                            benchmark_arguments_dictionaries, stats_iter,
                            metrics, sample_ids=dataset_var.sample_ids,
@@ -585,7 +607,11 @@ def exec_classif(arguments):  # pragma: no cover
     """
     start = time.time()
     args = execution.parse_the_args(arguments)
+    plan = args.plan
     args = configuration.get_the_args(args.config_path)
+    if plan:
+        print(execution.get_plan(args))
+        return
     import sys
     if not sys.platform in ["win32", "cygwin"]:
         os.nice(args["nice"])
@@ -648,15 +674,10 @@ def exec_classif(arguments):  # pragma: no cover
 
         metrics = args["metrics"]
         if metrics == "all":
-            metrics_names = [name for _, name, isPackage
-                             in pkgutil.iter_modules(
-                                 [os.path.join(os.path.dirname(
-                                     os.path.dirname(os.path.realpath(__file__))),
-                                     'metrics')]) if
-                             not isPackage and name not in ["framework",
-                                                            "log_loss",
-                                                            "matthews_corrcoef",
-                                                            "roc_auc_score"]]
+            metrics_names = [name for name
+                             in metrics_package.registry.names()
+                             if metrics_package.registry.get_flag(
+                                 name, "in_all", True)]
             metrics = dict((metric_name, {})
                            for metric_name in metrics_names)
         metrics = arange_metrics(metrics, args["metric_princ"])
@@ -677,5 +698,12 @@ def exec_classif(arguments):  # pragma: no cover
             stats_iter_random_states, metrics,
             argument_dictionaries, benchmark,
             views, views_indices)
-        exec_benchmark(nb_cores, stats_iter, benchmark_argument_dictionaries,
-                       directory, metrics, dataset_var, args["track_tracebacks"])
+        with ResultsStore(os.path.join(directory, "results.hdf5"),
+                          mode="w") as store:
+            store.save_config(args)
+            with FigurePool(args["nb_rendering_cores"]):
+                exec_benchmark(nb_cores, stats_iter,
+                               benchmark_argument_dictionaries, directory,
+                               metrics, dataset_var, args["track_tracebacks"])
+            if args["export_csv"]:
+                store.export_csv()
@@ -23,11 +23,30 @@ Define a getConfig function
                         (lower is better) or (higher is better) to be able to analyze the preds
 """
 
-import os
-
-for module in os.listdir(os.path.dirname(os.path.realpath(__file__))):
-    if module in ['__init__.py'] or module[-3:] != '.py':
-        continue
-    __import__(module[:-3], locals(), globals(), [], 1)
-    pass
-del os
+from ..plugin_registry import PluginRegistry
+
+# The metrics, imported when first used. The metrics declared with `in_all`
+# set to False are not used when all the metrics are asked.
+MANIFEST = {
+    "accuracy_score": {},
+    "f1_score": {},
+    "fbeta_score": {},
+    "hamming_loss": {},
+    "jaccard_score": {},
+    "log_loss": {"in_all": False},
+    "matthews_corrcoef": {"in_all": False},
+    "precision_score": {},
+    "recall_score": {},
+    "roc_auc_score": {"in_all": False},
+    "zero_one_loss": {},
+}
+
+registry = PluginRegistry(__name__, __path__, MANIFEST)
+
+
+def __getattr__(name):
+    return registry.load(name)
+
+
+def __dir__():
+    return registry.dir(globals())
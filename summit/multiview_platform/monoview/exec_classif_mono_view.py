@@ -16,8 +16,10 @@ from .monoview_utils import MonoviewResult, MonoviewResultAnalyzer
 from .. import monoview_classifiers
 from ..utils import hyper_parameter_search
 from ..utils.dataset import extract_subset, HDF5Dataset
+from ..utils.model_registry import ModelRegistry
 from ..utils.multiclass import get_mc_estim
 from ..utils.organization import secure_file_path
+from ..utils.results_store import ResultsStore
 
 # Author-Info
 __author__ = "Baptiste BAUVIN"
@@ -98,7 +100,7 @@ def exec_monoview(directory, X, Y, database_name, labels_names,
                                  X_train, y_train,
                                  random_state, output_file_name,
                                  k_folds, nb_cores, metrics, kwargs,
-                                 **hps_kwargs)
+                                 view_name=view_name, **hps_kwargs)
     hyper_param_duration = time.monotonic() - hyper_param_beg
     logging.info("Done:\t Generate classifier args")
 
@@ -109,6 +111,11 @@ def exec_monoview(directory, X, Y, database_name, labels_names,
                               (random_state, **cl_kwargs),
                               random_state,
                               y=Y)
+    registry = ModelRegistry.active
+    if registry is not None:
+        registry_key = registry.get_key(classifier_name, classifier,
+                                        args["view_index"],
+                                        classification_indices[0])
     fit_beg = time.monotonic()
     classifier.fit(X_train, y_train)
     fit_duration = time.monotonic() - fit_beg
@@ -119,6 +126,11 @@ def exec_monoview(directory, X, Y, database_name, labels_names,
     pred_beg = time.monotonic()
     test_pred = classifier.predict(X_test)
     pred_duration = time.monotonic() - pred_beg
+    if registry is not None:
+        # Shared with the fusion classifiers of the multiview phase
+        registry.add(registry_key, classifier, config=cl_kwargs,
+                     predictions=[(classification_indices[0], train_pred),
+                                  (classification_indices[1], test_pred)])
 
     # Filling the full prediction in the right order
     full_pred = np.zeros(Y.shape, dtype=int) - 100
@@ -203,7 +215,7 @@ def get_hyper_params(classifier_module, search_method, classifier_module_name,
                      classifier_class_name, X_train, y_train,
                      random_state,
                      output_file_name, k_folds, nb_cores, metrics, kwargs,
-                     **hps_kwargs):
+                     view_name=None, **hps_kwargs):
     if search_method != "None":
         logging.info(
             "Start:\t " + search_method + " best settings for " + classifier_module_name)
@@ -216,7 +228,7 @@ def get_hyper_params(classifier_module, search_method, classifier_module_name,
         hps = classifier_hp_search(estimator, scoring=metrics, cv=k_folds,
                                    random_state=random_state,
                                    framework="monoview", n_jobs=nb_cores,
-                                   **hps_kwargs)
+                                   view_name=view_name, **hps_kwargs)
         hps.fit(X_train, y_train)
         cl_kwargs = hps.get_best_params()
         hps.gen_report(output_file_name)
@@ -235,17 +247,18 @@ def save_results(string_analysis, output_file_name, full_labels_pred,
                             encoding="utf-8")
     output_text_file.write(string_analysis)
     output_text_file.close()
-    np.savetxt(output_file_name + "confusion_matrix.csv", confusion_matrix,
-               delimiter=', ')
-    np.savetxt(output_file_name + "full_pred.csv",
-               full_labels_pred.astype(np.int16), delimiter=",")
-    np.savetxt(output_file_name + "train_pred.csv",
-               y_train_pred.astype(np.int16),
-               delimiter=",")
-    np.savetxt(output_file_name + "train_labels.csv", y_train.astype(np.int16),
-               delimiter=",")
-    np.savetxt(output_file_name + "test_labels.csv", y_test.astype(np.int16),
-               delimiter=",")
+    if ResultsStore.active is None:
+        np.savetxt(output_file_name + "confusion_matrix.csv",
+                   confusion_matrix, delimiter=', ')
+        np.savetxt(output_file_name + "full_pred.csv",
+                   full_labels_pred.astype(np.int16), delimiter=",")
+        np.savetxt(output_file_name + "train_pred.csv",
+                   y_train_pred.astype(np.int16),
+                   delimiter=",")
+        np.savetxt(output_file_name + "train_labels.csv",
+                   y_train.astype(np.int16), delimiter=",")
+        np.savetxt(output_file_name + "test_labels.csv",
+                   y_test.astype(np.int16), delimiter=",")
 
     if images_analysis is not None:
         for image_name in images_analysis:
@@ -7,6 +7,7 @@ from matplotlib.ticker import FuncFormatter
 
 from ..utils.base import BaseClassifier, ResultAnalyser
 from ..utils.hyper_parameter_search import CustomRandint
+from ..utils.results_store import ResultsStore
 
 # Author-Info
 __author__ = "Baptiste Bauvin"
@@ -102,8 +103,10 @@ class BaseMonoviewClassifier(BaseClassifier):
                                          for feature_index, feature_importance in
                                          enumerate(feature_importances)
                                          if feature_importance != 0)
-        with open(directory + 'feature_importances.pickle', 'wb') as handle:
-            pickle.dump(features_importances_dict, handle)
+        if ResultsStore.active is None:
+            with open(directory + 'feature_importances.pickle',
+                      'wb') as handle:
+                pickle.dump(features_importances_dict, handle)
         interpret_string = "Feature importances : \n"
         for feature_index, feature_importance in zip(feature_indices_sorted,
                                                    feature_importances_sorted):
@@ -116,6 +119,34 @@ class BaseMonoviewClassifier(BaseClassifier):
     def get_name_for_fusion(self):
         return self.__class__.__name__[:4]
 
+    def path_predict(self, X, y, X_test, path_values):
+        """
+        Fits the classifier for each value of its `path_param`, from the most
+        regularized to the least one, each fit being warm-started from the
+        previous solution.
+
+        Parameters
+        ----------
+        X : np.array, the training samples
+        y : np.array, the training labels
+        X_test : np.array, the samples to predict
+        path_values : list, the values of `path_param` to evaluate
+
+        Returns
+        -------
+        The list of the predictions on `X_test`, in the order of `path_values`
+        """
+        order = np.argsort(path_values)
+        if self.path_descending:
+            order = order[::-1]
+        predictions = [None for _ in path_values]
+        self.warm_start = True
+        for value_index in order:
+            setattr(self, self.path_param, path_values[value_index])
+            self.fit(X, y)
+            predictions[value_index] = self.predict(X_test)
+        return predictions
+
 
 def percent(x, pos):
     """Used to print percentage of importance on the y axis"""
@@ -123,6 +154,12 @@ def percent(x, pos):
 
 
 class MonoviewResult(object):
+    """Record of the results of a monoview classifier on a view"""
+    __slots__ = ["view_index", "classifier_name", "view_name",
+                 "metrics_scores", "full_labels_pred", "classifier_config",
+                 "clf", "n_features", "hps_duration", "fit_duration",
+                 "pred_duration", "class_metric_scores", "display_name"]
+
     def __init__(self, view_index, classifier_name, view_name, metrics_scores,
                  full_labels_pred, classifier_config,
                  classifier, n_features, hps_duration, fit_duration,
@@ -139,9 +176,10 @@ class MonoviewResult(object):
         self.fit_duration = fit_duration
         self.pred_duration = pred_duration
         self.class_metric_scores = class_metric_scores
+        self.display_name = self.classifier_name + "-" + self.view_name
 
     def get_classifier_name(self):
-        return self.classifier_name + "-" + self.view_name
+        return self.display_name
 
 
 def get_accuracy_graph(plotted_data, classifier_name, file_name,
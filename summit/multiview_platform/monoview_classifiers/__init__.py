@@ -1,11 +1,54 @@
-import os
-
-for module in os.listdir(os.path.dirname(os.path.realpath(__file__))):
-    if module == '__init__.py' or module[-3:] != '.py':
-        continue
-    __import__(module[:-3], locals(), globals(), [], 1)
-del module
-del os
+from ..plugin_registry import PluginRegistry
+
+# The monoview classifiers, imported when first used. Each module is declared
+# with the name of its classifier class, whether the classifier can
+# predict_proba, and whether it natively supports multiclass problems.
+MANIFEST = {
+    "adaboost": {"classifier_class_name": "Adaboost",
+                 "need_probas": True, "multiclass": True},
+    "decision_tree": {"classifier_class_name": "DecisionTree",
+                      "need_probas": True, "multiclass": True},
+    "gradient_boosting": {"classifier_class_name": "GradientBoosting",
+                          "need_probas": True, "multiclass": False},
+    "imbalance_bagging": {"classifier_class_name": "ImbalanceBagging",
+                          "need_probas": True, "multiclass": True},
+    "knn": {"classifier_class_name": "KNN",
+            "need_probas": True, "multiclass": True},
+    "lasso": {"classifier_class_name": "Lasso",
+              "need_probas": False, "multiclass": True},
+    "random_forest": {"classifier_class_name": "RandomForest",
+                      "need_probas": True, "multiclass": True},
+    "random_scm": {"classifier_class_name": "ScmBagging",
+                   "need_probas": True, "multiclass": False},
+    "scm": {"classifier_class_name": "SCM",
+            "need_probas": True, "multiclass": False},
+    "sgd": {"classifier_class_name": "SGD",
+            "need_probas": False, "multiclass": True},
+    "svm_linear": {"classifier_class_name": "SVMLinear",
+                   "need_probas": True, "multiclass": True},
+    "svm_poly": {"classifier_class_name": "SVMPoly",
+                 "need_probas": True, "multiclass": True},
+    "svm_rbf": {"classifier_class_name": "SVMRBF",
+                "need_probas": True, "multiclass": True},
+}
+
+
+def probe(module):
+    classifier = getattr(module, module.classifier_class_name)()
+    return {"classifier_class_name": module.classifier_class_name,
+            "need_probas": callable(getattr(classifier, "predict_proba",
+                                            None))}
+
+
+registry = PluginRegistry(__name__, __path__, MANIFEST, probe)
+
+
+def __getattr__(name):
+    return registry.load(name)
+
+
+def __dir__():
+    return registry.dir(globals())
 
 """
 To be able to add a monoview Classifier to the benchmark, one has to :
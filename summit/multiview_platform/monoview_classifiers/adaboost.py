@@ -41,6 +41,7 @@ class Adaboost(AdaBoostClassifier, BaseMonoviewClassifier):
         self.plotted_metric_name = "zero_one_loss"
         self.step_predictions = None
         self.estimator_config = estimator_config
+        self.native_multiclass = True
 
     def fit(self, X, y, sample_weight=None):
         begin = time.time()
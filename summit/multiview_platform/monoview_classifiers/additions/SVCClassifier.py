@@ -1,3 +1,5 @@
+from scipy.sparse import issparse
+from sklearn.metrics.pairwise import pairwise_kernels
 from sklearn.svm import SVC
 
 
@@ -15,3 +17,40 @@ class SVCClassifier(SVC):
         )
         self.classed_params = []
         self.weird_strings = {}
+
+    def path_predict(self, X, y, X_test, path_values):
+        """libsvm can't be warm-started, so the path shares the train and test
+        kernel matrices between all the values of `C`. As the predictions do
+        not depend on the probability calibration, it is skipped."""
+        kernel_params = {"gamma": self.get_gamma(X), "degree": self.degree,
+                         "coef0": self.coef0}
+        train_kernel = pairwise_kernels(X, metric=self.kernel,
+                                        filter_params=True, **kernel_params)
+        test_kernel = pairwise_kernels(X_test, X, metric=self.kernel,
+                                       filter_params=True, **kernel_params)
+        # The parameters are read from the attributes, as the subclasses'
+        # signatures do not expose all of SVC's.
+        svc_params = dict((param_name, getattr(self, param_name))
+                          for param_name in SVC._get_param_names()
+                          if param_name not in ["kernel", "gamma", "degree",
+                                                "coef0", "probability"])
+        predictions = []
+        for value in path_values:
+            estimator = SVC(**dict(svc_params, C=value, kernel="precomputed",
+                                   probability=False))
+            estimator.fit(train_kernel, y)
+            predictions.append(estimator.predict(test_kernel))
+        return predictions
+
+    def get_gamma(self, X):
+        """Same computation as in scikit-learn's `SVC.fit`"""
+        if self.gamma == "scale":
+            if issparse(X):
+                X_var = X.multiply(X).mean() - X.mean() ** 2
+            else:
+                X_var = X.var()
+            return 1.0 / (X.shape[1] * X_var) if X_var != 0 else 1.0
+        elif self.gamma == "auto":
+            return 1.0 / X.shape[1]
+        else:
+            return self.gamma
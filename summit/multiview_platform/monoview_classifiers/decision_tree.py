@@ -33,6 +33,8 @@ class DecisionTree(DecisionTreeClassifier, BaseMonoviewClassifier):
                          ["gini", "entropy"],
                          ["best", "random"], [random_state]]
         self.weird_strings = {}
+        self.releases_gil = True
+        self.native_multiclass = True
 
     def get_interpretation(self, directory, base_file_name, y_test, feature_ids,
                            multiclass=False):
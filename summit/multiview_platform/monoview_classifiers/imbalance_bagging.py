@@ -26,6 +26,7 @@ class ImbalanceBagging(BaseMonoviewClassifier, BalancedBaggingClassifier):
                          ["auto"]]
         self.weird_strings = {"base_estimator": "class_name"}
         self.base_estimator_config = base_estimator_config
+        self.native_multiclass = True
 
 
 
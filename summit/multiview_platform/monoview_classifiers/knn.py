@@ -32,4 +32,6 @@ class KNN(KNeighborsClassifier, BaseMonoviewClassifier):
                          ["auto", "ball_tree", "kd_tree", "brute"], [1, 2],
                          [random_state]]
         self.weird_strings = {}
+        self.releases_gil = True
+        self.native_multiclass = True
         self.random_state = random_state
@@ -31,6 +31,10 @@ class Lasso(LassoSK, BaseMonoviewClassifier):
         self.distribs = [CustomRandint(low=1, high=300),
                          CustomUniform(), [random_state]]
         self.weird_strings = {}
+        self.path_param = "alpha"
+        self.path_descending = True
+        self.releases_gil = True
+        self.native_multiclass = True
 
     def fit(self, X, y, check_input=True):
         neg_y = np.copy(y)
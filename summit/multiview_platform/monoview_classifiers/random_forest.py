@@ -33,6 +33,8 @@ class RandomForest(RandomForestClassifier, BaseMonoviewClassifier):
                          CustomRandint(low=1, high=10),
                          ["gini", "entropy"], [random_state]]
         self.weird_strings = {}
+        self.releases_gil = True
+        self.native_multiclass = True
 
     def get_interpretation(self, directory, base_file_name, y_test, feature_ids,
                            multiclass=False):
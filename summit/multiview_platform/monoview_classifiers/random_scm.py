@@ -90,6 +90,7 @@ class ScmBagging(RandomScmClassifier, BaseMonoviewClassifier):
         self.distribs = [CustomRandint(low=1, high=300), CustomRandint(low=1, high=20),
                          CustomUniform(), CustomUniform(), ["conjunction", "disjunction"], CustomUniform(), [random_state]]
         self.weird_strings = {}
+        self.native_multiclass = False
 
     def set_params(self, p_options=[0.316], **kwargs):
         if not isinstance(p_options, list):
@@ -62,6 +62,7 @@ class SCM(scm, BaseMonoviewClassifier):
                          CustomUniform(loc=0, state=1), [random_state]]
         self.classed_params = []
         self.weird_strings = {}
+        self.native_multiclass = False
 
     def fit(self, X, y, tiebreaker=None, iteration_callback=None, **fit_params):
         self.n_features = X.shape[1]
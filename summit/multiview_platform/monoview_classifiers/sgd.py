@@ -33,3 +33,5 @@ class SGD(SGDClassifier, BaseMonoviewClassifier):
                          ["l1", "l2", "elasticnet"],
                          CustomUniform(loc=0, state=1), [random_state]]
         self.weird_strings = {}
+        self.releases_gil = True
+        self.native_multiclass = True
@@ -25,3 +25,6 @@ class SVMLinear(SVCClassifier, BaseMonoviewClassifier):
                                )
         self.param_names = ["C", "random_state"]
         self.distribs = [CustomUniform(loc=0, state=1), [random_state]]
+        self.path_param = "C"
+        self.releases_gil = True
+        self.native_multiclass = True
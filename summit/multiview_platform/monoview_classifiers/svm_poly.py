@@ -28,3 +28,5 @@ class SVMPoly(SVCClassifier, BaseMonoviewClassifier):
         self.param_names = ["C", "degree", "random_state"]
         self.distribs = [CustomUniform(loc=0, state=1),
                          CustomRandint(low=2, high=30), [random_state]]
+        self.releases_gil = True
+        self.native_multiclass = True
@@ -12,6 +12,7 @@ from .. import multiview_classifiers
 from ..utils import hyper_parameter_search
 from ..utils.multiclass import get_mc_estim
 from ..utils.organization import secure_file_path
+from ..utils.results_store import ResultsStore
 
 # Author-Info
 __author__ = "Baptiste Bauvin"
@@ -107,8 +108,9 @@ def save_results(string_analysis, images_analysis, output_file_name,
                             encoding="utf-8")
     output_text_file.write(string_analysis)
     output_text_file.close()
-    np.savetxt(output_file_name + "confusion_matrix.csv", confusion_matrix,
-               delimiter=',')
+    if ResultsStore.active is None:
+        np.savetxt(output_file_name + "confusion_matrix.csv",
+                   confusion_matrix, delimiter=',')
 
     if images_analysis is not None:
         for image_name in images_analysis.keys():
@@ -274,9 +276,12 @@ def exec_multiview(directory, dataset_var, name, classification_indices,
         estimator = getattr(classifier_module, classifier_name)(
             random_state=random_state,
             **classifier_config)
+        # The candidates are evaluated one after the other, so the binary
+        # problems of each multiclass fit use the cores.
         estimator = get_mc_estim(estimator, random_state,
                                  multiview=True,
-                                 y=dataset_var.get_labels()[available_indices])
+                                 y=dataset_var.get_labels()[available_indices],
+                                 n_jobs=nb_cores)
         hps = hps_method_class(estimator, scoring=metrics, cv=k_folds,
                                random_state=random_state, framework="multiview",
                                n_jobs=nb_cores,
@@ -290,7 +295,7 @@ def exec_multiview(directory, dataset_var, name, classification_indices,
         getattr(classifier_module, classifier_name)(random_state=random_state,
                                                     **classifier_config),
         random_state, multiview=True,
-        y=dataset_var.get_labels())
+        y=dataset_var.get_labels(), n_jobs=nb_cores)
     logging.info("Done:\t Optimizing hyperparameters")
     logging.info("Start:\t Fitting classifier")
     fit_beg = time.monotonic()
@@ -75,20 +75,60 @@ class BaseMultiviewClassifier(BaseClassifier):
             return False
 
 
-class ConfigGenerator():
+# The hyper-parameter names and distributions of the monoview classifiers,
+# read once from an instance of each
+MONOVIEW_METADATA = {}
+
+
+def get_monoview_metadata(classifier_name):
+    """Returns the `param_names` and `distribs` of a monoview classifier"""
+    if classifier_name not in MONOVIEW_METADATA:
+        classifier = get_monoview_classifier(classifier_name)()
+        MONOVIEW_METADATA[classifier_name] = {
+            "param_names": classifier.param_names,
+            "distribs": classifier.distribs}
+    return MONOVIEW_METADATA[classifier_name]
+
+
+class SharedDistribution:
+    """
+    Hyper-parameter distribution of which a single instance is built for each
+    set of init arguments, on the first call to `get`, and shared by all the
+    classifiers using it, so that constructing or cloning a classifier does
+    not rebuild its distributions. The instances must not hold a state
+    changed by `rvs`.
+    """
+
+    @classmethod
+    def get(cls, *args):
+        # Each sub-class has its own instances
+        if "instances" not in cls.__dict__:
+            cls.instances = {}
+        if args not in cls.instances:
+            cls.instances[args] = cls(*args)
+        return cls.instances[args]
+
+
+class ConfigGenerator(SharedDistribution):
+    """Draws a config for each of the monoview classifiers, the
+    distributions being read from the metadata table on the first draw."""
 
     def __init__(self, classifier_names):
-        self.distribs = {}
-        for classifier_name in classifier_names:
-            classifier_class = get_monoview_classifier(classifier_name)
-            self.distribs[classifier_name] = dict((param_name, param_distrib)
-                                                  for param_name, param_distrib
-                                                  in
-                                                  zip(
-                                                      classifier_class().param_names,
-                                                      classifier_class().distribs)
-                                                  if
-                                                  param_name != "random_state")
+        self.classifier_names = classifier_names
+        self.classifiers_distribs = None
+
+    @property
+    def distribs(self):
+        if self.classifiers_distribs is None:
+            self.classifiers_distribs = {}
+            for classifier_name in self.classifier_names:
+                metadata = get_monoview_metadata(classifier_name)
+                self.classifiers_distribs[classifier_name] = dict(
+                    (param_name, param_distrib)
+                    for param_name, param_distrib
+                    in zip(metadata["param_names"], metadata["distribs"])
+                    if param_name != "random_state")
+        return self.classifiers_distribs
 
     def rvs(self, random_state=None):
         config_sample = {}
@@ -107,19 +147,14 @@ class ConfigGenerator():
 
 
 def get_available_monoview_classifiers(need_probas=False):
-    available_classifiers = [module_name
-                             for module_name in dir(monoview_classifiers)
-                             if not (
-                                 module_name.startswith("__") or module_name == "additions")]
+    """The names of the monoview classifiers, read from their manifest
+    without importing them"""
+    registry = monoview_classifiers.registry
+    available_classifiers = registry.names()
     if need_probas:
-        proba_classifiers = []
-        for module_name in available_classifiers:
-            module = getattr(monoview_classifiers, module_name)
-            classifier_class = getattr(module, module.classifier_class_name)()
-            proba_prediction = getattr(classifier_class, "predict_proba", None)
-            if callable(proba_prediction):
-                proba_classifiers.append(module_name)
-        available_classifiers = proba_classifiers
+        available_classifiers = [
+            module_name for module_name in available_classifiers
+            if registry.get_flag(module_name, "need_probas", False)]
     return available_classifiers
 
 
@@ -131,6 +166,15 @@ def get_monoview_classifier(classifier_name, multiclass=False):
 
 
 class MultiviewResult(object):
+    """
+    Record of the results of a multiview classifier. Its display name is
+    computed once, at creation, from the `short_name` of the classifier.
+    """
+    __slots__ = ["classifier_name", "classifier_config", "metrics_scores",
+                 "full_labels_pred", "hps_duration", "fit_duration",
+                 "pred_duration", "class_metric_scores", "clf",
+                 "display_name"]
+
     def __init__(self, classifier_name, classifier_config,
                  metrics_scores, full_labels, hps_duration, fit_duration,
                  pred_duration, class_metric_scores, clf):
@@ -143,8 +187,12 @@ class MultiviewResult(object):
         self.pred_duration = pred_duration
         self.class_metric_scores = class_metric_scores
         self.clf=clf
+        self.display_name = self.init_display_name()
 
-    def get_classifier_name(self):
+    def init_display_name(self):
+        short_name = getattr(self.clf, "short_name", None)
+        if isinstance(short_name, str):
+            return short_name
         try:
             multiview_classifier_module = getattr(multiview_classifiers,
                                                   self.classifier_name)
@@ -155,6 +203,9 @@ class MultiviewResult(object):
         except BaseException:
             return self.classifier_name
 
+    def get_classifier_name(self):
+        return self.display_name
+
 
 class MultiviewResultAnalyzer(ResultAnalyser):
 
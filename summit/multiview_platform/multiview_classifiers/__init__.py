@@ -1,10 +1,63 @@
-import os
-
-for module in os.listdir(os.path.dirname(os.path.realpath(__file__))):
-    if module == '__init__.py' or module[
-            -4:] == '.pyc' or module == '__pycache__' or module[
-            -3:] != '.py':
-        continue
-    __import__(module[:-3], locals(), globals(), [], 1)
-del module
-del os
+from ..plugin_registry import PluginRegistry
+
+# The multiview classifiers, imported when first used. Each module is
+# declared with the name of its classifier class, and whether its monoview
+# estimators have to predict_proba.
+MANIFEST = {
+    "bayesian_inference_fusion": {
+        "classifier_class_name": "BayesianInferenceClassifier",
+        "need_probas": True},
+    "difficulty_fusion": {"classifier_class_name": "DifficultyFusion",
+                          "need_probas": False},
+    "disagree_fusion": {"classifier_class_name": "DisagreeFusion",
+                        "need_probas": False},
+    "double_fault_fusion": {"classifier_class_name": "DoubleFaultFusion",
+                            "need_probas": False},
+    "early_fusion_adaboost": {"classifier_class_name": "EarlyFusionAdaboost",
+                              "need_probas": False},
+    "early_fusion_decision_tree": {"classifier_class_name": "EarlyFusionDT",
+                                   "need_probas": False},
+    "early_fusion_gradient_boosting": {
+        "classifier_class_name": "EarlyFusionGB",
+        "need_probas": False},
+    "early_fusion_lasso": {"classifier_class_name": "EarlyFusionLasso",
+                           "need_probas": False},
+    "early_fusion_random_forest": {"classifier_class_name": "EarlyFusionRF",
+                                   "need_probas": False},
+    "early_fusion_sgd": {"classifier_class_name": "EarlyFusionSGD",
+                         "need_probas": False},
+    "early_fusion_svm_rbf": {"classifier_class_name": "EarlyFusionSVMRBF",
+                             "need_probas": False},
+    "entropy_fusion": {"classifier_class_name": "EntropyFusion",
+                       "need_probas": False},
+    "lp_norm_mkl": {"classifier_class_name": "LPNormMKL",
+                    "need_probas": False},
+    "majority_voting_fusion": {"classifier_class_name": "MajorityVoting",
+                               "need_probas": False},
+    "mucombo": {"classifier_class_name": "MuCumbo", "need_probas": False},
+    "mumbo": {"classifier_class_name": "Mumbo", "need_probas": False},
+    "mvml": {"classifier_class_name": "MVMLClassifier", "need_probas": False},
+    "svm_jumbo_fusion": {"classifier_class_name": "SVMJumboFusion",
+                         "need_probas": False},
+    "weighted_linear_early_fusion": {
+        "classifier_class_name": "WeightedLinearEarlyFusion",
+        "need_probas": False},
+    "weighted_linear_late_fusion": {
+        "classifier_class_name": "WeightedLinearLateFusion",
+        "need_probas": True},
+}
+
+
+def probe(module):
+    return {"classifier_class_name": module.classifier_class_name}
+
+
+registry = PluginRegistry(__name__, __path__, MANIFEST, probe)
+
+
+def __getattr__(name):
+    return registry.load(name)
+
+
+def __dir__():
+    return registry.dir(globals())
@@ -0,0 +1,69 @@
+import numpy as np
+
+
+def weighted_votes(decisions, weights, nb_class):
+    """
+    Accumulates the weighted votes of the views.
+
+    Parameters
+    ----------
+    decisions : np.array of int, shape (n_views, n_samples)
+        The class predicted by each view for each sample.
+    weights : np.array, shape (n_views,)
+        The weight of each view's vote.
+    nb_class : int
+        The number of classes.
+
+    Returns
+    -------
+    votes : np.array, shape (n_samples, nb_class)
+        The sum of the weights of the views that voted for each class.
+
+    Raises
+    ------
+    IndexError
+        If a decision is not in [0, nb_class), as it would be counted for
+        another sample.
+    """
+    decisions = np.asarray(decisions, dtype=int)
+    nb_views, n_samples = decisions.shape
+    if decisions.size and (decisions.min() < 0 or
+                           decisions.max() >= nb_class):
+        raise IndexError("The decisions must be in [0, {}), got values "
+                         "in [{}, {}]".format(nb_class, decisions.min(),
+                                              decisions.max()))
+    # View-major flat indices, so each vote is summed in the order of the
+    # views.
+    bins = (np.arange(n_samples) * nb_class + decisions).ravel()
+    votes = np.bincount(bins,
+                        weights=np.repeat(np.asarray(weights, dtype=float),
+                                          n_samples),
+                        minlength=n_samples * nb_class)
+    return votes.reshape(n_samples, nb_class)
+
+
+def weighted_sum(scores, weights):
+    """
+    Sums the (n_views, n_samples, n_classes) scores weighted by view.
+    """
+    scores = np.asarray(scores, dtype=float)
+    return np.sum(scores * np.asarray(weights).reshape(-1, 1, 1), axis=0)
+
+
+def product_of_experts(probas, weights):
+    """
+    Returns the log of the weighted product of the (n_views, n_samples,
+    n_classes) probabilities, the product of `probas ** weights`, computed
+    as a sum of logs so that it does not underflow with many views.
+    """
+    probas = np.asarray(probas, dtype=float)
+    weights = np.asarray(weights, dtype=float).reshape(-1, 1, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weighted_logs = weights * np.log(probas)
+    # A view with a null weight does not vote, even for a null probability.
+    return np.sum(np.where(weights == 0, 0, weighted_logs), axis=0)
+
+
+def nb_maxima(scores):
+    """Returns the number of classes reaching the maximal score, by sample"""
+    return np.sum(scores == np.max(scores, axis=1, keepdims=True), axis=1)
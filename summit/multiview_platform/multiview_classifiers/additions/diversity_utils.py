@@ -3,6 +3,7 @@ import math
 
 import numpy as np
 
+from .aggregation_utils import weighted_votes
 from .fusion_utils import BaseFusionClassifier
 from ...multiview.multiview_utils import ConfigGenerator, \
     get_available_monoview_classifiers, \
@@ -12,19 +13,39 @@ from ...utils.dataset import get_samples_views_indices
 
 class DiversityFusionClassifier(BaseMultiviewClassifier,
                                 BaseFusionClassifier):
-    """This is the base class for all the diversity fusion based classifiers."""
+    """
+    This is the base class for all the diversity fusion based classifiers.
+
+    The combinations, assigning a monoview classifier to each view, are
+    scored by blocks with `score_combinations(diversity_data, combis)`, that
+    only reads the views covered by the columns of `combis`. If
+    `max_combinations` is set and the number of combinations exceeds it, the
+    exhaustive search is replaced by a beam search that assigns the views one
+    after the other and keeps the best partial combinations, so that about
+    `max_combinations` combinations are scored.
+
+    If `nb_cores` is greater than 1, the pool of (classifier, view) monoview
+    estimators is fitted and evaluated by `nb_cores` workers.
+    """
+
+    search_rows = 2 ** 16
 
     def __init__(self, random_state=None, classifier_names=None,
-                 monoview_estimators=None, classifier_configs=None):
+                 monoview_estimators=None, classifier_configs=None,
+                 max_combinations=None, nb_cores=1):
         """Used to init the instances"""
         BaseMultiviewClassifier.__init__(self, random_state)
         if classifier_names is None:
             classifier_names = get_available_monoview_classifiers()
         self.classifier_names = classifier_names
         self.param_names = ["classifier_configs"]
-        self.distribs = [ConfigGenerator(get_available_monoview_classifiers())]
+        self.distribs = [ConfigGenerator.get(
+            tuple(get_available_monoview_classifiers()))]
         self.monoview_estimators = monoview_estimators
         self.classifier_configs = classifier_configs
+        self.max_combinations = max_combinations
+        self.nb_cores = nb_cores
+        self.native_multiclass = False
 
     def fit(self, X, y, train_indices=None, view_indices=None):
         train_indices, view_indices = get_samples_views_indices(X,
@@ -36,22 +57,39 @@ class DiversityFusionClassifier(BaseMultiviewClassifier,
             raise ValueError(
                 "Multiclass not supported, classes used : {}".format(
                     np.unique(y[train_indices])))
+        classifiers_decisions = None
         if self.monoview_estimators is None:
-            self.monoview_estimators = []
-            for classifier_idx, classifier_name in enumerate(
-                    self.classifier_names):
-                self.monoview_estimators.append([])
-                for idx, view_idx in enumerate(view_indices):
-                    estimator = self.init_monoview_estimator(classifier_name,
-                                                             self.classifier_configs)
-                    estimator.fit(X.get_v(view_idx, train_indices),
-                                  y[train_indices])
-                    self.monoview_estimators[classifier_idx].append(estimator)
+            classifiers_decisions = self.fit_monoview_estimators(
+                X, y, train_indices, view_indices)
         else:
             pass  # TODO
-        self.choose_combination(X, y, train_indices, view_indices)
+        self.choose_combination(X, y, train_indices, view_indices,
+                                classifiers_decisions)
         return self
 
+    def fit_monoview_estimators(self, X, y, train_indices, view_indices):
+        """Fits each classifier on each view and returns their
+        (classifier, view, sample) decisions on the train samples"""
+        tasks = [(self.init_monoview_estimator(classifier_name,
+                                               self.classifier_configs),
+                  classifier_name, self.classifier_configs, view_idx)
+                 for classifier_name in self.classifier_names
+                 for view_idx in view_indices]
+        estimators = self.fit_monoview_estimators_parallel(tasks, X, y,
+                                                           train_indices)
+        decisions = self.predict_monoview_estimators(
+            [(estimator, task[3]) for estimator, task in zip(estimators,
+                                                             tasks)],
+            X, train_indices)
+        self.monoview_estimators = [
+            estimators[classifier_idx * len(view_indices):
+                       (classifier_idx + 1) * len(view_indices)]
+            for classifier_idx in range(len(self.classifier_names))]
+        return np.array(decisions,
+                        dtype=float).reshape(len(self.classifier_names),
+                                             len(view_indices),
+                                             len(train_indices))
+
     def predict(self, X, sample_indices=None, view_indices=None):
         """Just a weighted majority vote"""
         sample_indices, view_indices = get_samples_views_indices(X,
@@ -59,20 +97,17 @@ class DiversityFusionClassifier(BaseMultiviewClassifier,
                                                                  view_indices)
         self._check_views(view_indices)
         nb_class = X.get_nb_class()
-        if nb_class > 2:
-            nb_class = 3
-        votes = np.zeros((len(sample_indices), nb_class), dtype=float)
-        monoview_predictions = [
+        monoview_predictions = np.array([
             monoview_estimator.predict(X.get_v(view_idx, sample_indices))
             for view_idx, monoview_estimator
-            in zip(view_indices, self.monoview_estimators)]
-        for idx, sample_index in enumerate(sample_indices):
-            for monoview_estimator_index, monoview_prediciton in enumerate(
-                    monoview_predictions):
-                if int(monoview_prediciton[idx]) == -100:
-                    votes[idx, 2] += 1
-                else:
-                    votes[idx, int(monoview_prediciton[idx])] += 1
+            in zip(view_indices, self.monoview_estimators)], dtype=int)
+        undecided = monoview_predictions == -100
+        # The undecided votes are counted as a third class
+        if nb_class > 2 or undecided.any():
+            nb_class = 3
+        monoview_predictions[undecided] = 2
+        votes = weighted_votes(monoview_predictions,
+                               np.ones(len(monoview_predictions)), nb_class)
         predicted_labels = np.argmax(votes, axis=1)
         return predicted_labels
 
@@ -82,13 +117,17 @@ class DiversityFusionClassifier(BaseMultiviewClassifier,
                                           len(samples_indices)))
         for estimator_idx, estimator in enumerate(self.monoview_estimators):
             for idx, view_index in enumerate(view_indices):
-                classifiers_decisions[estimator_idx, idx, :] = estimator[
-                    idx].predict(X.get_v(view_index, samples_indices))
+                classifiers_decisions[estimator_idx, idx, :] = \
+                    self.predict_monoview_estimator(estimator[idx], X,
+                                                    view_index,
+                                                    samples_indices)
         return classifiers_decisions
 
-    def init_combinations(self, X, sample_indices, view_indices):
-        classifiers_decisions = self.get_classifiers_decisions(X, view_indices,
-                                                               sample_indices)
+    def init_combinations(self, X, sample_indices, view_indices,
+                          classifiers_decisions=None):
+        if classifiers_decisions is None:
+            classifiers_decisions = self.get_classifiers_decisions(
+                X, view_indices, sample_indices)
         nb_classifiers, nb_views, n_samples = classifiers_decisions.shape
         combinations = itertools.combinations_with_replacement(
             range(nb_classifiers),
@@ -101,12 +140,100 @@ class DiversityFusionClassifier(BaseMultiviewClassifier,
         combis = np.zeros((nb_combinations, nb_views), dtype=int)
         return combinations, combis, div_measure, classifiers_decisions, nb_views
 
+    def search_combination(self, diversity_data, nb_classifiers, nb_views):
+        """Returns the most diverse combination, exhaustively or by beam
+        search if there are more than `max_combinations` combinations."""
+        nb_combinations = math.comb(nb_classifiers + nb_views - 1, nb_views)
+        if self.max_combinations is None \
+                or nb_combinations <= self.max_combinations:
+            return self.exhaustive_search(diversity_data, nb_classifiers,
+                                          nb_views)
+        return self.beam_search(diversity_data, nb_classifiers, nb_views)
+
+    def exhaustive_search(self, diversity_data, nb_classifiers, nb_views):
+        """Scores all the combinations by blocks, in the same order as
+        `init_combinations`, and returns the first best one."""
+        combinations = itertools.combinations_with_replacement(
+            range(nb_classifiers), nb_views)
+        best_score = -np.inf
+        best_combination = None
+        while True:
+            combis = np.fromiter(
+                itertools.chain.from_iterable(
+                    itertools.islice(combinations, self.search_rows)),
+                dtype=int).reshape(-1, nb_views)
+            if combis.shape[0] == 0:
+                break
+            div_measure = self.score_combinations(diversity_data, combis)
+            block_best = np.argmax(div_measure)
+            if best_combination is None \
+                    or div_measure[block_best] > best_score:
+                best_score = div_measure[block_best]
+                best_combination = combis[block_best]
+        return best_combination
+
+    def beam_search(self, diversity_data, nb_classifiers, nb_views):
+        """Assigns a classifier to each view in turn, keeping the best partial
+        combinations, scored on the views assigned so far."""
+        if nb_views == 1:
+            # The beam is the list of all the combinations
+            return self.exhaustive_search(diversity_data, nb_classifiers,
+                                          nb_views)
+        beam_width = max(1, self.max_combinations // (nb_views *
+                                                      nb_classifiers))
+        beam = np.arange(nb_classifiers).reshape(-1, 1)
+        for _ in range(1, nb_views):
+            # Combinations are non-decreasing, as in init_combinations.
+            combis = np.array([np.append(partial, classifier_index)
+                               for partial in beam
+                               for classifier_index
+                               in range(partial[-1], nb_classifiers)])
+            div_measure = self.score_combinations(diversity_data, combis)
+            beam = combis[np.argsort(-div_measure,
+                                     kind="stable")[:beam_width]]
+        return beam[0]
+
+    def set_combination(self, best_combination):
+        self.monoview_estimators = [
+            self.monoview_estimators[classifier_index][view_index]
+            for view_index, classifier_index
+            in enumerate(best_combination)]
+
 
 class GlobalDiversityFusionClassifier(DiversityFusionClassifier):
+    """
+    Base class of the diversity fusion classifiers that measure the diversity
+    of a whole combination at once.
+
+    If the subclass defines `block_diversity_measure(nb_correct, nb_view)`,
+    returning the diversity of each row of `nb_correct` (the number of views
+    that classified each sample correctly, for a block of combinations), the
+    correctness of each monoview classifier is computed once and the
+    combinations are scored by vectorised blocks. Otherwise,
+    `diversity_measure` is called on each combination.
+    """
 
-    def choose_combination(self, X, y, samples_indices, view_indices):
+    block_size = 2 ** 22
+
+    def choose_combination(self, X, y, samples_indices, view_indices,
+                           classifiers_decisions=None):
+        if not hasattr(self, "block_diversity_measure"):
+            return self.choose_combination_loop(X, y, samples_indices,
+                                                view_indices,
+                                                classifiers_decisions)
+        if classifiers_decisions is None:
+            classifiers_decisions = self.get_classifiers_decisions(
+                X, view_indices, samples_indices)
+        nb_classifiers, nb_views, _ = classifiers_decisions.shape
+        correct = np.logical_not(np.logical_xor(classifiers_decisions,
+                                                y[samples_indices]))
+        self.set_combination(self.search_combination(correct, nb_classifiers,
+                                                     nb_views))
+
+    def choose_combination_loop(self, X, y, samples_indices, view_indices,
+                                classifiers_decisions=None):
         combinations, combis, div_measure, classifiers_decisions, nb_views = self.init_combinations(
-            X, samples_indices, view_indices)
+            X, samples_indices, view_indices, classifiers_decisions)
         for combinationsIndex, combination in enumerate(combinations):
             combis[combinationsIndex] = combination
             div_measure[combinationsIndex] = self.diversity_measure(
@@ -114,18 +241,78 @@ class GlobalDiversityFusionClassifier(DiversityFusionClassifier):
                 combination,
                 y[samples_indices])
         best_combi_index = np.argmax(div_measure)
-        best_combination = combis[best_combi_index]
-        self.monoview_estimators = [
-            self.monoview_estimators[classifier_index][view_index]
-            for view_index, classifier_index
-            in enumerate(best_combination)]
+        self.set_combination(combis[best_combi_index])
+
+    def score_combinations(self, correct, combis):
+        """Returns the diversity of each row of `combis`, from the
+        (classifier, view, sample) correctness matrix"""
+        nb_views = combis.shape[1]
+        nb_rows = max(1, self.block_size // (nb_views *
+                                             max(correct.shape[2], 1)))
+        view_range = np.arange(nb_views)
+        div_measure = np.zeros(combis.shape[0])
+        for start in range(0, combis.shape[0], nb_rows):
+            block = combis[start:start + nb_rows]
+            nb_correct = correct[block, view_range].sum(axis=1)
+            div_measure[start:start + nb_rows] = self.block_diversity_measure(
+                nb_correct, nb_views)
+        return div_measure
 
 
 class CoupleDiversityFusionClassifier(DiversityFusionClassifier):
+    """
+    Base class of the diversity fusion classifiers that measure the diversity
+    of a combination as the mean diversity of its couples.
+
+    If the subclass defines `pairwise_bits(classifiers_decisions, y)`,
+    returning a boolean (classifier, view, sample) array, and the
+    `pairwise_operator` bitwise ufunc, such that `diversity_measure` is the
+    operator applied to the bits of the two classifiers, the samples are
+    packed in bitsets and the diversity of every couple of (classifier, view)
+    is computed once by popcount. A combination is then scored by summing
+    lookups in this matrix. Otherwise, `diversity_measure` is called on each
+    couple of each combination.
+    """
+
+    def choose_combination(self, X, y, samples_indices, view_indices,
+                           classifiers_decisions=None):
+        if not hasattr(self, "pairwise_bits"):
+            return self.choose_combination_loop(X, y, samples_indices,
+                                                view_indices,
+                                                classifiers_decisions)
+        if classifiers_decisions is None:
+            classifiers_decisions = self.get_classifiers_decisions(
+                X, view_indices, samples_indices)
+        nb_classifiers, nb_views, _ = classifiers_decisions.shape
+        pair_diversity = self.get_pair_diversity(
+            self.pairwise_bits(classifiers_decisions, y[samples_indices]))
+        self.set_combination(self.search_combination(pair_diversity,
+                                                     nb_classifiers, nb_views))
 
-    def choose_combination(self, X, y, samples_indices, view_indices):
+    def get_pair_diversity(self, bits):
+        """Returns the (classifier, view, classifier, view) matrix of the mean
+        diversity of each couple, computed on the packed sample bitsets"""
+        nb_classifiers, nb_views, nb_samples = bits.shape
+        packed = np.packbits(bits.reshape(nb_classifiers * nb_views,
+                                          nb_samples), axis=1)
+        pair_counts = np.zeros((packed.shape[0], packed.shape[0]), dtype=int)
+        for index, bitset in enumerate(packed):
+            pair_counts[index] = POPCOUNT[
+                self.pairwise_operator(bitset, packed)].sum(axis=1)
+        return (pair_counts / nb_samples).reshape(nb_classifiers, nb_views,
+                                                  nb_classifiers, nb_views)
+
+    def score_combinations(self, pair_diversity, combis):
+        """Returns the mean couple diversity of each row of `combis`"""
+        first_views, second_views = np.triu_indices(combis.shape[1], 1)
+        return np.mean(pair_diversity[combis[:, first_views], first_views,
+                                      combis[:, second_views], second_views],
+                       axis=1)
+
+    def choose_combination_loop(self, X, y, samples_indices, view_indices,
+                                classifiers_decisions=None):
         combinations, combis, div_measure, classifiers_decisions, nb_views = self.init_combinations(
-            X, samples_indices, view_indices)
+            X, samples_indices, view_indices, classifiers_decisions)
         for combinations_index, combination in enumerate(combinations):
             combis[combinations_index] = combination
             combi_with_view = [(viewIndex, combiIndex) for viewIndex, combiIndex
@@ -149,11 +336,12 @@ class CoupleDiversityFusionClassifier(DiversityFusionClassifier):
                 couple_diversities[binome_index] = couple_diversity
             div_measure[combinations_index] = np.mean(couple_diversities)
         best_combi_index = np.argmax(div_measure)
-        best_combination = combis[best_combi_index]
-        self.monoview_estimators = [
-            self.monoview_estimators[classifier_index][view_index]
-            for view_index, classifier_index
-            in enumerate(best_combination)]
+        self.set_combination(combis[best_combi_index])
+
+
+# Number of set bits of each byte
+POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8).reshape(-1, 1),
+                         axis=1).sum(axis=1)
 
 #
 # def CQ_div_measure(classifiersNames, classifiersDecisions, measurement,
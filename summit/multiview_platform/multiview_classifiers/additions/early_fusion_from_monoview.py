@@ -1,4 +1,5 @@
 import numpy as np
+from sklearn.utils.metaestimators import available_if
 
 from ... import monoview_classifiers
 from ...multiview.multiview_utils import get_available_monoview_classifiers, \
@@ -53,6 +54,13 @@ class BaseEarlyFusion(BaseMultiviewClassifier):
         predicted_labels = self.monoview_classifier.predict(X)
         return predicted_labels
 
+    @available_if(lambda self: hasattr(self.monoview_classifier,
+                                       "staged_predict"))
+    def staged_predict(self, X, sample_indices=None, view_indices=None):
+        _, X = self.transform_data_to_monoview(X, sample_indices)
+        self._check_views(self.view_indices)
+        return self.monoview_classifier.staged_predict(X)
+
     def get_feature_importances(self):
         self.feature_importances_ = self.monoview_classifier.feature_importances_
 
@@ -1,11 +1,239 @@
 import inspect
 
+import numpy as np
+from joblib import Parallel, delayed
+
 from ...multiview.multiview_utils import get_monoview_classifier
+from ...utils.hps_study import get_fingerprint
+from ...utils.hyper_parameter_search import get_params_key
+from ...utils.model_registry import ModelRegistry
 from ...utils.multiclass import get_mc_estim
 
 
+class MonoviewMemo:
+    """
+    Memo of the fitted monoview estimators and of their predictions, shared
+    by all the candidates of a hyper-parameter search run, so that the
+    candidates differing only by their fusion parameters do not refit the
+    monoview layer.
+
+    The fitted estimators are keyed by (classifier name, config, view, train
+    samples, fingerprint of the train labels), as the binary problems of a
+    one-vs-rest wrapper share their samples, and their predictions by
+    (estimator id, method, view, samples). An id is only valid while its
+    estimator is alive, which the memo (or the model registry, for the
+    estimators of the monoview phase) ensures by keeping a reference on it.
+    The out-of-fold decision matrices of the stacking fusions are keyed by
+    (classifiers, configs, views, train samples, train labels, number of
+    folds) and the view concatenations of the early fusions by (views,
+    samples).
+    The memo is active while used as a context manager.
+    """
+    active = None
+
+    def __init__(self):
+        self.estimators = {}
+        self.predictions = {}
+        self.decisions = {}
+        self.concatenations = {}
+
+    def __enter__(self):
+        MonoviewMemo.active = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        MonoviewMemo.active = None
+        self.estimators = {}
+        self.predictions = {}
+        self.decisions = {}
+        self.concatenations = {}
+
+
+def fit_estimator(estimator, X_train, y_train):
+    return estimator.fit(X_train, y_train)
+
+
+def predict_estimator(estimator, X, method="predict"):
+    return getattr(estimator, method)(X)
+
+
+def releases_gil(estimator):
+    """Whether the estimator (or the one wrapped by a multiclass wrapper)
+    declares that its fit and predict run outside of the GIL."""
+    return getattr(estimator, "releases_gil",
+                   getattr(getattr(estimator, "estimator", None),
+                           "releases_gil", False))
+
+
 class BaseFusionClassifier():
 
+    def get_hps_context(self):
+        """Context shared by all the fits of a hyper-parameter search run"""
+        return MonoviewMemo()
+
+    def fit_monoview_estimator(self, estimator, classifier_name,
+                               classifier_config, X, y, view_index,
+                               train_indices):
+        """Fits the estimator on the view, or fetches the identical estimator
+        already fitted on the same samples during the monoview phase or the
+        current hyper-parameter search run."""
+        registered = self.get_registered_estimator(estimator, classifier_name,
+                                                   view_index, train_indices)
+        if registered is not None:
+            return registered
+        memo = MonoviewMemo.active
+        if memo is None:
+            return estimator.fit(X.get_v(view_index, train_indices),
+                                 y[train_indices])
+        key = self.get_estimator_key(classifier_name, classifier_config,
+                                     view_index, train_indices, y)
+        if key not in memo.estimators:
+            memo.estimators[key] = estimator.fit(
+                X.get_v(view_index, train_indices), y[train_indices])
+        return memo.estimators[key]
+
+    def predict_monoview_estimator(self, estimator, X, view_index,
+                                   sample_indices, method="predict"):
+        """Calls `method` of a fitted monoview estimator on the view, using
+        the predictions registered during the monoview phase or memoized
+        during a hyper-parameter search run."""
+        registry = ModelRegistry.active
+        if registry is not None:
+            prediction = registry.get_predictions(estimator, method,
+                                                  sample_indices)
+            if prediction is not None:
+                return prediction
+        memo = MonoviewMemo.active
+        if memo is None:
+            return getattr(estimator, method)(X.get_v(view_index,
+                                                      sample_indices))
+        key = self.get_prediction_key(estimator, method, view_index,
+                                      sample_indices)
+        if key not in memo.predictions:
+            memo.predictions[key] = getattr(estimator, method)(
+                X.get_v(view_index, sample_indices))
+        return memo.predictions[key]
+
+    def get_registered_estimator(self, estimator, classifier_name, view_index,
+                                 train_indices):
+        """Returns the estimator fitted during the monoview phase with the
+        same params on the same view and train samples, or None"""
+        registry = ModelRegistry.active
+        if registry is None:
+            return None
+        return registry.get_estimator(registry.get_key(
+            classifier_name, estimator, view_index, train_indices))
+
+    def get_estimator_key(self, classifier_name, classifier_config,
+                          view_index, train_indices, y):
+        return (classifier_name, get_params_key(classifier_config), view_index,
+                np.asarray(train_indices).tobytes(),
+                get_fingerprint([y[train_indices]]))
+
+    def get_prediction_key(self, estimator, method, view_index,
+                           sample_indices):
+        """Only valid while the estimator is kept alive by the memo or the
+        model registry, as its id can be reused afterwards."""
+        return (id(estimator), method, view_index,
+                np.asarray(sample_indices).tobytes())
+
+    def fit_monoview_estimators_parallel(self, tasks, X, y, train_indices):
+        """
+        Fits the monoview estimators described by the (estimator, classifier
+        name, classifier config, view index) `tasks` and returns them.
+
+        With `nb_cores` greater than 1, the estimators are fitted in a thread
+        pool if they all release the GIL, and in a process pool otherwise,
+        where each needed view is extracted once and memory-mapped if it is
+        bigger than 1M.
+        """
+        nb_cores = getattr(self, "nb_cores", 1)
+        if nb_cores <= 1 or len(tasks) <= 1:
+            return [self.fit_monoview_estimator(estimator, classifier_name,
+                                                classifier_config, X, y,
+                                                view_index, train_indices)
+                    for estimator, classifier_name, classifier_config,
+                    view_index in tasks]
+        if all(releases_gil(task[0]) for task in tasks):
+            return Parallel(n_jobs=nb_cores, prefer="threads")(
+                delayed(self.fit_monoview_estimator)(
+                    estimator, classifier_name, classifier_config, X, y,
+                    view_index, train_indices)
+                for estimator, classifier_name, classifier_config, view_index
+                in tasks)
+        memo = MonoviewMemo.active
+        keys = [self.get_estimator_key(classifier_name, classifier_config,
+                                       view_index, train_indices, y)
+                for _, classifier_name, classifier_config, view_index
+                in tasks]
+        estimators = [self.get_registered_estimator(
+            estimator, classifier_name, view_index, train_indices)
+            for estimator, classifier_name, _, view_index in tasks]
+        if memo is not None:
+            estimators = [memo.estimators.get(key) if estimator is None
+                          else estimator
+                          for key, estimator in zip(keys, estimators)]
+        pending = [index for index, estimator in enumerate(estimators)
+                   if estimator is None]
+        views = dict((tasks[index][3], X.get_v(tasks[index][3],
+                                               train_indices))
+                     for index in pending)
+        fitted = Parallel(n_jobs=nb_cores, max_nbytes="1M")(
+            delayed(fit_estimator)(tasks[index][0], views[tasks[index][3]],
+                                   y[train_indices])
+            for index in pending)
+        for index, estimator in zip(pending, fitted):
+            estimators[index] = estimator
+            if memo is not None:
+                memo.estimators[keys[index]] = estimator
+        return estimators
+
+    def predict_monoview_estimators(self, tasks, X, sample_indices,
+                                    method="predict"):
+        """
+        Calls `method` of each fitted estimator of the (estimator, view index)
+        `tasks` on its view and returns the list of the outputs, in parallel
+        as in `fit_monoview_estimators_parallel`.
+        """
+        nb_cores = getattr(self, "nb_cores", 1)
+        if nb_cores <= 1 or len(tasks) <= 1:
+            return [self.predict_monoview_estimator(estimator, X, view_index,
+                                                    sample_indices,
+                                                    method=method)
+                    for estimator, view_index in tasks]
+        if all(releases_gil(estimator) for estimator, _ in tasks):
+            return Parallel(n_jobs=nb_cores, prefer="threads")(
+                delayed(self.predict_monoview_estimator)(
+                    estimator, X, view_index, sample_indices, method=method)
+                for estimator, view_index in tasks)
+        memo = MonoviewMemo.active
+        keys = [self.get_prediction_key(estimator, method, view_index,
+                                        sample_indices)
+                for estimator, view_index in tasks]
+        registry = ModelRegistry.active
+        predictions = [None if registry is None
+                       else registry.get_predictions(estimator, method,
+                                                     sample_indices)
+                       for estimator, _ in tasks]
+        if memo is not None:
+            predictions = [memo.predictions.get(key) if prediction is None
+                           else prediction
+                           for key, prediction in zip(keys, predictions)]
+        pending = [index for index, prediction in enumerate(predictions)
+                   if prediction is None]
+        views = dict((tasks[index][1], X.get_v(tasks[index][1],
+                                               sample_indices))
+                     for index in pending)
+        predicted = Parallel(n_jobs=nb_cores, max_nbytes="1M")(
+            delayed(predict_estimator)(tasks[index][0],
+                                       views[tasks[index][1]], method)
+            for index in pending)
+        for index, prediction in zip(pending, predicted):
+            predictions[index] = prediction
+            if memo is not None:
+                memo.predictions[keys[index]] = prediction
+        return predictions
+
     def init_monoview_estimator(self, classifier_name, classifier_config,
                                 classifier_index=None, multiclass=False):
         if classifier_index is not None:
@@ -1,15 +1,30 @@
 import numpy as np
+from sklearn.model_selection import StratifiedKFold
 
+from .fusion_utils import MonoviewMemo
 from .late_fusion_utils import LateFusionClassifier
-from ...utils.hyper_parameter_search import CustomRandint
+from ...utils.hps_study import get_fingerprint
+from ...utils.hyper_parameter_search import CustomRandint, get_params_key
 from ...utils.dataset import get_samples_views_indices
 
 
 class BaseJumboFusion(LateFusionClassifier):
+    """
+    Base class of the fusions that learn an aggregation estimator on the
+    decisions of monoview classifiers.
+
+    If `stacking` is True, the aggregation estimator is trained on the
+    out-of-fold decisions of the monoview classifiers, computed on
+    `nb_stacking_folds` stratified folds of the training samples, instead of
+    their decisions on the samples they were trained on. During a
+    hyper-parameter search, this decision matrix is computed once for all the
+    candidates sharing the same monoview classifiers.
+    """
 
     def __init__(self, random_state, classifiers_names=None,
                  classifier_configs=None,
-                 nb_cores=1, weights=None, nb_monoview_per_view=1, rs=None):
+                 nb_cores=1, weights=None, nb_monoview_per_view=1,
+                 stacking=False, nb_stacking_folds=3, rs=None):
         LateFusionClassifier.__init__(self, random_state,
                                       classifiers_names=classifiers_names,
                                       classifier_configs=classifier_configs,
@@ -18,6 +33,8 @@ class BaseJumboFusion(LateFusionClassifier):
         self.param_names += ["nb_monoview_per_view", ]
         self.distribs += [CustomRandint(1, 10)]
         self.nb_monoview_per_view = nb_monoview_per_view
+        self.stacking = stacking
+        self.nb_stacking_folds = nb_stacking_folds
 
     def set_params(self, nb_monoview_per_view=1, **params):
         self.nb_monoview_per_view = nb_monoview_per_view
@@ -42,42 +59,77 @@ class BaseJumboFusion(LateFusionClassifier):
                               nb_monoview_per_view=self.nb_monoview_per_view)
         self.fit_monoview_estimators(X, y, train_indices=train_indices,
                                      view_indices=view_indices)
-        monoview_decisions = self.predict_monoview(X,
-                                                   sample_indices=train_indices,
-                                                   view_indices=view_indices)
+        if self.stacking:
+            monoview_decisions = self.get_stacking_decisions(X, y,
+                                                             train_indices,
+                                                             view_indices)
+        else:
+            monoview_decisions = self.predict_monoview(
+                X, sample_indices=train_indices, view_indices=view_indices)
         self.aggregation_estimator.fit(monoview_decisions, y[train_indices])
         return self
 
     def fit_monoview_estimators(self, X, y, train_indices=None,
                                 view_indices=None):
+        self.monoview_estimators = self.fit_view_estimators(
+            X, y, train_indices, view_indices)
+        return self
+
+    def fit_view_estimators(self, X, y, train_indices, view_indices):
+        """Returns, for each view, the list of the monoview estimators fitted
+        on `train_indices`"""
         if np.unique(y).shape[0] > 2:
             multiclass = True
         else:
             multiclass = False
-        self.monoview_estimators = [
-            [self.init_monoview_estimator(classifier_name,
-                                          self.classifier_configs[
-                                              classifier_index],
-                                          multiclass=multiclass)
-             for classifier_index, classifier_name
-             in enumerate(self.classifiers_names)]
-            for _ in view_indices]
-
-        self.monoview_estimators = [[estimator.fit(
-            X.get_v(view_indices[idx], train_indices), y[train_indices])
-            for estimator in view_estimators]
-            for idx, view_estimators in
-            enumerate(self.monoview_estimators)]
-        return self
+        nb_classifiers = len(self.classifiers_names)
+        fitted = self.fit_monoview_estimators_parallel(
+            [(self.init_monoview_estimator(classifier_name, classifier_config,
+                                           multiclass=multiclass),
+              classifier_name, classifier_config, view_index)
+             for view_index in view_indices
+             for classifier_name, classifier_config
+             in zip(self.classifiers_names, self.classifier_configs)],
+            X, y, train_indices)
+        return [fitted[idx * nb_classifiers:(idx + 1) * nb_classifiers]
+                for idx in range(len(view_indices))]
 
-    def predict_monoview(self, X, sample_indices=None, view_indices=None):
-        monoview_decisions = np.zeros((len(sample_indices),
+    def get_stacking_decisions(self, X, y, train_indices, view_indices):
+        """Returns the out-of-fold decisions of the monoview classifiers on
+        the training samples, with the same columns as `predict_monoview`"""
+        train_indices = np.asarray(train_indices)
+        memo = MonoviewMemo.active
+        key = (tuple(self.classifiers_names),
+               get_params_key(self.classifier_configs), tuple(view_indices),
+               train_indices.tobytes(), get_fingerprint([y[train_indices]]),
+               self.nb_stacking_folds)
+        if memo is not None and key in memo.decisions:
+            return memo.decisions[key]
+        monoview_decisions = np.zeros((len(train_indices),
                                        len(view_indices) * len(
                                            self.classifiers_names)))
-        for idx, view_estimators in enumerate(self.monoview_estimators):
-            for estimator_index, estimator in enumerate(view_estimators):
-                monoview_decisions[:, len(
-                    self.classifiers_names) * idx + estimator_index] = estimator.predict(
-                    X.get_v(view_indices[idx],
-                            sample_indices))
+        folds = StratifiedKFold(n_splits=self.nb_stacking_folds)
+        for fold_train, fold_test in folds.split(train_indices,
+                                                 y[train_indices]):
+            fold_estimators = self.fit_view_estimators(
+                X, y, train_indices[fold_train], view_indices)
+            monoview_decisions[fold_test] = self.predict_monoview(
+                X, sample_indices=train_indices[fold_test],
+                view_indices=view_indices, estimators=fold_estimators)
+        if memo is not None:
+            memo.decisions[key] = monoview_decisions
         return monoview_decisions
+
+    def predict_monoview(self, X, sample_indices=None, view_indices=None,
+                         estimators=None):
+        if estimators is None:
+            estimators = self.monoview_estimators
+        predictions = self.predict_monoview_estimators(
+            [(estimator, view_index)
+             for view_index, view_estimators
+             in zip(view_indices, estimators)
+             for estimator in view_estimators],
+            X, sample_indices)
+        # Column len(classifiers_names) * view + classifier for each estimator
+        return np.array(predictions, dtype=float).reshape(
+            len(predictions), len(sample_indices)).T
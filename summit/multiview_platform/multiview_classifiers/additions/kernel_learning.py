@@ -1,16 +1,118 @@
+import threading
+from collections import OrderedDict
+
 from sklearn.metrics import pairwise
 import numpy as np
 
 from ...multiview.multiview_utils import BaseMultiviewClassifier
-from ...utils.hyper_parameter_search import CustomUniform, CustomRandint
+from ...utils.hps_study import get_fingerprint
+from ...utils.hyper_parameter_search import CustomUniform, CustomRandint, \
+    get_params_key
 from ...utils.transformations import sign_labels, unsign_labels
 from ...utils.dataset import get_samples_views_indices
 
+class KernelCache:
+    """
+    Cache of the view kernels, shared by all the candidates of a
+    hyper-parameter search run, so that the candidates using the same kernel
+    on a view do not recompute it for each fold.
+
+    The kernels are keyed by (kernel, kernel params, fingerprint of the
+    samples, fingerprint of the second samples). When they use more than
+    `max_nbytes`, the least recently used ones are evicted. The cache is
+    active while used as a context manager, and cleared when it exits.
+    It can be shared by the threads fitting the binary problems of a
+    multiclass wrapper.
+    """
+    active = None
+    max_nbytes = 2 ** 30
+
+    def __init__(self, max_nbytes=None):
+        if max_nbytes is not None:
+            self.max_nbytes = max_nbytes
+        self.kernels = OrderedDict()
+        self.nbytes = 0
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        KernelCache.active = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        KernelCache.active = None
+        self.kernels = OrderedDict()
+        self.nbytes = 0
+
+    def get_kernel(self, key, compute):
+        """Returns the cached kernel of `key`, or the one returned by
+        `compute`, which is cached."""
+        with self.lock:
+            if key in self.kernels:
+                self.kernels.move_to_end(key)
+                return self.kernels[key]
+        kernel = compute()
+        with self.lock:
+            if key in self.kernels:
+                # Computed by another thread in the meantime
+                return self.kernels[key]
+            self.kernels[key] = kernel
+            self.nbytes += kernel.nbytes
+            # The last kernel is kept, even if it is bigger than the limit
+            while self.nbytes > self.max_nbytes and len(self.kernels) > 1:
+                _, evicted = self.kernels.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+        return kernel
+
+
 class KernelClassifier(BaseMultiviewClassifier):
+    """
+    Base class of the kernel based multiview classifiers.
+
+    If `landmark_kernels` is True and `nystrom_param` is lower than 1, only
+    the columns of the kernels on the Nyström landmarks, the first
+    `nystrom_param` fraction of the training samples, are computed, so that
+    the memory used by the kernels is linear in the number of samples.
+    """
+
+    landmark_kernels = False
 
     def __init__(self, random_state=None,):
         super().__init__(random_state)
 
+    def get_hps_context(self):
+        """Context shared by all the fits of a hyper-parameter search run"""
+        return KernelCache()
+
+    def get_kernel_config(self, view_index):
+        """Returns the kernel name and params used on the view"""
+        if self.kernel_params is not None:
+            if isinstance(self.kernel_params, list):
+                params = self.kernel_params[view_index]
+            else:
+                params = self.kernel_params
+        else:
+            params = {}
+        if isinstance(self.kernel, list):
+            kernel = self.kernel[min(view_index, len(self.kernel) - 1)]
+        else:
+            kernel = self.kernel
+        return kernel, params
+
+    def _get_kernel(self, X, Y=None, v=0):
+        kernel, params = self.get_kernel_config(v)
+        if self.landmark_kernels and self.nystrom_param < 1:
+            if Y is None:
+                Y = X
+            Y = Y[:int(np.floor(self.nystrom_param * Y.shape[0]))]
+        cache = KernelCache.active
+        if cache is None:
+            return pairwise.pairwise_kernels(X, Y, metric=kernel,
+                                             filter_params=True, **params)
+        key = (kernel, get_params_key(params), get_fingerprint([X]),
+               None if Y is None else get_fingerprint([Y]))
+        return cache.get_kernel(key, lambda: pairwise.pairwise_kernels(
+            X, Y, metric=kernel, filter_params=True, **params))
+
     # def _compute_kernels(self, X, sample_indices, view_indices, ):
     #     new_X = {}
     #     for index, (kernel_function, kernel_config, view_index) in enumerate(
@@ -2,7 +2,7 @@ import numpy as np
 
 from .fusion_utils import BaseFusionClassifier
 from ...multiview.multiview_utils import BaseMultiviewClassifier, \
-    get_available_monoview_classifiers, ConfigGenerator
+    get_available_monoview_classifiers, ConfigGenerator, SharedDistribution
 from ...utils.dataset import get_samples_views_indices
 
 
@@ -19,7 +19,7 @@ class ClassifierDistribution:
                                         size=nb_view, replace=True)
 
 
-class ClassifierCombinator:
+class ClassifierCombinator(SharedDistribution):
 
     def __init__(self, need_probas=False):
         self.available_classifiers = get_available_monoview_classifiers(
@@ -34,7 +34,8 @@ class ConfigDistribution:
 
     def __init__(self, seed=42, available_classifiers=None):
         self.random_state = np.random.RandomState(seed)
-        self.config_generator = ConfigGenerator(available_classifiers)
+        self.config_generator = ConfigGenerator.get(
+            tuple(available_classifiers))
 
     def draw(self, nb_view, rs=None):
         if rs is not None:
@@ -44,7 +45,7 @@ class ConfigDistribution:
         return config_samples
 
 
-class MultipleConfigGenerator:
+class MultipleConfigGenerator(SharedDistribution):
 
     def __init__(self, ):
         self.available_classifiers = get_available_monoview_classifiers()
@@ -55,17 +56,23 @@ class MultipleConfigGenerator:
 
 
 class WeightDistribution:
+    """
+    The weights of one hyper-parameter candidate. They are drawn from the
+    stored seed at each call of `draw`, so all the fits of the candidate
+    (one per fold, and the refit) use the same weights.
+    """
 
     def __init__(self, seed=42, distribution_type="uniform"):
-        self.random_state = np.random.RandomState(seed)
+        self.seed = seed
         self.distribution_type = distribution_type
 
     def draw(self, nb_view):
+        random_state = np.random.RandomState(self.seed)
         if self.distribution_type == "uniform":
-            return self.random_state.random_sample(nb_view)
+            return random_state.random_sample(nb_view)
 
 
-class WeightsGenerator:
+class WeightsGenerator(SharedDistribution):
 
     def __init__(self, distibution_type="uniform"):
         self.distribution_type = distibution_type
@@ -84,13 +91,14 @@ class LateFusionClassifier(BaseMultiviewClassifier, BaseFusionClassifier):
         self.classifiers_names = classifiers_names
         self.classifier_configs = classifier_configs
         self.nb_cores = nb_cores
+        self.native_multiclass = False
         self.weights = weights
         self.rs = rs
         self.param_names = ["classifiers_names", "classifier_configs",
                             "weights", "rs"]
-        self.distribs = [ClassifierCombinator(need_probas=self.need_probas),
-                         MultipleConfigGenerator(),
-                         WeightsGenerator(),
+        self.distribs = [ClassifierCombinator.get(self.need_probas),
+                         MultipleConfigGenerator.get(),
+                         WeightsGenerator.get(),
                          np.arange(1000)]
 
     def fit(self, X, y, train_indices=None, view_indices=None):
@@ -105,12 +113,10 @@ class LateFusionClassifier(BaseMultiviewClassifier, BaseFusionClassifier):
         self.init_params(len(view_indices), multiclass)
         if np.unique(y[train_indices]).shape[0] > 2:
             raise ValueError("Multiclass not supported")
-        self.monoview_estimators = [
-            monoview_estimator.fit(X.get_v(view_index, train_indices),
-                                   y[train_indices])
-            for view_index, monoview_estimator
-            in zip(view_indices,
-                   self.monoview_estimators)]
+        self.monoview_estimators = self.fit_monoview_estimators_parallel(
+            list(zip(self.monoview_estimators, self.classifiers_names,
+                     self.classifier_configs, view_indices)),
+            X, y, train_indices)
         return self
 
     def init_params(self, nb_view, mutliclass=False):
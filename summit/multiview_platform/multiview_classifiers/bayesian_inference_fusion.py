@@ -1,5 +1,7 @@
 import numpy as np
 
+from ..multiview_classifiers.additions.aggregation_utils import \
+    product_of_experts
 from ..multiview_classifiers.additions.late_fusion_utils import \
     LateFusionClassifier
 from ..utils.dataset import get_samples_views_indices
@@ -32,13 +34,10 @@ class BayesianInferenceClassifier(LateFusionClassifier):
         if sum(self.weights) != 1.0:
             self.weights = self.weights / sum(self.weights)
 
-        view_scores = []
-        for index, view_index in enumerate(view_indices):
-            view_scores.append(np.power(
-                self.monoview_estimators[index].predict_proba(
-                    X.get_v(view_index,
-                            sample_indices)),
-                self.weights[index]))
-        view_scores = np.array(view_scores)
-        predicted_labels = np.argmax(np.prod(view_scores, axis=0), axis=1)
+        view_scores = self.predict_monoview_estimators(
+            list(zip(self.monoview_estimators, view_indices)), X,
+            sample_indices, method="predict_proba")
+        predicted_labels = np.argmax(product_of_experts(view_scores,
+                                                        self.weights),
+                                     axis=1)
         return predicted_labels
@@ -31,3 +31,9 @@ class DifficultyFusion(GlobalDiversityFusionClassifier):
                 for view_index in range(len(combination) + 1)])
         )
         return difficulty_score
+
+    def block_diversity_measure(self, nb_correct, nb_view):
+        # Number of samples for which each number of views succeeded :
+        counts = np.stack([np.sum(nb_correct == view_index, axis=1)
+                           for view_index in range(nb_view + 1)], axis=1)
+        return np.var(counts, axis=1)
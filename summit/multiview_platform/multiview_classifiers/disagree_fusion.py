@@ -13,7 +13,12 @@ class DisagreeFusion(CoupleDiversityFusionClassifier):
     It find the subset of monoview classifiers with the best disagreement
     """
 
+    pairwise_operator = np.bitwise_xor
+
     def diversity_measure(self, first_classifier_decision,
                           second_classifier_decision, _):
         return np.logical_xor(first_classifier_decision,
                               second_classifier_decision)
+
+    def pairwise_bits(self, classifiers_decisions, y):
+        return classifiers_decisions.astype(bool)
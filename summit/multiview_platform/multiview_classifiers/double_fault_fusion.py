@@ -15,7 +15,12 @@ class DoubleFaultFusion(CoupleDiversityFusionClassifier):
     It find the subset of monoview classifiers with the best double fault
     """
 
+    pairwise_operator = np.bitwise_and
+
     def diversity_measure(self, first_classifier_decision,
                           second_classifier_decision, y):
         return np.logical_and(np.logical_xor(first_classifier_decision, y),
                               np.logical_xor(second_classifier_decision, y))
+
+    def pairwise_bits(self, classifiers_decisions, y):
+        return np.logical_xor(classifiers_decisions, y)
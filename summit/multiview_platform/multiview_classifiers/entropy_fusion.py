@@ -29,3 +29,8 @@ class EntropyFusion(GlobalDiversityFusionClassifier):
             np.minimum(entropy_scores, nb_view_matrix).astype(float) / (
                 nb_view - int(nb_view / 2)))
         return entropy_score
+
+    def block_diversity_measure(self, nb_correct, nb_view):
+        entropy_scores = np.minimum(nb_correct, nb_view - nb_correct)
+        return np.mean(entropy_scores.astype(float) / (
+            nb_view - int(nb_view / 2)), axis=1)
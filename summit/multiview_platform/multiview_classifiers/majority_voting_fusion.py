@@ -1,5 +1,7 @@
 import numpy as np
 
+from ..multiview_classifiers.additions.aggregation_utils import \
+    weighted_votes, nb_maxima
 from ..multiview_classifiers.additions.late_fusion_utils import \
     LateFusionClassifier
 from ..utils.dataset import get_samples_views_indices
@@ -32,25 +34,16 @@ class MajorityVoting(LateFusionClassifier):
                                                                   sample_indices,
                                                                   view_indices)
         self._check_views(view_indices)
-        n_samples = len(samples_indices)
-        votes = np.zeros((n_samples, X.get_nb_class(sample_indices)),
-                         dtype=float)
-        monoview_decisions = np.zeros((len(samples_indices), X.nb_view),
-                                      dtype=int)
-        for index, view_index in enumerate(view_indices):
-            monoview_decisions[:, index] = self.monoview_estimators[
-                index].predict(
-                X.get_v(view_index, samples_indices))
-        for sample_index in range(n_samples):
-            for view_index, feature_classification in enumerate(
-                    monoview_decisions[sample_index, :]):
-                votes[sample_index, feature_classification] += self.weights[
-                    view_index]
-            nb_maximum = len(
-                np.where(votes[sample_index] == max(votes[sample_index]))[0])
-            if nb_maximum == X.nb_view:
-                raise VotingIndecision(
-                    "Majority voting can't decide, each classifier has voted for a different class")
+        monoview_decisions = np.array(self.predict_monoview_estimators(
+            list(zip(self.monoview_estimators, view_indices)), X,
+            samples_indices), dtype=int)
+        # The classes of the whole dataset, as a subset of the samples may
+        # miss some of them.
+        votes = weighted_votes(monoview_decisions, self.weights,
+                               X.get_nb_class())
+        if np.any(nb_maxima(votes) == X.nb_view):
+            raise VotingIndecision(
+                "Majority voting can't decide, each classifier has voted for a different class")
 
         predicted_labels = np.argmax(votes, axis=1)
         # Can be upgraded by restarting a new classification process if
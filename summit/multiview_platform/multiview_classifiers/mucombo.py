@@ -43,6 +43,15 @@ class MuCombo(BaseMultiviewClassifier, MuComboClassifier):
                                                 view_indices=view_indices)
         return MuComboClassifier.predict(self, numpy_X)
 
+    def staged_predict(self, X, sample_indices=None, view_indices=None):
+        sample_indices, view_indices = get_samples_views_indices(X,
+                                                                 sample_indices,
+                                                                 view_indices)
+        self._check_views(view_indices)
+        numpy_X, view_limits = X.to_numpy_array(sample_indices=sample_indices,
+                                                view_indices=view_indices)
+        return MuComboClassifier.staged_predict(self, numpy_X)
+
     def get_interpretation(self, directory, base_file_name, labels,
                            multiclass=False):
         return ""
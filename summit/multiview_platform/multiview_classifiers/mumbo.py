@@ -69,6 +69,15 @@ class Mumbo(BaseMultiviewClassifier, MumboClassifier):
                                                 view_indices=view_indices)
         return MumboClassifier.predict(self, numpy_X)
 
+    def staged_predict(self, X, sample_indices=None, view_indices=None):
+        sample_indices, view_indices = get_samples_views_indices(X,
+                                                                 sample_indices,
+                                                                 view_indices)
+        self._check_views(view_indices)
+        numpy_X, view_limits = X.to_numpy_array(sample_indices=sample_indices,
+                                                view_indices=view_indices)
+        return MumboClassifier.staged_predict(self, numpy_X)
+
     def get_interpretation(self, directory, base_file_name, labels, multiclass=False):
         self.view_importances = np.zeros(len(self.used_views))
         self.feature_importances_ = [np.zeros(view_shape)
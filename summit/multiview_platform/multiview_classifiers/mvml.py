@@ -10,6 +10,8 @@ classifier_class_name = "MVMLClassifier"
 
 class MVMLClassifier(KernelClassifier, MVML):
 
+    landmark_kernels = True
+
     def __init__(self, random_state=None, lmbda=0.1, eta=0.1, nystrom_param=1,
                  n_loops=50,
                  precision=0.0001, learn_A=0, kernel="rbf", learn_w=0,
@@ -16,13 +16,15 @@ class SVMJumboFusion(BaseJumboFusion):
     def __init__(self, random_state=None, classifiers_names=None,
                  classifier_configs=None, nb_cores=1, weights=None,
                  nb_monoview_per_view=1, C=1.0, kernel="rbf", degree=2,
-                 rs=None):
+                 stacking=False, nb_stacking_folds=3, rs=None):
         self.need_probas = False
         BaseJumboFusion.__init__(self, random_state,
                                  classifiers_names=classifiers_names,
                                  classifier_configs=classifier_configs,
                                  nb_cores=nb_cores, weights=weights,
                                  nb_monoview_per_view=nb_monoview_per_view,
+                                 stacking=stacking,
+                                 nb_stacking_folds=nb_stacking_folds,
                                  rs=rs)
         self.param_names += ["C", "kernel", "degree"]
         self.distribs += [CustomUniform(), ["rbf", "poly", "linear"],
@@ -1,6 +1,9 @@
 import numpy as np
+from scipy.sparse import issparse
 
-from .additions.fusion_utils import BaseFusionClassifier
+from .additions.fusion_utils import BaseFusionClassifier, MonoviewMemo
+from .additions.late_fusion_utils import WeightsGenerator, \
+    WeightDistribution
 from ..multiview.multiview_utils import get_available_monoview_classifiers, \
     BaseMultiviewClassifier, ConfigGenerator
 from ..utils.dataset import get_samples_views_indices
@@ -11,10 +14,27 @@ from ..utils.multiclass import get_mc_estim, MultiClassWrapper
 classifier_class_name = "WeightedLinearEarlyFusion"
 
 
+class ViewWeightsGenerator(WeightsGenerator):
+
+    def rvs(self, random_state=None):
+        return WeightDistribution(
+            seed=random_state.randint(np.iinfo(np.int32).max),
+            distribution_type=self.distribution_type)
+
+
 class WeightedLinearEarlyFusion(BaseMultiviewClassifier, BaseFusionClassifier):
     """
     Builds a monoview dataset by concatenating the views (with a weight if
     needed) and learns a monoview classifier on the concatenation
+
+    Each view is multiplied by its weight divided by the mean weight, so
+    uniform weights leave the views unchanged. The weighted views
+    are written in a single buffer, reused by the successive predictions.
+    The fits do not write in it, as the fitted monoview classifier may keep a
+    reference to its training data (as the nearest neighbors do).
+    During a hyper-parameter search, the unweighted concatenation of each set
+    of samples is kept in the monoview memo, so the candidates only rescale
+    its column blocks.
     """
 
     def __init__(self, random_state=None, view_weights=None,
@@ -31,9 +51,11 @@ class WeightedLinearEarlyFusion(BaseMultiviewClassifier, BaseFusionClassifier):
         self.monoview_classifier = self.init_monoview_estimator(
             monoview_classifier_name, monoview_classifier_config)
         self.param_names = ["monoview_classifier_name",
-                            "monoview_classifier_config"]
+                            "monoview_classifier_config", "view_weights"]
         self.distribs = [get_available_monoview_classifiers(),
-                         ConfigGenerator(get_available_monoview_classifiers())]
+                         ConfigGenerator.get(
+                             tuple(get_available_monoview_classifiers())),
+                         ViewWeightsGenerator.get()]
         self.classed_params = []
         self.weird_strings = {}
 
@@ -45,8 +67,16 @@ class WeightedLinearEarlyFusion(BaseMultiviewClassifier, BaseFusionClassifier):
             monoview_classifier_config)
         self.monoview_classifier_config = self.monoview_classifier.get_params()
         self.short_name = "early_fusion"
+        if "view_weights" in params:
+            self.view_weights = params["view_weights"]
         return self
 
+    def __getstate__(self):
+        # The state is copied, as it can be the object's own __dict__.
+        state = dict(super().__getstate__())
+        state.pop("predict_buffer_", None)
+        return state
+
     def get_params(self, deep=True):
         return {"random_state": self.random_state,
                 "view_weights": self.view_weights,
@@ -68,13 +98,14 @@ class WeightedLinearEarlyFusion(BaseMultiviewClassifier, BaseFusionClassifier):
         return self
 
     def predict(self, X, sample_indices=None, view_indices=None):
-        _, X = self.transform_data_to_monoview(X, sample_indices, view_indices)
+        _, X = self.transform_data_to_monoview(X, sample_indices, view_indices,
+                                               reuse_buffer=True)
         self._check_views(self.view_indices)
         predicted_labels = self.monoview_classifier.predict(X)
         return predicted_labels
 
     def transform_data_to_monoview(self, dataset, sample_indices,
-                                   view_indices):
+                                   view_indices, reuse_buffer=False):
         """Here, we extract the data from the HDF5 dataset file and store all
         the concatenated views in one variable"""
         sample_indices, self.view_indices = get_samples_views_indices(dataset,
@@ -82,21 +113,63 @@ class WeightedLinearEarlyFusion(BaseMultiviewClassifier, BaseFusionClassifier):
                                                                       view_indices)
         if self.view_weights is None:
             self.view_weights = np.ones(len(self.view_indices), dtype=float)
+        elif isinstance(self.view_weights, WeightDistribution):
+            self.view_weights = self.view_weights.draw(len(self.view_indices))
         else:
-            self.view_weights = np.array(self.view_weights)
+            self.view_weights = np.array(self.view_weights, dtype=float)
         self.view_weights /= float(np.sum(self.view_weights))
 
-        X = self.hdf5_to_monoview(dataset, sample_indices)
+        X = self.hdf5_to_monoview(dataset, sample_indices,
+                                  reuse_buffer=reuse_buffer)
         return sample_indices, X
 
-    def hdf5_to_monoview(self, dataset, samples):
-        """Here, we concatenate the views for the asked samples """
-        monoview_data = np.concatenate(
-            [dataset.get_v(view_idx, samples)
-             for view_weight, (index, view_idx)
-             in zip(self.view_weights, enumerate(self.view_indices))], axis=1)
+    def hdf5_to_monoview(self, dataset, samples, reuse_buffer=False):
+        """Here, we concatenate the weighted views for the asked samples """
+        # As in the original zip, only the views that have a weight are used
+        used_views = self.view_indices[:len(self.view_weights)]
+        weights = self.view_weights[:len(used_views)]
+        memo = MonoviewMemo.active
+        if memo is None:
+            views = [dataset.get_v(view_idx, samples)
+                     for view_idx in used_views]
+        else:
+            key = (np.asarray(used_views).tobytes(),
+                   np.asarray(samples).tobytes())
+            if key not in memo.concatenations:
+                views = [dataset.get_v(view_idx, samples)
+                         for view_idx in used_views]
+                bounds = np.cumsum([0] + [view.shape[1] for view in views])
+                memo.concatenations[key] = (
+                    self.concatenate_views(views, np.ones(len(views))),
+                    bounds)
+            concatenation, bounds = memo.concatenations[key]
+            # The views are the column blocks of the unweighted concatenation
+            views = [concatenation[:, start:stop]
+                     for start, stop in zip(bounds[:-1], bounds[1:])]
+        scales = weights * len(weights) / np.sum(weights)
+        buffer = None
+        if reuse_buffer:
+            buffer = getattr(self, "predict_buffer_", None)
+        monoview_data = self.concatenate_views(views, scales, buffer)
+        if reuse_buffer:
+            self.predict_buffer_ = monoview_data
         return monoview_data
 
+    def concatenate_views(self, views, scales, buffer=None):
+        """Writes each view multiplied by its scale in its column block of
+        `buffer`, allocated if it does not have the right shape"""
+        shape = (views[0].shape[0], sum(view.shape[1] for view in views))
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=float)
+        start = 0
+        for view, scale in zip(views, scales):
+            stop = start + view.shape[1]
+            if issparse(view):
+                view = view.toarray()
+            np.multiply(view, scale, out=buffer[:, start:stop])
+            start = stop
+        return buffer
+
     # def set_monoview_classifier_config(self, monoview_classifier_name, monoview_classifier_config):
     #     if monoview_classifier_name in monoview_classifier_config:
     #         self.monoview_classifier.set_params(**monoview_classifier_config[monoview_classifier_name])
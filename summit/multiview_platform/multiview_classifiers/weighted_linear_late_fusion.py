@@ -1,5 +1,7 @@
 import numpy as np
 
+from ..multiview_classifiers.additions.aggregation_utils import \
+    weighted_sum
 from ..multiview_classifiers.additions.late_fusion_utils import \
     LateFusionClassifier
 from ..utils.dataset import get_samples_views_indices
@@ -25,11 +27,9 @@ class WeightedLinearLateFusion(LateFusionClassifier):
                                                                  sample_indices,
                                                                  view_indices)
         self._check_views(view_indices)
-        view_scores = []
-        for index, viewIndex in enumerate(view_indices):
-            view_scores.append(
-                np.array(self.monoview_estimators[index].predict_proba(
-                    X.get_v(viewIndex, sample_indices))) * self.weights[index])
-        view_scores = np.array(view_scores)
-        predicted_labels = np.argmax(np.sum(view_scores, axis=0), axis=1)
+        view_scores = self.predict_monoview_estimators(
+            list(zip(self.monoview_estimators, view_indices)), X,
+            sample_indices, method="predict_proba")
+        predicted_labels = np.argmax(weighted_sum(view_scores, self.weights),
+                                     axis=1)
         return predicted_labels
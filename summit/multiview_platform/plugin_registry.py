@@ -0,0 +1,78 @@
+import importlib
+import pkgutil
+
+# Author-Info
+__author__ = "Baptiste Bauvin"
+__status__ = "Prototype"  # Production, Development, Prototype
+
+
+class PluginRegistry:
+    """
+    Registry of the modules of a plugin package (the monoview classifiers,
+    the multiview classifiers or the metrics), importing a module only when
+    it is first used.
+
+    The capability flags of the modules are declared in the `manifest` of the
+    package, that maps a module name to its flags (its
+    `classifier_class_name`, whether it `need_probas`, whether it is
+    `multiclass`, ...), so that they can be read without importing anything.
+    A module added to the package directory without being declared in the
+    manifest is still available, and its flags are given by `probe`, called
+    with the imported module.
+
+    Parameters
+    ----------
+    package_name : str
+        The `__name__` of the package.
+    package_path : list
+        The `__path__` of the package.
+    manifest : dict
+        Maps the module names to their dict of flags.
+    probe : callable
+        Returns the dict of flags of an imported module that is not in the
+        manifest.
+    """
+
+    def __init__(self, package_name, package_path, manifest, probe=None):
+        self.package_name = package_name
+        self.package_path = package_path
+        self.manifest = manifest
+        self.probe = probe
+        self.probed = {}
+        self.modules = None
+
+    def get_modules(self):
+        """Maps the name of each module and sub-package of the package
+        directory to whether it is a package, listed once."""
+        if self.modules is None:
+            self.modules = dict((name, is_package) for _, name, is_package
+                                in pkgutil.iter_modules(self.package_path))
+        return self.modules
+
+    def names(self):
+        """The sorted names of the plugin modules, the sub-packages excluded"""
+        return sorted(name for name, is_package in self.get_modules().items()
+                      if not is_package)
+
+    def load(self, name):
+        """Imports the module (or sub-package) of the package"""
+        if name not in self.get_modules():
+            raise AttributeError("module '{}' has no attribute '{}'".format(
+                self.package_name, name))
+        return importlib.import_module("." + name, self.package_name)
+
+    def get_flags(self, name):
+        """The flags of a module, from the manifest or by probing it"""
+        if name in self.manifest:
+            return self.manifest[name]
+        if name not in self.probed:
+            module = self.load(name)
+            self.probed[name] = self.probe(module) if self.probe else {}
+        return self.probed[name]
+
+    def get_flag(self, name, flag, default=None):
+        return self.get_flags(name).get(flag, default)
+
+    def dir(self, namespace):
+        """The attributes of the package, with its not yet imported modules"""
+        return sorted(set(namespace) | set(self.get_modules()))
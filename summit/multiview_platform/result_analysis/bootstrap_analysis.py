@@ -0,0 +1,137 @@
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+import plotly
+
+from .. import metrics
+from ..utils.metric_engine import get_confusion_matrix, get_confusion_metric
+
+
+def get_bootstrap_intervals(metrics_dict, results, labels, test_indices,
+                            nb_bootstrap=1000, confidence=0.95,
+                            random_state=None):
+    r"""Used to get bootstrap confidence intervals of the test scores of each
+    classifier, from its stored predictions, without fitting anything.
+
+    The test samples are resampled with replacement `nb_bootstrap` times. For
+    a metric derived from the confusion matrix, the resampled confusion
+    matrices are drawn at once: the number of resampled samples in each cell
+    of the test confusion matrix follows a multinomial law with the cells'
+    frequencies, so all the resamples are scored in a batch. The other
+    metrics are computed by their module on each resample.
+
+    Parameters
+    ----------
+    metrics_dict : dict
+        The metrics names with their configuration.
+    results : list of MonoviewResult and MultiviewResults objects
+        A list containing all the results for all the experimentations.
+    labels : np.array
+        The real labels of all the samples.
+    test_indices : np.array
+        The indices of the test samples.
+    nb_bootstrap : int
+        The number of resamples.
+    confidence : float
+        The confidence level of the percentile intervals.
+    random_state : np.random.RandomState
+        The random state used to draw the resamples.
+
+    Returns
+    -------
+    bootstrap_intervals : dict of pd.DataFrame
+        For each metric, the lower and upper bounds (rows) of the interval of
+        each classifier (columns).
+    """
+    if random_state is None:
+        random_state = np.random.RandomState(42)
+    test_labels = labels[test_indices]
+    nb_test = len(test_indices)
+    resampled_indices = None
+    quantiles = 100 * np.array([(1 - confidence) / 2, (1 + confidence) / 2])
+    bootstrap_intervals = dict((metric, pd.DataFrame(
+        index=["lower", "upper"], dtype=float)) for metric in metrics_dict)
+    for classifier_result in results:
+        test_pred = classifier_result.full_labels_pred[test_indices]
+        confusion_labels = np.union1d(test_labels, test_pred)
+        confusion = get_confusion_matrix(test_labels, test_pred,
+                                         confusion_labels)
+        resampled_confusions = random_state.multinomial(
+            nb_test, confusion.ravel() / nb_test,
+            size=nb_bootstrap).reshape((nb_bootstrap,) + confusion.shape)
+        for metric, metric_kwargs in metrics_dict.items():
+            metric_name = metric[:-1] if metric.endswith("*") else metric
+            confusion_metric = get_confusion_metric(metric_name,
+                                                    metric_kwargs,
+                                                    confusion_labels)
+            if confusion_metric is not None:
+                scores = confusion_metric(resampled_confusions)
+            else:
+                if resampled_indices is None:
+                    resampled_indices = random_state.randint(
+                        nb_test, size=(nb_bootstrap, nb_test))
+                metric_module = getattr(metrics, metric_name)
+                scores = np.array([
+                    get_resample_score(metric_module, metric_kwargs,
+                                       test_labels[indices],
+                                       test_pred[indices])
+                    for indices in resampled_indices])
+            bootstrap_intervals[metric][
+                classifier_result.get_classifier_name()] = np.nanpercentile(
+                scores, quantiles)
+    return bootstrap_intervals
+
+
+def get_resample_score(metric_module, metric_kwargs, y_true, y_pred):
+    """The score of a resample, NaN if it is not defined on it (e.g. if it
+    contains only one class)"""
+    try:
+        return metric_module.score(y_true=y_true, y_pred=y_pred,
+                                   **metric_kwargs)
+    except ValueError:
+        return np.nan
+
+
+def publish_bootstrap_intervals(bootstrap_intervals, metrics_scores,
+                                directory, database_name, confidence=0.95,
+                                tag=""):  # pragma: no cover
+    r"""Used to save the confidence intervals next to the scores of each
+    metric, in a csv file and in an html figure of the test scores with their
+    interval as error bars."""
+    for metric_name, intervals in bootstrap_intervals.items():
+        logging.info(
+            "Start:\t Bootstrap interval generation for " + metric_name)
+        test_scores = metrics_scores[metric_name].loc["test", intervals.columns]
+        if metric_name.endswith("*"):
+            metric_name = metric_name[:-1] + "_p"
+        file_name = os.path.join(directory, database_name + "-" + metric_name
+                                 + "-bootstrap_CI")
+        dataframe = pd.concat([test_scores.to_frame("Test").transpose(),
+                               intervals.rename(
+                                   index={"lower": "Test CI lower",
+                                          "upper": "Test CI upper"})])
+        dataframe.to_csv(file_name + ".csv")
+        fig = plotly.graph_objs.Figure()
+        fig.add_trace(plotly.graph_objs.Bar(
+            name='Test',
+            x=np.array(intervals.columns), y=np.array(test_scores),
+            error_y=dict(type='data',
+                         array=np.maximum(np.array(
+                             intervals.loc["upper"] - test_scores), 0),
+                         arrayminus=np.maximum(np.array(
+                             test_scores - intervals.loc["lower"]), 0)),
+            marker_color="black",
+        ))
+        fig.update_layout(
+            title="Dataset : {}, metric : {}, task : {} <br> Test scores with "
+                  "their {:.0%} bootstrap confidence interval".format(
+                      database_name, metric_name, tag, confidence))
+        fig.update_layout(paper_bgcolor='rgba(0,0,0,0)',
+                          plot_bgcolor='rgba(0,0,0,0)')
+        plotly.offline.plot(fig, filename=file_name + ".html",
+                            auto_open=False)
+        del fig
+        logging.info(
+            "Done:\t Bootstrap interval generation for " + metric_name)
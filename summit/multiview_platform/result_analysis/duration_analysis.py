@@ -5,15 +5,14 @@ import plotly
 
 
 def get_duration(results):
-    df = pd.DataFrame(columns=["hps", "fit", "pred"], )
-    for classifier_result in results:
-        df.at[classifier_result.get_classifier_name(),
-              "hps"] = classifier_result.hps_duration
-        df.at[classifier_result.get_classifier_name(),
-              "fit"] = classifier_result.fit_duration
-        df.at[classifier_result.get_classifier_name(),
-              "pred"] = classifier_result.pred_duration
-    return df
+    durations = dict((classifier_result.get_classifier_name(),
+                      [classifier_result.hps_duration,
+                       classifier_result.fit_duration,
+                       classifier_result.pred_duration])
+                     for classifier_result in results)
+    return pd.DataFrame(data=list(durations.values()),
+                        index=list(durations.keys()),
+                        columns=["hps", "fit", "pred"], dtype=object)
 
 
 def plot_durations(durations, directory, database_name,
@@ -46,7 +46,9 @@ def get_sample_errors(groud_truth, results):
 
 
 def publish_sample_errors(sample_errors, directory, database_name,
-                          label_names, sample_ids, labels):  # pragma: no cover
+                          label_names, sample_ids, labels, save_data=True,
+                          max_samples=2000,
+                          nb_hardest=100):  # pragma: no cover
     logging.info("Start:\t Label analysis figure generation")
 
     base_file_name = os.path.join(directory, database_name + "-")
@@ -54,22 +56,28 @@ def publish_sample_errors(sample_errors, directory, database_name,
     nb_classifiers, nb_samples, classifiers_names, \
         data_2d, error_on_samples = gen_error_data(sample_errors)
 
-    np.savetxt(base_file_name + "2D_plot_data.csv", data_2d, delimiter=",")
-    np.savetxt(base_file_name + "bar_plot_data.csv", error_on_samples,
-               delimiter=",")
+    if save_data:
+        np.savetxt(base_file_name + "2D_plot_data.csv", data_2d,
+                   delimiter=",")
+        np.savetxt(base_file_name + "bar_plot_data.csv", error_on_samples,
+                   delimiter=",")
 
     plot_2d(data_2d, classifiers_names, nb_classifiers, base_file_name, database_name,
-            sample_ids=sample_ids, labels=labels, label_names=label_names)
+            sample_ids=sample_ids, labels=labels, label_names=label_names,
+            max_samples=max_samples, nb_hardest=nb_hardest)
 
     plot_errors_bar(error_on_samples, nb_samples,
-                    base_file_name, database_name, sample_ids=sample_ids)
+                    base_file_name, database_name, sample_ids=sample_ids,
+                    max_samples=max_samples, nb_hardest=nb_hardest)
 
     logging.info("Done:\t Label analysis figures generation")
 
 
 def publish_all_sample_errors(iter_results, directory,
                               stats_iter,
-                              sample_ids, labels, data_base_name, label_names):  # pragma: no cover
+                              sample_ids, labels, data_base_name, label_names,
+                              max_samples=2000,
+                              nb_hardest=100):  # pragma: no cover
     logging.info(
         "Start:\t Global label analysis figure generation")
 
@@ -83,9 +91,11 @@ def publish_all_sample_errors(iter_results, directory,
 
     plot_2d(data, classifier_names, nb_classifiers,
             os.path.join(directory, ""), data_base_name, stats_iter=stats_iter,
-            sample_ids=sample_ids, labels=labels, label_names=label_names)
+            sample_ids=sample_ids, labels=labels, label_names=label_names,
+            max_samples=max_samples, nb_hardest=nb_hardest)
     plot_errors_bar(error_on_samples, nb_samples, os.path.join(directory, ""), data_base_name,
-                    sample_ids=sample_ids)
+                    sample_ids=sample_ids, max_samples=max_samples,
+                    nb_hardest=nb_hardest)
 
     logging.info(
         "Done:\t Global label analysis figures generation")
@@ -151,8 +161,85 @@ def gen_error_data_glob(iter_results, stats_iter):
         classifier_names
 
 
+def get_difficulty_order(data, labels):
+    r"""Used to sort the samples by label and, for each label, from the
+    hardest, the one that was the least often well classified, to the
+    easiest, the samples that were not seen being the last ones.
+
+    Parameters
+    ----------
+    data : np.array of shape `(nbExamples, nbClassifiers)`
+        The number of times each classifier classified each sample well,
+        negative if it did not see the sample.
+    labels : np.array of shape `(nbExamples,)`
+        The labels of the samples.
+
+    Returns
+    -------
+    order : np.array of shape `(nbExamples,)`
+        The sorted indices of the samples.
+    """
+    unseen = np.any(data < 0, axis=1)
+    successes = np.sum(np.maximum(data, 0), axis=1)
+    return np.lexsort((successes, unseen, labels))
+
+
+def get_hardest_samples(data, nb_hardest):
+    """The indices of the `nb_hardest` seen samples that were the least
+    often well classified, from the hardest"""
+    seen = np.where(np.all(data >= 0, axis=1))[0]
+    successes = np.sum(data[seen], axis=1)
+    return seen[np.argsort(successes, kind="stable")[:nb_hardest]]
+
+
+def get_bin_starts(nb_samples, nb_bins):
+    """The index of the first sample of each of the `nb_bins` bins of
+    consecutive samples, as even as possible"""
+    return np.unique(np.linspace(0, nb_samples, min(nb_bins, nb_samples),
+                                 endpoint=False).astype(int))
+
+
+def bin_sample_errors(data, nb_bins, unseen_value=-100):
+    r"""Used to aggregate consecutive samples into bins, averaging their
+    rows of `data` over the samples that were seen.
+
+    Parameters
+    ----------
+    data : np.array of shape `(nbExamples, nbClassifiers)`
+        The number of times each classifier classified each sample well,
+        negative if it did not see the sample.
+    nb_bins : int
+        The number of bins.
+    unseen_value : int
+        The value of a bin none of whose samples were seen.
+
+    Returns
+    -------
+    binned_data : np.array of shape `(nbBins, nbClassifiers)`
+        The average of the seen samples of each bin.
+    bin_starts : np.array of shape `(nbBins,)`
+        The index of the first sample of each bin.
+    """
+    bin_starts = get_bin_starts(data.shape[0], nb_bins)
+    seen = data >= 0
+    sums = np.add.reduceat(np.where(seen, data, 0), bin_starts, axis=0)
+    counts = np.add.reduceat(seen.astype(int), bin_starts, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        binned_data = np.where(counts > 0, sums / counts, unseen_value)
+    return binned_data, bin_starts
+
+
+def get_bin_names(bin_starts, nb_samples, sample_ids):
+    """The names of the bins, from their first and last samples"""
+    bin_ends = np.append(bin_starts[1:], nb_samples) - 1
+    return ["{} to {} ({} samples)".format(sample_ids[start], sample_ids[end],
+                                           end - start + 1)
+            for start, end in zip(bin_starts, bin_ends)]
+
+
 def plot_2d(data, classifiers_names, nb_classifiers, file_name, dataset_name, labels=None,
-            stats_iter=1, use_plotly=True, sample_ids=None, label_names=None):  # pragma: no cover
+            stats_iter=1, use_plotly=True, sample_ids=None, label_names=None,
+            max_samples=2000, nb_hardest=100):  # pragma: no cover
     r"""Used to generate a 2D plot of the errors.
 
     Parameters
@@ -174,12 +261,22 @@ def plot_2d(data, classifiers_names, nb_classifiers, file_name, dataset_name, la
         To obtain the image width, the number of samples will be divided by this number.
     stats_iter : int, optional, default: 1
         The number of statistical iterations realized.
+    max_samples : int, optional, default: 2000
+        Above this number of samples, they are sorted by label and
+        difficulty and aggregated in `max_samples` bins, and only the
+        `nb_hardest` hardest ones are plotted one by one, in a separate
+        figure, with their hover text.
 
     Returns
     -------
     """
     if label_names is None:
         label_names = [str(lab) for lab in np.sort(np.unique(labels))]
+    if data.shape[0] > max_samples:
+        plot_binned_2d(data, classifiers_names, nb_classifiers, file_name,
+                       dataset_name, labels, stats_iter, use_plotly,
+                       sample_ids, label_names, max_samples, nb_hardest)
+        return
     fig, ax = plt.subplots(nrows=1, ncols=1, )
     label_index_list = np.concatenate([np.where(labels == i)[0] for i in
                                        np.unique(
@@ -230,8 +327,96 @@ def plot_2d(data, classifiers_names, nb_classifiers, file_name, dataset_name, la
         del fig
 
 
+def plot_binned_2d(data, classifiers_names, nb_classifiers, file_name,
+                   dataset_name, labels, stats_iter, use_plotly, sample_ids,
+                   label_names, nb_bins, nb_hardest):  # pragma: no cover
+    r"""Used to generate the 2D plot of the errors of many samples : they are
+    sorted by label and difficulty and aggregated in `nb_bins` bins, whose
+    average number of successes is plotted, without any hover text. The
+    `nb_hardest` hardest samples are plotted one by one in the
+    "error_analysis_2D_hardest.html" figure."""
+    order = get_difficulty_order(data, labels)
+    binned_data, bin_starts = bin_sample_errors(data[order], nb_bins,
+                                                unseen_value=-100 * stats_iter)
+    fig, ax = plt.subplots(nrows=1, ncols=1, )
+    # The averages of the bins are shown on a continuous scale, the bins of
+    # unseen samples being masked, in red.
+    cmap = plt.get_cmap("Greys_r").copy()
+    cmap.set_bad("red")
+    cax = plt.imshow(np.ma.masked_less(binned_data, 0), cmap=cmap,
+                     norm=mpl.colors.Normalize(0, stats_iter), aspect='auto',
+                     interpolation="nearest")
+    plt.title('Errors depending on the classifier')
+    plt.xticks(np.arange(0, nb_classifiers, 1), classifiers_names,
+               rotation="vertical")
+    plt.yticks([], [])
+    plt.ylabel("Examples, sorted by label and difficulty, in {} bins".format(
+        len(bin_starts)))
+    cbar = fig.colorbar(cax, ticks=[0, stats_iter])
+    cbar.ax.set_yticklabels(['Always Wrong', 'Always Right'])
+    fig.savefig(file_name + "error_analysis_2D.png", bbox_inches="tight",
+                transparent=True)
+    plt.close()
+    if use_plotly:
+        sorted_ids = np.asarray(sample_ids)[order]
+        fig = plotly.graph_objs.Figure()
+        fig.add_trace(plotly.graph_objs.Heatmap(
+            x=list(classifiers_names),
+            y=get_bin_names(bin_starts, len(order), sorted_ids),
+            z=np.where(binned_data < 0, np.nan, binned_data),
+            hoverinfo=["y", "x", "z"],
+            colorscale="Greys",
+            zmin=0, zmax=stats_iter,
+            colorbar=dict(tickvals=[0, stats_iter],
+                          ticktext=["Always Wrong", "Always Right"]),
+            reversescale=True), )
+        fig.update_yaxes(title_text="Examples, sorted by label and difficulty",
+                         showticklabels=False)
+        fig.update_layout(
+            title="Dataset : {} <br> Average errors for each classifier on {} "
+                  "bins of samples <br> Generated on <a href='https://baptiste.bauvin.pages.lis-lab.fr/summit'>SuMMIT</a>.".format(
+                      dataset_name, len(bin_starts)))
+        fig.update_layout(paper_bgcolor='rgba(0,0,0,0)',
+                          plot_bgcolor='rgba(0,0,0,0)')
+        plotly.offline.plot(fig, filename=file_name + "error_analysis_2D.html",
+                            auto_open=False)
+        del fig
+        hardest = get_hardest_samples(data, nb_hardest)
+        hover_text = [["{} failed {} time(s), labelled {}".format(
+            sample_ids[sample_index], stats_iter - data[sample_index,
+                                                        classifier_index],
+            label_names[int(labels[sample_index])])
+            for classifier_index in range(data.shape[1])]
+            for sample_index in hardest]
+        fig = plotly.graph_objs.Figure()
+        fig.add_trace(plotly.graph_objs.Heatmap(
+            x=list(classifiers_names),
+            y=[sample_ids[sample_index] for sample_index in hardest],
+            z=data[hardest, :],
+            text=hover_text,
+            hoverinfo=["y", "x", "text"],
+            colorscale="Greys",
+            zmin=0, zmax=stats_iter,
+            colorbar=dict(tickvals=[0, stats_iter],
+                          ticktext=["Always Wrong", "Always Right"]),
+            reversescale=True), )
+        fig.update_yaxes(title_text="Examples", showticklabels=True,
+                         autorange="reversed")
+        fig.update_layout(
+            title="Dataset : {} <br> Errors for each classifier on the {} "
+                  "hardest samples <br> Generated on <a href='https://baptiste.bauvin.pages.lis-lab.fr/summit'>SuMMIT</a>.".format(
+                      dataset_name, len(hardest)))
+        fig.update_layout(paper_bgcolor='rgba(0,0,0,0)',
+                          plot_bgcolor='rgba(0,0,0,0)')
+        plotly.offline.plot(fig, filename=file_name
+                            + "error_analysis_2D_hardest.html",
+                            auto_open=False)
+        del fig
+
+
 def plot_errors_bar(error_on_samples, nb_samples, file_name, dataset_name,
-                    use_plotly=True, sample_ids=None):  # pragma: no cover
+                    use_plotly=True, sample_ids=None, max_samples=2000,
+                    nb_hardest=100):  # pragma: no cover
     r"""Used to generate a barplot of the muber of classifiers that failed to classify each samples
 
     Parameters
@@ -246,10 +431,19 @@ def plot_errors_bar(error_on_samples, nb_samples, file_name, dataset_name,
         The number of samples.
     file_name : str
         The name of the file in which the figure will be saved ("error_analysis_2D.png" will be added at the end)
+    max_samples : int, optional, default: 2000
+        Above this number of samples, they are sorted by difficulty and
+        aggregated in `max_samples` bins, and only the `nb_hardest` hardest
+        ones are plotted one by one, in a separate figure.
 
     Returns
     -------
     """
+    if nb_samples > max_samples:
+        plot_binned_errors_bar(error_on_samples, file_name, dataset_name,
+                               use_plotly, sample_ids, max_samples,
+                               nb_hardest)
+        return
     fig, ax = plt.subplots()
     x = np.arange(nb_samples)
     plt.bar(x, 1 - error_on_samples)
@@ -269,6 +463,54 @@ def plot_errors_bar(error_on_samples, nb_samples, file_name, dataset_name,
                             auto_open=False)
 
 
+def plot_binned_errors_bar(error_on_samples, file_name, dataset_name,
+                           use_plotly, sample_ids, nb_bins,
+                           nb_hardest):  # pragma: no cover
+    r"""Used to generate the barplot of the errors of many samples : they are
+    sorted from the hardest to the easiest and aggregated in `nb_bins` bins,
+    whose average error rate is plotted. The `nb_hardest` hardest samples are
+    plotted one by one in the "error_analysis_bar_hardest.html" figure."""
+    seen = np.where(error_on_samples >= 0)[0]
+    order = seen[np.argsort(error_on_samples[seen], kind="stable")]
+    binned_errors, bin_starts = bin_sample_errors(
+        1 - error_on_samples[order, np.newaxis], nb_bins)
+    binned_errors = binned_errors[:, 0]
+    fig, ax = plt.subplots()
+    plt.bar(np.arange(len(bin_starts)), binned_errors, width=1.0)
+    plt.title("Number of classifiers that failed to classify each sample")
+    plt.xlabel("Examples, sorted by difficulty, in {} bins".format(
+        len(bin_starts)))
+    fig.savefig(file_name + "error_analysis_bar.png", transparent=True)
+    plt.close()
+    if use_plotly:
+        sorted_ids = np.asarray(sample_ids)[order]
+        fig = plotly.graph_objs.Figure(
+            [plotly.graph_objs.Bar(x=get_bin_names(bin_starts, len(order),
+                                                   sorted_ids),
+                                   y=binned_errors)])
+        fig.update_xaxes(showticklabels=False)
+        fig.update_layout(paper_bgcolor='rgba(0,0,0,0)',
+                          plot_bgcolor='rgba(0,0,0,0)',
+                          title="Dataset : {} <br> Average error % on {} bins "
+                                "of samples <br> Generated on <a href='https://baptiste.bauvin.pages.lis-lab.fr/summit'>SuMMIT</a>.".format(
+                              dataset_name, len(bin_starts)))
+        plotly.offline.plot(fig, filename=file_name + "error_analysis_bar.html",
+                            auto_open=False)
+        hardest = order[:nb_hardest]
+        fig = plotly.graph_objs.Figure(
+            [plotly.graph_objs.Bar(x=[sample_ids[sample_index]
+                                      for sample_index in hardest],
+                                   y=1 - error_on_samples[hardest])])
+        fig.update_layout(paper_bgcolor='rgba(0,0,0,0)',
+                          plot_bgcolor='rgba(0,0,0,0)',
+                          title="Dataset : {} <br> Error % of the {} hardest "
+                                "samples <br> Generated on <a href='https://baptiste.bauvin.pages.lis-lab.fr/summit'>SuMMIT</a>.".format(
+                              dataset_name, len(hardest)))
+        plotly.offline.plot(fig, filename=file_name
+                            + "error_analysis_bar_hardest.html",
+                            auto_open=False)
+
+
 def iter_cmap(statsIter):  # pragma: no cover
     r"""Used to generate a colormap that will have a tick for each iteration : the whiter the better.
 
@@ -1,7 +1,10 @@
 import logging
 
+import numpy as np
 import pandas as pd
 
+from .bootstrap_analysis import get_bootstrap_intervals, \
+    publish_bootstrap_intervals
 from .duration_analysis import plot_durations, get_duration
 from .error_analysis import get_sample_errors, publish_sample_errors, \
     publish_all_sample_errors
@@ -9,7 +12,9 @@ from .feature_importances import get_feature_importances, \
     publish_feature_importances
 from .metric_analysis import get_metrics_scores, publish_metrics_graphs, \
     publish_all_metrics_scores
+from .rendering import render
 from .tracebacks_analysis import save_failed, publish_tracebacks
+from ..utils.results_store import ResultsStore
 
 
 def analyze(results, stats_iter, benchmark_argument_dictionaries,
@@ -17,6 +22,7 @@ def analyze(results, stats_iter, benchmark_argument_dictionaries,
             view_names):  # pragma: no cover
     """Used to analyze the results of the previous benchmarks"""
     data_base_name = benchmark_argument_dictionaries[0]["args"]["name"]
+    args = benchmark_argument_dictionaries[0]["args"]
 
     results_means_std, iter_results, flagged_failed, label_names = analyze_iterations(
         results, benchmark_argument_dictionaries,
@@ -27,7 +33,9 @@ def analyze(results, stats_iter, benchmark_argument_dictionaries,
     if stats_iter > 1:
         results_means_std = analyze_all(
             iter_results, stats_iter, directory,
-            data_base_name, sample_ids, label_names)
+            data_base_name, sample_ids, label_names,
+            max_plotted_samples=args.get("max_plotted_samples", 2000),
+            nb_hardest_samples=args.get("nb_hardest_samples", 100))
     return results_means_std
 
 
@@ -67,54 +75,96 @@ def analyze_iterations(results, benchmark_argument_dictionaries, stats_iter,
         information useful to plot errors on samples.
     """
     logging.info("Start:\t Analyzing all results")
-    iter_results = {"metrics_scores": [i for i in range(stats_iter)],
-                    "class_metrics_scores": [i for i in range(stats_iter)],
-                    "sample_errors": [i for i in range(stats_iter)],
-                    "feature_importances": [i for i in range(stats_iter)],
-                    "durations": [i for i in range(stats_iter)]}
+    iter_results = init_iter_results(stats_iter)
     flagged_tracebacks_list = []
-    fig_errors = []
     for iter_index, result, tracebacks in results:
         arguments = get_arguments(benchmark_argument_dictionaries, iter_index)
         labels_names = list(arguments["labels_dictionary"].values())
-
-        metrics_scores, class_metric_scores = get_metrics_scores(metrics,
-                                                                 result,
-                                                                 labels_names)
-        sample_errors = get_sample_errors(labels, result)
         feature_importances = get_feature_importances(result,
                                                       feature_ids=feature_ids,
                                                       view_names=view_names,)
-        durations = get_duration(result)
-        directory = arguments["directory"]
-
-        database_name = arguments["args"]["name"]
-
-        flagged_tracebacks_list += publish_tracebacks(directory, database_name,
-                                                      labels_names, tracebacks,
-                                                      iter_index)
-        res = publish_metrics_graphs(metrics_scores, directory, database_name,
-                                     labels_names, class_metric_scores)
-        publish_sample_errors(sample_errors, directory, database_name,
-                              labels_names, sample_ids, labels)
-        publish_feature_importances(feature_importances, directory,
-                                    database_name, metric_scores=metrics_scores)
-        plot_durations(durations, directory, database_name)
-
-        iter_results["metrics_scores"][iter_index] = metrics_scores
-        iter_results["class_metrics_scores"][iter_index] = class_metric_scores
-        iter_results["sample_errors"][iter_index] = sample_errors
-        iter_results["feature_importances"][iter_index] = feature_importances
-        iter_results["labels"] = labels
-        iter_results["durations"][iter_index] = durations
+        res, flagged_tracebacks = analyze_iteration(
+            iter_index, result, tracebacks, arguments, metrics, sample_ids,
+            labels, feature_importances, iter_results)
+        flagged_tracebacks_list += flagged_tracebacks
 
     logging.info("Done:\t Analyzing all results")
 
     return res, iter_results, flagged_tracebacks_list, labels_names
 
 
+def init_iter_results(stats_iter):
+    """The lists of the results of each statistical iteration, filled by
+    `analyze_iteration`"""
+    return {"metrics_scores": [i for i in range(stats_iter)],
+            "class_metrics_scores": [i for i in range(stats_iter)],
+            "sample_errors": [i for i in range(stats_iter)],
+            "feature_importances": [i for i in range(stats_iter)],
+            "durations": [i for i in range(stats_iter)]}
+
+
+def analyze_iteration(iter_index, result, tracebacks, arguments, metrics,
+                      sample_ids, labels, feature_importances, iter_results):
+    r"""Used to analyze the results of a statistical iteration, from its
+    classifiers' results and their feature importances, publishing its
+    reports and figures and filling its entries of `iter_results`.
+
+    Returns
+    -------
+    res : list
+        The test scores of the classifiers, for each metric.
+    flagged_tracebacks : list
+        The classifiers that failed.
+    """
+    labels_names = list(arguments["labels_dictionary"].values())
+
+    metrics_scores, class_metric_scores = get_metrics_scores(metrics,
+                                                             result,
+                                                             labels_names)
+    sample_errors = get_sample_errors(labels, result)
+    durations = get_duration(result)
+    directory = arguments["directory"]
+
+    database_name = arguments["args"]["name"]
+
+    flagged_tracebacks = publish_tracebacks(directory, database_name,
+                                            labels_names, tracebacks,
+                                            iter_index)
+    res = publish_metrics_graphs(metrics_scores, directory, database_name,
+                                 labels_names, class_metric_scores)
+    nb_bootstrap = arguments["args"].get("nb_bootstrap", 0)
+    if nb_bootstrap:
+        confidence = arguments["args"].get("bootstrap_confidence", 0.95)
+        bootstrap_intervals = get_bootstrap_intervals(
+            metrics, result, labels,
+            arguments["classification_indices"][1],
+            nb_bootstrap=nb_bootstrap, confidence=confidence,
+            random_state=np.random.RandomState(iter_index))
+        render(publish_bootstrap_intervals, bootstrap_intervals,
+               metrics_scores, directory, database_name,
+               confidence=confidence, tag=" vs ".join(labels_names))
+    # The error data of the samples is in the results store, if any.
+    render(publish_sample_errors, sample_errors, directory, database_name,
+           labels_names, sample_ids, labels,
+           save_data=ResultsStore.active is None,
+           max_samples=arguments["args"].get("max_plotted_samples", 2000),
+           nb_hardest=arguments["args"].get("nb_hardest_samples", 100))
+    render(publish_feature_importances, feature_importances, directory,
+           database_name, metric_scores=metrics_scores)
+    render(plot_durations, durations, directory, database_name)
+
+    iter_results["metrics_scores"][iter_index] = metrics_scores
+    iter_results["class_metrics_scores"][iter_index] = class_metric_scores
+    iter_results["sample_errors"][iter_index] = sample_errors
+    iter_results["feature_importances"][iter_index] = feature_importances
+    iter_results["labels"] = labels
+    iter_results["durations"][iter_index] = durations
+    return res, flagged_tracebacks
+
+
 def analyze_all(iter_results, stats_iter, directory, data_base_name,
-                sample_ids, label_names):  # pragma: no cover
+                sample_ids, label_names, max_plotted_samples=2000,
+                nb_hardest_samples=100):  # pragma: no cover
     """Used to format the results in order to plot the mean results on
     the iterations"""
     metrics_analysis, class_metrics_analysis, error_analysis, feature_importances, \
@@ -126,15 +176,75 @@ def analyze_all(iter_results, stats_iter, directory, data_base_name,
                                          directory,
                                          data_base_name, stats_iter,
                                          label_names)
-    publish_all_sample_errors(error_analysis, directory, stats_iter,
-                              sample_ids, labels, data_base_name, label_names)
-    publish_feature_importances(feature_importances, directory,
-                                data_base_name, feature_importances_stds,
-                                metric_scores=metrics_analysis)
-    plot_durations(duration_means, directory, data_base_name, duration_stds)
+    render(publish_all_sample_errors, error_analysis, directory, stats_iter,
+           sample_ids, labels, data_base_name, label_names,
+           max_samples=max_plotted_samples, nb_hardest=nb_hardest_samples)
+    render(publish_feature_importances, feature_importances, directory,
+           data_base_name, feature_importances_stds,
+           metric_scores=metrics_analysis)
+    render(plot_durations, duration_means, directory, data_base_name,
+           duration_stds)
     return results
 
 
+class RunningStatistics:
+    """
+    Streaming mean and variance of the cells of data frames, updated with
+    each statistical iteration's frame by Welford's algorithm, so that the
+    iterations are aggregated in one pass, without concatenating them.
+
+    The frames are aligned on the union of their index and columns, and
+    their missing (NaN) cells are skipped, as a groupby on their
+    concatenation would do.
+    """
+
+    def __init__(self):
+        self.index = pd.Index([])
+        self.columns = pd.Index([])
+        self.count = np.zeros((0, 0))
+        self.mean = np.zeros((0, 0))
+        self.squares = np.zeros((0, 0))
+
+    def add(self, dataframe):
+        self.index = self.index.append(
+            dataframe.index.difference(self.index, sort=False))
+        self.columns = self.columns.append(
+            dataframe.columns.difference(self.columns, sort=False))
+        shape = (len(self.index), len(self.columns))
+        self.count, self.mean, self.squares = [
+            np.pad(array, [(0, shape[0] - array.shape[0]),
+                           (0, shape[1] - array.shape[1])])
+            for array in [self.count, self.mean, self.squares]]
+        values = dataframe.reindex(index=self.index,
+                                   columns=self.columns).to_numpy(
+            dtype=float)
+        present = ~np.isnan(values)
+        values = np.where(present, values, 0)
+        self.count += present
+        delta = np.where(present, values - self.mean, 0)
+        self.mean += delta / np.maximum(self.count, 1)
+        self.squares += np.where(present, delta * (values - self.mean), 0)
+
+    def get_frame(self, values, sort_columns):
+        dataframe = pd.DataFrame(values, index=self.index,
+                                 columns=self.columns).sort_index()
+        if sort_columns:
+            dataframe = dataframe.sort_index(axis=1)
+        return dataframe
+
+    def get_mean(self, sort_columns=False):
+        """The mean of each cell, sorted by index as a groupby would"""
+        return self.get_frame(np.where(self.count > 0, self.mean, np.nan),
+                              sort_columns)
+
+    def get_std(self, ddof=0, sort_columns=False):
+        """The standard deviation of each cell"""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.sqrt(self.squares / (self.count - ddof))
+        return self.get_frame(np.where(self.count > ddof, std, np.nan),
+                              sort_columns)
+
+
 def get_arguments(benchmark_argument_dictionaries, iter_index):
     r"""Used to get the arguments passed to the benchmark executing function
     corresponding to the flag of an
@@ -186,72 +296,40 @@ def format_previous_results(iter_results_lists):
     feature_importances_analysis = {}
     feature_importances_stds = {}
 
-    metric_concat_dict = {}
-    for iter_index, metrics_score in enumerate(
-            iter_results_lists["metrics_scores"]):
-        for metric_name, dataframe in metrics_score.items():
-            if metric_name not in metric_concat_dict:
-                metric_concat_dict[metric_name] = dataframe
-            else:
-                metric_concat_dict[metric_name] = pd.concat(
-                    [metric_concat_dict[metric_name], dataframe])
-
-    for metric_name, dataframe in metric_concat_dict.items():
-        metrics_analysis[metric_name] = {}
-        metrics_analysis[metric_name][
-            "mean"] = dataframe.groupby(dataframe.index).mean()
-        metrics_analysis[metric_name][
-            "std"] = dataframe.groupby(dataframe.index).std(ddof=0)
-
-    class_metric_concat_dict = {}
-    for iter_index, class_metrics_score in enumerate(
-            iter_results_lists["class_metrics_scores"]):
-        for metric_name, dataframe in class_metrics_score.items():
-            if metric_name not in class_metric_concat_dict:
-                class_metric_concat_dict[metric_name] = dataframe
-            else:
-                class_metric_concat_dict[metric_name] = pd.concat(
-                    [class_metric_concat_dict[metric_name], dataframe])
-
-    for metric_name, dataframe in class_metric_concat_dict.items():
-        class_metrics_analysis[metric_name] = {}
-        class_metrics_analysis[metric_name][
-            "mean"] = dataframe.groupby(dataframe.index).mean()
-        class_metrics_analysis[metric_name][
-            "std"] = dataframe.groupby(dataframe.index).std(ddof=0)
-
-    durations_df_concat = pd.DataFrame(dtype=float)
-    for iter_index, durations_df in enumerate(iter_results_lists["durations"]):
-        durations_df_concat = pd.concat((durations_df_concat, durations_df),
-                                        axis=1)
-    durations_df_concat = durations_df_concat.astype(float)
-    grouped_df = durations_df_concat.groupby(durations_df_concat.columns,
-                                             axis=1)
-    duration_means = grouped_df.mean()
-    duration_stds = grouped_df.std()
-
-    importance_concat_dict = {}
-    for iter_index, view_feature_importances in enumerate(
-            iter_results_lists["feature_importances"]):
+    for key, analysis in [("metrics_scores", metrics_analysis),
+                          ("class_metrics_scores", class_metrics_analysis)]:
+        metric_statistics = {}
+        for metrics_score in iter_results_lists[key]:
+            for metric_name, dataframe in metrics_score.items():
+                metric_statistics.setdefault(metric_name,
+                                             RunningStatistics()).add(
+                    dataframe)
+        for metric_name, statistics in metric_statistics.items():
+            analysis[metric_name] = {"mean": statistics.get_mean(),
+                                     "std": statistics.get_std()}
+
+    duration_statistics = RunningStatistics()
+    for durations_df in iter_results_lists["durations"]:
+        duration_statistics.add(durations_df)
+    duration_means = duration_statistics.get_mean(sort_columns=True)
+    duration_stds = duration_statistics.get_std(ddof=1, sort_columns=True)
+
+    importance_statistics = {}
+    for view_feature_importances in iter_results_lists["feature_importances"]:
         for view_name, feature_importances in view_feature_importances.items():
-            if view_name not in importance_concat_dict:
-                importance_concat_dict[view_name] = feature_importances
-            else:
-                importance_concat_dict[view_name] = pd.concat(
-                    [importance_concat_dict[view_name], feature_importances])
-
-    for view_name, dataframe in importance_concat_dict.items():
-        feature_importances_analysis[view_name] = dataframe.groupby(
-            dataframe.index).mean()
+            importance_statistics.setdefault(view_name,
+                                             RunningStatistics()).add(
+                feature_importances)
 
-        feature_importances_stds[view_name] = dataframe.groupby(
-            dataframe.index).std(ddof=0)
+    for view_name, statistics in importance_statistics.items():
+        feature_importances_analysis[view_name] = statistics.get_mean()
+        feature_importances_stds[view_name] = statistics.get_std()
 
     added_sample_errors = {}
     for sample_errors in iter_results_lists["sample_errors"]:
         for classifier_name, errors in sample_errors.items():
             if classifier_name not in added_sample_errors:
-                added_sample_errors[classifier_name] = errors
+                added_sample_errors[classifier_name] = errors.copy()
             else:
                 added_sample_errors[classifier_name] += errors
     error_analysis = added_sample_errors
@@ -6,6 +6,7 @@ import numpy as np
 import pandas as pd
 import plotly
 
+from .rendering import render
 from ..utils.organization import secure_file_path
 
 
@@ -32,42 +33,27 @@ def get_metrics_scores(metrics, results, label_names):
         -`metricScores[metric_name]["test_scores"]` is a list of all the
         available classifiers scores on the test set.
     """
-    classifier_names = []
     classifier_names = [classifier_result.get_classifier_name()
-                        for classifier_result in results
-                        if classifier_result.get_classifier_name()
-                        not in classifier_names]
-    metrics_scores = dict((metric, pd.DataFrame(data=np.zeros((2,
-                                                               len(
-                                                                   classifier_names))),
-                                                index=["train", "test"],
-                                                columns=classifier_names))
-                          for metric in metrics.keys())
-    class_metric_scores = dict((metric, pd.DataFrame(
-        index=pd.MultiIndex.from_product([["train", "test"], label_names]),
-        columns=classifier_names, dtype=float))
-        for metric in metrics)
-
-    for metric in metrics.keys():
-        for classifier_result in results:
-            metrics_scores[metric].loc[
-                "train", classifier_result.get_classifier_name()] = \
-                classifier_result.metrics_scores[metric][0]
-            metrics_scores[metric].loc[
-                "test", classifier_result.get_classifier_name()] = \
-                classifier_result.metrics_scores[metric][1]
-            for label_index, label_name in enumerate(label_names):
-                class_metric_scores[metric].loc[(
-                    "train",
-                    label_name), classifier_result.get_classifier_name()] = \
-                    classifier_result.class_metric_scores[metric][0][
-                        label_index]
-                class_metric_scores[metric].loc[(
-                    "test",
-                    label_name), classifier_result.get_classifier_name()] = \
-                    classifier_result.class_metric_scores[metric][1][
-                        label_index]
-
+                        for classifier_result in results]
+    nb_results = len(results)
+    metrics_scores = {}
+    class_metric_scores = {}
+    for metric in metrics:
+        metrics_scores[metric] = pd.DataFrame(
+            data=np.array([[classifier_result.metrics_scores[metric][set_index]
+                            for classifier_result in results]
+                           for set_index in range(2)],
+                          dtype=float).reshape((2, nb_results)),
+            index=["train", "test"], columns=classifier_names)
+        class_metric_scores[metric] = pd.DataFrame(
+            data=np.array([[classifier_result.class_metric_scores[metric][
+                set_index][label_index] for classifier_result in results]
+                for set_index in range(2)
+                for label_index in range(len(label_names))],
+                dtype=float).reshape((2 * len(label_names), nb_results)),
+            index=pd.MultiIndex.from_product([["train", "test"],
+                                              label_names]),
+            columns=classifier_names)
     return metrics_scores, class_metric_scores
 
 
@@ -105,13 +91,13 @@ def publish_metrics_graphs(metrics_scores, directory, database_name,
                                           database_name,
                                           class_metric_scores[metric_name])
 
-        plot_metric_scores(train_scores, test_scores, classifier_names,
-                           nb_results, metric_name, file_name, database_name,
-                           tag=" vs ".join(labels_names))
+        render(plot_metric_scores, train_scores, test_scores,
+               classifier_names, nb_results, metric_name, file_name,
+               database_name, tag=" vs ".join(labels_names))
 
         class_file_name = file_name+"-class"
-        plot_class_metric_scores(class_test_scores, class_file_name,
-                                 labels_names, classifier_names, metric_name)
+        render(plot_class_metric_scores, class_test_scores, class_file_name,
+               labels_names, classifier_names, metric_name)
         logging.info(
             "Done:\t Score graph generation for " + metric_name)
     return results
@@ -136,9 +122,9 @@ def publish_all_metrics_scores(iter_results, class_iter_results, directory,
             stats_iter) + "_iter-" + metric_name)
         nb_results = classifier_names.shape[0]
 
-        plot_metric_scores(train, test, classifier_names, nb_results,
-                           metric_name, file_name, data_base_name, tag="Averaged",
-                           train_STDs=train_std, test_STDs=test_std)
+        render(plot_metric_scores, train, test, classifier_names, nb_results,
+               metric_name, file_name, data_base_name, tag="Averaged",
+               train_STDs=train_std, test_STDs=test_std)
         results += [[classifier_name, metric_name, test_mean, test_std]
                     for classifier_name, test_mean, test_std
                     in zip(classifier_names, test, test_std)]
@@ -155,8 +141,8 @@ def publish_all_metrics_scores(iter_results, class_iter_results, directory,
         file_name = os.path.join(directory, data_base_name + "-mean_on_" + str(
             stats_iter) + "_iter-" + metric_name + "-class")
 
-        plot_class_metric_scores(test, file_name, label_names, classifier_names,
-                                 metric_name, stds=test_std, tag="averaged")
+        render(plot_class_metric_scores, test, file_name, label_names,
+               classifier_names, metric_name, stds=test_std, tag="averaged")
     return results
 
 
@@ -0,0 +1,73 @@
+import logging
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+# Author-Info
+__author__ = "Baptiste Bauvin"
+__status__ = "Prototype"  # Production, Development, Prototype
+
+
+class FigurePool:
+    """
+    Pool of processes rendering the figures and reports of the result
+    analysis, so that they are drawn and written in parallel.
+
+    While used as a context manager, the pool is active and `render` submits
+    the rendering functions to it instead of calling them. On exit, it waits
+    for all the submitted renderings, and raises the first of their errors.
+
+    Parameters
+    ----------
+    nb_cores : int
+        The number of rendering processes, the figures being rendered in the
+        calling process if it is 0.
+    """
+    active = None
+
+    def __init__(self, nb_cores=0):
+        self.nb_cores = nb_cores
+        self.executor = None
+        self.futures = []
+
+    def __enter__(self):
+        if self.nb_cores > 0:
+            self.executor = ProcessPoolExecutor(self.nb_cores)
+        FigurePool.active = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        FigurePool.active = None
+        if self.executor is None:
+            return
+        self.executor.shutdown(wait=True)
+        self.executor = None
+        futures, self.futures = self.futures, []
+        errors = [future.exception() for future in futures
+                  if future.exception() is not None]
+        for error in errors:
+            logging.error("Figure rendering failed : {}".format(error))
+        if errors and exc_type is None:
+            raise errors[0]
+
+    def submit(self, function, *args, **kwargs):
+        if self.executor is None:
+            function(*args, **kwargs)
+        else:
+            # Pickled at once, as the arguments could be modified before the
+            # executor sends them to a process.
+            self.futures.append(self.executor.submit(
+                call_pickled, pickle.dumps((function, args, kwargs))))
+
+
+def call_pickled(pickled_call):
+    function, args, kwargs = pickle.loads(pickled_call)
+    return function(*args, **kwargs)
+
+
+def render(function, *args, **kwargs):
+    """Renders a figure with `function`, in the active `FigurePool` if
+    any"""
+    if FigurePool.active is None:
+        function(*args, **kwargs)
+    else:
+        FigurePool.active.submit(function, *args, **kwargs)
@@ -0,0 +1,162 @@
+import logging
+import os
+
+from .execution import analyze_iteration, analyze_all, init_iter_results
+from .rendering import FigurePool
+from .tracebacks_analysis import save_failed
+from ..monoview.monoview_utils import MonoviewResult
+from ..multiview.multiview_utils import MultiviewResult
+from ..utils.base import ResultAnalyser
+from ..utils.results_store import ResultsStore
+
+# Author-Info
+__author__ = "Baptiste Bauvin"
+__status__ = "Prototype"  # Production, Development, Prototype
+
+
+def analyze_stored_results(result_directory, metrics=None, metric_princ=None,
+                           output_directory=None, nb_bootstrap=None,
+                           nb_cores=0):
+    r"""Used to analyze again the results of a benchmark from its
+    `results.hdf5` file, without training anything : the scores are
+    recomputed from the stored predictions, and the metric, error, feature
+    importance and duration reports and figures are published again, the
+    figures being rendered by `nb_cores` processes.
+
+    Parameters
+    ----------
+    result_directory : str
+        The result directory of the benchmark, containing `results.hdf5`.
+    metrics : list of str
+        The names of the metrics to compute, the ones of the benchmark if
+        None. A metric of the benchmark keeps its configuration, the other
+        ones are used with their default arguments.
+    metric_princ : str
+        The principal metric, the one of the benchmark if None.
+    output_directory : str
+        The directory where the reports are published, `result_directory` if
+        None, with the same iteration sub-directories as the benchmark.
+    nb_bootstrap : int
+        The number of bootstrap resamples of the confidence intervals, the
+        one of the benchmark if None.
+    nb_cores : int
+        The number of processes rendering the figures, 0 to render them in
+        the calling process.
+
+    Returns
+    -------
+    results : list
+        The test scores of the classifiers, for each metric, averaged on the
+        iterations if there are several.
+    """
+    if output_directory is None:
+        output_directory = result_directory
+    with ResultsStore(os.path.join(result_directory, "results.hdf5")) as store:
+        config = store.get_config()
+        iterations = store.iterations()
+        stats_iter = max(iterations) + 1
+        if nb_bootstrap is not None:
+            config["nb_bootstrap"] = nb_bootstrap
+        iter_results = init_iter_results(stats_iter)
+        flagged_tracebacks_list = []
+        with FigurePool(nb_cores):
+            for iter_index in iterations:
+                logging.info("Start:\t Analyzing the stored iteration "
+                             "{}".format(iter_index))
+                metrics_dict = get_metrics_dict(
+                    store.get_metrics_dict(iter_index), metrics, metric_princ)
+                arguments = get_stored_arguments(store, iter_index, config,
+                                                 output_directory,
+                                                 metrics_dict)
+                label_names = list(arguments["labels_dictionary"].values())
+                results = get_stored_results(store, iter_index, metrics_dict,
+                                             label_names)
+                sample_ids = store.get_sample_ids(iter_index) if \
+                    "sample_ids" in store.get_iteration(iter_index) else None
+                os.makedirs(arguments["directory"], exist_ok=True)
+                res, flagged_tracebacks = analyze_iteration(
+                    iter_index, results, {}, arguments, metrics_dict,
+                    sample_ids, store.get_labels(iter_index),
+                    store.get_feature_importances(iter_index), iter_results)
+                flagged_tracebacks_list += flagged_tracebacks
+                logging.info("Done:\t Analyzing the stored iteration "
+                             "{}".format(iter_index))
+            if flagged_tracebacks_list:
+                save_failed(flagged_tracebacks_list, output_directory)
+            if stats_iter > 1:
+                res = analyze_all(
+                    iter_results, stats_iter, output_directory,
+                    arguments["args"]["name"], sample_ids, label_names,
+                    max_plotted_samples=config.get("max_plotted_samples",
+                                                   2000),
+                    nb_hardest_samples=config.get("nb_hardest_samples", 100))
+    return res
+
+
+def get_metrics_dict(stored_metrics, metrics=None, metric_princ=None):
+    """
+    The metrics to compute with their configuration, the principal one being
+    marked by a "*", from the ones of the benchmark, `stored_metrics`.
+    """
+    configs = dict((metric_name.rstrip("*"), metric_kwargs)
+                   for metric_name, metric_kwargs in stored_metrics.items())
+    if metric_princ is None:
+        metric_princ = next((metric_name[:-1] for metric_name in stored_metrics
+                             if metric_name.endswith("*")), None)
+    if metrics is None:
+        metrics = list(configs)
+    if metric_princ is not None and metric_princ not in metrics:
+        raise ValueError("{} not in metric pool ({})".format(metric_princ,
+                                                             metrics))
+    return dict((metric_name + "*" if metric_name == metric_princ
+                 else metric_name, configs.get(metric_name, {}))
+                for metric_name in metrics)
+
+
+def get_stored_arguments(store, iter_index, config, output_directory,
+                         metrics_dict):
+    """The benchmark argument dictionary of a stored iteration, as needed by
+    the analysis"""
+    return {"flag": iter_index,
+            "directory": os.path.join(
+                output_directory, store.get_relative_directory(iter_index)),
+            "args": dict(config, name=store.get_database_name(iter_index)),
+            "labels_dictionary": store.get_labels_dictionary(iter_index),
+            "classification_indices": list(store.get_split(iter_index)),
+            "metrics": metrics_dict}
+
+
+def get_stored_results(store, iter_index, metrics_dict, label_names):
+    """
+    Rebuilds the MonoviewResult and MultiviewResult objects of a stored
+    iteration, without their estimators, their scores being computed from
+    their stored predictions.
+    """
+    labels = store.get_labels(iter_index)
+    classification_indices = store.get_split(iter_index)
+    durations = store.get_durations(iter_index)
+    results = []
+    for classifier_name, info, pred, duration in zip(
+            store.get_classifier_names(iter_index),
+            store.get_classifier_infos(iter_index),
+            store.get_predictions(iter_index).astype(labels.dtype),
+            durations.to_numpy()):
+        result_analyzer = ResultAnalyser(
+            None, classification_indices, None, None, metrics_dict, None,
+            label_names, pred, None, None, labels, None, None, None, None)
+        result_analyzer.get_all_metrics_scores()
+        if "view_name" in info:
+            classifier_result = MonoviewResult(
+                info["view_index"], info["classifier_name"], info["view_name"],
+                result_analyzer.metric_scores, pred, info["config"], None,
+                info["n_features"], *duration,
+                result_analyzer.class_metric_scores)
+        else:
+            classifier_result = MultiviewResult(
+                info["classifier_name"], info["config"],
+                result_analyzer.metric_scores, pred, *duration,
+                result_analyzer.class_metric_scores, None)
+        classifier_result.display_name = classifier_name
+        results.append(classifier_result)
+    return results
+
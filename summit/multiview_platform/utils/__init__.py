@@ -1 +1,16 @@
-from . import dataset, execution, hyper_parameter_search, transformations
+import importlib
+
+# The utilities are imported when first used
+_submodules = ['dataset', 'execution', 'hyper_parameter_search',
+               'transformations']
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__,
+                                                                    name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_submodules))
@@ -9,6 +9,8 @@ from sklearn.tree import DecisionTreeClassifier
 from tabulate import tabulate
 
 from summit.multiview_platform import metrics
+from .metric_engine import get_class_confusion_matrices, \
+    get_confusion_matrix, get_confusion_metric
 
 
 class BaseClassifier(BaseEstimator, ):
@@ -117,9 +119,10 @@ class BaseClassifier(BaseEstimator, ):
                             n_classes=3):
         """
         Base function to test if the classifier accepts a multiclass task.
-        It is highly recommended to overwrite it with a simple method that
-        returns True or False in the classifier's module, as it will speed up
-        the benchmark
+        It is highly recommended to declare it instead with a
+        `native_multiclass` attribute set to True or False in the
+        classifier's `__init__`, so that `get_mc_estim` does not fit the
+        classifier to find it
         """
         if int(n_samples / n_classes) < 1:
             raise ValueError(
@@ -220,6 +223,7 @@ class ResultAnalyser():
         self.metric_scores = {}
         self.class_metric_scores = {}
         self.feature_ids=feature_ids
+        self.confusion_matrices = None
 
     def get_all_metrics_scores(self, ):
         """
@@ -250,9 +254,16 @@ class ResultAnalyser():
         train_score, test_score
         """
         if not metric.endswith("*"):
-            metric_module = getattr(metrics, metric)
+            metric_name = metric
         else:
-            metric_module = getattr(metrics, metric[:-1])
+            metric_name = metric[:-1]
+        metric_module = getattr(metrics, metric_name)
+        confusion_metric = get_confusion_metric(metric_name, metric_kwargs,
+                                                self.get_confusion_labels())
+        if confusion_metric is not None:
+            return self.get_confusion_metric_score(metric_module,
+                                                   confusion_metric,
+                                                   metric_kwargs)
         class_train_scores = []
         class_test_scores = []
         for label_value in np.unique(self.labels):
@@ -277,6 +288,50 @@ class ResultAnalyser():
                                          **metric_kwargs)
         return class_train_scores, class_test_scores, train_score, test_score
 
+    def get_confusion_labels(self):
+        """The sorted labels of the train and test samples and predictions"""
+        indices = np.concatenate((self.train_indices, self.test_indices))
+        return np.union1d(self.labels[indices], self.pred[indices])
+
+    def get_confusion_matrices(self):
+        """
+        The train and test confusion matrices, over the labels given by
+        `get_confusion_labels`, counted once for all the metrics.
+        """
+        if self.confusion_matrices is None:
+            labels = self.get_confusion_labels()
+            self.confusion_matrices = tuple(
+                get_confusion_matrix(self.labels[indices], self.pred[indices],
+                                     labels)
+                for indices in [self.train_indices, self.test_indices])
+        return self.confusion_matrices
+
+    def get_confusion_metric_score(self, metric_module, confusion_metric,
+                                   metric_kwargs):
+        """
+        Get the train and test scores, overall and for each class, of a metric
+        that is derived from the confusion matrices. The score of a class
+        absent from a set is left to the metric module.
+        """
+        labels = self.get_confusion_labels()
+        class_indices = np.searchsorted(labels, np.unique(self.labels))
+        scores = []
+        for confusion in self.get_confusion_matrices():
+            class_confusions = get_class_confusion_matrices(confusion)[
+                class_indices]
+            class_scores = [float(class_score) for class_score
+                            in confusion_metric(class_confusions)]
+            for class_index, nb_samples in enumerate(
+                    class_confusions.sum(axis=(1, 2))):
+                if nb_samples == 0:
+                    class_scores[class_index] = metric_module.score(
+                        y_true=self.labels[:0], y_pred=self.pred[:0],
+                        **metric_kwargs)
+            scores.append((class_scores, float(confusion_metric(confusion))))
+        (class_train_scores, train_score), (class_test_scores, test_score) = \
+            scores
+        return class_train_scores, class_test_scores, train_score, test_score
+
     def print_metric_score(self, ):
         """
         Generates a string, formatting the metrics configuration and scores
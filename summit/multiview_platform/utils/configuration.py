@@ -51,6 +51,12 @@ def pass_default_config(log=True,
                         hps_type="Random",
                         hps_iter=1,
                         hps_kwargs={'n_iter': 10, "equivalent_draws": True},
+                        nb_bootstrap=1000,
+                        bootstrap_confidence=0.95,
+                        export_csv=False,
+                        nb_rendering_cores=0,
+                        max_plotted_samples=2000,
+                        nb_hardest_samples=100,
                         **kwargs):
     args = dict(
         (key, value) for key, value in locals().items() if key != "kwargs")
@@ -5,7 +5,6 @@ import pickle
 import time
 
 import numpy as np
-import sklearn
 
 from . import get_multiview_db as DB
 from ..utils.configuration import save_config
@@ -26,10 +25,91 @@ def parse_the_args(arguments):
                                help='Path to the hdf5 dataset or database '
                                     'folder (default: %(default)s)',
                                default='../config_files/config.yml')
+    groupStandard.add_argument('--plan', action='store_true',
+                               help='Only print the classifiers and metrics '
+                                    'of the benchmark, without importing '
+                                    'them nor loading the dataset')
     args = parser.parse_args(arguments)
     return args
 
 
+def parse_the_analysis_args(arguments):
+    """Used to parse the args of the analysis of stored results"""
+
+    parser = argparse.ArgumentParser(
+        description='This file is used to analyze again the results of a '
+                    'benchmark from the predictions stored in its '
+                    'results.hdf5 file, without training anything.',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+        fromfile_prefix_chars='@')
+    parser.add_argument('result_dir', metavar='STRING',
+                        help='Result directory of the benchmark')
+    parser.add_argument('--metrics', metavar='STRING', nargs='+',
+                        help='Metrics to compute, the ones of the benchmark '
+                             'if not set', default=None)
+    parser.add_argument('--metric_princ', metavar='STRING',
+                        help='Principal metric, the one of the benchmark if '
+                             'not set', default=None)
+    parser.add_argument('--output_dir', metavar='STRING',
+                        help='Directory where the reports are published, '
+                             'the result directory if not set', default=None)
+    parser.add_argument('--nb_bootstrap', metavar='INT', type=int,
+                        help='Number of bootstrap resamples of the confidence '
+                             'intervals, the one of the benchmark if not set',
+                        default=None)
+    parser.add_argument('--nb_cores', metavar='INT', type=int,
+                        help='Number of processes rendering the figures, 0 '
+                             'to render them in the analysis process',
+                        default=0)
+    args = parser.parse_args(arguments)
+    return args
+
+
+def get_plan(args):
+    """
+    Describes the benchmark configured by `args`, the dict given by
+    `configuration.get_the_args`, from the manifests of the classifiers and
+    the metrics, so without importing any of them.
+    """
+    from .. import metrics, monoview_classifiers, multiview_classifiers
+    names = args["name"] if isinstance(args["name"], list) else [args["name"]]
+    plan = ["Datasets : {} ({} in {})".format(", ".join(names),
+                                              args["file_type"],
+                                              args["pathf"]),
+            "Views : {}".format("all" if args["views"] is None
+                                else ", ".join(args["views"])),
+            "Statistical iterations : {}, cross-validation folds : {}, "
+            "hyper-parameter search : {}".format(args["stats_iter"],
+                                                 args["nb_folds"],
+                                                 args["hps_type"])]
+    if args["metrics"] == "all":
+        metric_names = [name for name in metrics.registry.names()
+                        if metrics.registry.get_flag(name, "in_all", True)]
+    else:
+        metric_names = list(args["metrics"])
+    plan.append("Metrics : {} (principal : {})".format(
+        ", ".join(metric_names), args["metric_princ"]))
+    for framework, registry, algos in [
+            ("monoview", monoview_classifiers.registry,
+             args["algos_monoview"]),
+            ("multiview", multiview_classifiers.registry,
+             args["algos_multiview"])]:
+        if framework not in args["type"]:
+            continue
+        names = registry.names() if algos == ["all"] else algos
+        plan.append("{} classifiers ({}) :".format(framework.capitalize(),
+                                                   len(names)))
+        for name in names:
+            if name not in registry.names():
+                plan.append("\t{} : not available".format(name))
+                continue
+            flags = registry.get_flags(name)
+            plan.append("\t{} : {}".format(name, ", ".join(
+                "{}={}".format(flag, value)
+                for flag, value in sorted(flags.items()))))
+    return "\n".join(plan)
+
+
 def init_random_state(random_state_arg, directory):
     r"""
     Used to init a random state.
@@ -197,6 +277,7 @@ def gen_splits(labels, split_ratio, stats_iter_random_states):
         For each statistical iteration a couple of numpy.ndarrays is stored with the indices for the training set and
         the ones of the testing set.
     """
+    import sklearn.model_selection
     indices = np.arange(len(labels))
     splits = []
     for random_state in stats_iter_random_states:
@@ -230,6 +311,7 @@ def gen_k_folds(stats_iter, nb_folds, stats_iter_random_states):
     folds_list : list of list of sklearn.model_selection.StratifiedKFold
         For each statistical iteration a Kfold stratified (keeping the ratio between classes in each fold).
     """
+    import sklearn.model_selection
     if stats_iter > 1:
         folds_list = []
         for random_state in stats_iter_random_states:
@@ -0,0 +1,125 @@
+import hashlib
+import json
+import sqlite3
+import time
+
+import numpy as np
+import yaml
+from scipy.sparse import issparse
+
+# Author-Info
+__author__ = "Baptiste Bauvin"
+__status__ = "Prototype"  # Production, Development, Prototype
+
+
+class HPSStudy:
+    """
+    A persistent store of the hyper-parameter search evaluations, saved in a
+    local SQLite database.
+
+    Each evaluation is identified by the fingerprint of the dataset it was
+    run on, the fingerprint of the cross-validation folds, the classifier,
+    the view set, the scoring function and the canonical form of the
+    evaluated parameters. It stores the score on each fold and the fit time,
+    so that a later search can skip the already evaluated configurations or
+    start from the best ones.
+
+    The parameters are stored in their YAML form, as in the HPS reports, so
+    the database can be inspected and does not depend on the classes of the
+    code that wrote it.
+
+    Parameters
+    ----------
+    path : str
+        The path to the SQLite file, created if it does not exist.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path, timeout=60)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS trials ("
+            "dataset TEXT, folds TEXT, classifier TEXT, views TEXT, "
+            "scoring TEXT, params_key TEXT, fold_scores TEXT, "
+            "mean_score REAL, fit_time REAL, date REAL)")
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS trials_lookup ON trials "
+            "(dataset, folds, classifier, scoring, params_key)")
+        self.connection.commit()
+
+    def get_fold_scores(self, dataset, folds, classifier, scoring,
+                        params_key):
+        """Returns the fold scores of the latest identical evaluation, or
+        None if these params have not been evaluated on these folds."""
+        row = self.connection.execute(
+            "SELECT fold_scores FROM trials WHERE dataset=? AND folds=? AND "
+            "classifier=? AND scoring=? AND params_key=? "
+            "ORDER BY date DESC LIMIT 1",
+            (dataset, folds, classifier, scoring, params_key)).fetchone()
+        if row is None:
+            return None
+        return np.array(json.loads(row[0]))
+
+    def add_trial(self, dataset, folds, classifier, views, scoring,
+                  params_key, fold_scores, fit_time):
+        self.connection.execute(
+            "INSERT INTO trials VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (dataset, folds, classifier, views, scoring, params_key,
+             json.dumps([float(score) for score in fold_scores]),
+             float(np.mean(fold_scores)), float(fit_time), time.time()))
+        self.connection.commit()
+
+    def get_top_params(self, classifier, views, scoring, top_k,
+                       dataset=None):
+        """Returns the `top_k` best distinct params evaluated for the
+        classifier on the same view set, on the `dataset` fingerprint if
+        given, else whatever the dataset version. The params that can not
+        be rebuilt from their YAML form (estimators or other objects) are
+        skipped."""
+        query = "SELECT params_key FROM trials WHERE classifier=? " \
+                "AND views=? AND scoring=? "
+        arguments = (classifier, views, scoring)
+        if dataset is not None:
+            query += "AND dataset=? "
+            arguments += (dataset,)
+        top_params = []
+        for params_key, in self.connection.execute(
+                query + "GROUP BY params_key ORDER BY MAX(mean_score) DESC",
+                arguments):
+            params = load_params(params_key)
+            if params is not None:
+                top_params.append(params)
+            if len(top_params) == top_k:
+                break
+        return top_params
+
+    def close(self):
+        self.connection.close()
+
+
+def load_params(params_key):
+    """Loads the params from their YAML form, returns None if they described
+    an estimator by its class name or held another object."""
+    try:
+        params = yaml.safe_load(params_key)
+    except yaml.YAMLError:
+        return None
+    if not isinstance(params, dict) or \
+            any("__" in param_name for param_name in params):
+        return None
+    return params
+
+
+def get_fingerprint(arrays):
+    """Hashes the content of a list of (possibly sparse) arrays"""
+    fingerprint = hashlib.sha1()
+    for array in arrays:
+        if issparse(array):
+            array = array.tocsr()
+            components = [array.data, array.indices, array.indptr]
+        else:
+            components = [np.asarray(array)]
+        for component in components:
+            fingerprint.update(str(component.shape).encode())
+            fingerprint.update(np.ascontiguousarray(component).tobytes())
+    return fingerprint.hexdigest()
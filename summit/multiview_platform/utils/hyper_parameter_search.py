@@ -11,6 +11,8 @@ from sklearn.base import clone, BaseEstimator
 from .multiclass import MultiClassWrapper
 from .organization import secure_file_path
 from .base import get_metric
+import contextlib
+import time
 import traceback
 from abc import abstractmethod
 
@@ -22,6 +24,8 @@ from sklearn.model_selection import RandomizedSearchCV, GridSearchCV, \
     ParameterGrid, ParameterSampler
 
 from .base import get_metric
+from .dataset import get_samples_views_indices
+from .hps_study import HPSStudy, get_fingerprint
 from .multiclass import MultiClassWrapper
 from .organization import secure_file_path
 
@@ -63,56 +67,63 @@ class HPSearch:
         self.get_candidate_params(X)
         base_estimator = clone(self.estimator)
         results = {}
+        candidate_rows = {}
         self.cv_results_ = dict(("param_" + param_name, []) for param_name in
                                 self.candidate_params[0].keys())
         self.cv_results_["mean_test_score"] = []
         self.cv_results_["params"] = []
         n_failed = 0
         self.tracebacks_params = []
-        for candidate_param_idx, candidate_param in enumerate(
-                self.candidate_params):
-            test_scores = np.zeros(n_splits) + 1000
-            try:
-                for fold_idx, (train_indices,
-                               test_indices) in enumerate(folds):
-                    current_estimator = clone(base_estimator)
-                    current_estimator.set_params(**candidate_param)
-                    current_estimator.fit(X, y,
-                                          train_indices=self.available_indices[
-                                              train_indices],
-                                          view_indices=self.view_indices)
-                    test_prediction = current_estimator.predict(
-                        X,
-                        self.available_indices[test_indices],
-                        view_indices=self.view_indices)
-                    test_score = self.scoring._score_func(
-                        y[self.available_indices[test_indices]],
-                        test_prediction,
-                        **self.scoring._kwargs)
-                    test_scores[fold_idx] = test_score
-                self.cv_results_['params'].append(
-                    current_estimator.get_params())
-                cross_validation_score = np.mean(test_scores)
-                self.cv_results_["mean_test_score"].append(
-                    cross_validation_score)
-                results[candidate_param_idx] = cross_validation_score
-                if cross_validation_score >= max(results.values()):
-                    self.best_params_ = self.candidate_params[
-                        candidate_param_idx]
-                    self.best_score_ = cross_validation_score
-            except BaseException:
-                if self.track_tracebacks:
-                    n_failed += 1
-                    self.tracebacks.append(traceback.format_exc())
-                    self.tracebacks_params.append(candidate_param)
-                else:
-                    raise
-        if n_failed == self.n_iter:
+        with self.get_fit_context():
+            for candidate_param_idx, candidate_param in enumerate(
+                    self.candidate_params):
+                test_scores = np.zeros(n_splits) + 1000
+                try:
+                    for fold_idx, (train_indices,
+                                   test_indices) in enumerate(folds):
+                        current_estimator = clone(base_estimator)
+                        current_estimator.set_params(**candidate_param)
+                        current_estimator.fit(X, y,
+                                              train_indices=self.available_indices[
+                                                  train_indices],
+                                              view_indices=self.view_indices)
+                        test_prediction = current_estimator.predict(
+                            X,
+                            self.available_indices[test_indices],
+                            view_indices=self.view_indices)
+                        test_score = self.score_predictions(
+                            y[self.available_indices[test_indices]],
+                            test_prediction)
+                        test_scores[fold_idx] = test_score
+                    for param_name, param_value in candidate_param.items():
+                        self.cv_results_.setdefault("param_" + param_name,
+                                                    []).append(param_value)
+                    candidate_rows[candidate_param_idx] = len(
+                        self.cv_results_['params'])
+                    self.cv_results_['params'].append(
+                        current_estimator.get_params())
+                    cross_validation_score = np.mean(test_scores)
+                    self.cv_results_["mean_test_score"].append(
+                        cross_validation_score)
+                    results[candidate_param_idx] = cross_validation_score
+                    if cross_validation_score >= max(results.values()):
+                        self.best_params_ = self.candidate_params[
+                            candidate_param_idx]
+                        self.best_score_ = cross_validation_score
+                except BaseException:
+                    if self.track_tracebacks:
+                        n_failed += 1
+                        self.tracebacks.append(traceback.format_exc())
+                        self.tracebacks_params.append(candidate_param)
+                    else:
+                        raise
+        if n_failed == len(self.candidate_params):
             raise ValueError(
                 'No fits were performed. All HP combination returned errors \n\n' + '\n'.join(
                     self.tracebacks))
         self.cv_results_["mean_test_score"] = np.array(
             self.cv_results_["mean_test_score"])
+        self.record_duplicates(candidate_rows)
         if self.refit:
             self.best_estimator_ = clone(base_estimator).set_params(
                 **self.best_params_)
@@ -120,6 +131,353 @@ class HPSearch:
         self.n_splits_ = n_splits
         return self
 
+    def fit_search(self, X, y, searched_params, search_class, groups=None,
+                   **fit_params):
+        """Fits the search with the most adapted evaluation method"""
+        if self.can_stage(searched_params):
+            return self.fit_staged(X, y, groups=groups, **fit_params)
+        elif self.can_follow_path(searched_params):
+            return self.fit_path(X, y, groups=groups, **fit_params)
+        elif self.study_path is not None:
+            return self.fit_candidates(X, y, groups=groups, **fit_params)
+        elif self.framework == "monoview":
+            search_class.fit(self, X, y=y, groups=groups, **fit_params)
+            self.record_duplicates(dict(
+                (candidate_index, candidate_index) for candidate_index
+                in range(len(self.cv_results_["params"]))))
+            return self
+        elif self.framework == "multiview":
+            return self.fit_multiview(X, y=y, groups=groups, **fit_params)
+
+    def can_stage(self, searched_params):
+        """Checks if the search can be evaluated with one staged fit per
+        fold : the estimator must expose ``staged_predict`` and
+        ``n_estimators`` must be one of the searched hyper-parameters."""
+        return self.staged_eval and "n_estimators" in searched_params and \
+            hasattr(self.estimator, "staged_predict")
+
+    def can_follow_path(self, searched_params):
+        """Checks if the search can be evaluated along a warm-started
+        regularisation path : the estimator must declare its ``path_param``
+        and this parameter must be searched."""
+        return self.path_eval and self.framework == "monoview" and \
+            hasattr(self.estimator, "path_param") and \
+            self.estimator.path_param in searched_params
+
+    def fit_staged(self, X, y, groups=None, **fit_params):
+        """Evaluates the candidates that differ only by their
+        ``n_estimators`` value with a single fit per fold, using the largest
+        value of the group, and scores each candidate on the corresponding
+        stage of ``staged_predict``."""
+        return self.fit_grouped(X, y, "n_estimators", self.score_staged_group,
+                                groups=groups, **fit_params)
+
+    def fit_path(self, X, y, groups=None, **fit_params):
+        """Evaluates the candidates that differ only by their regularisation
+        value along a path, each fit being warm-started from the previous
+        one on the same fold."""
+        return self.fit_grouped(X, y, self.estimator.path_param,
+                                self.score_path_group, groups=groups,
+                                **fit_params)
+
+    def fit_candidates(self, X, y, groups=None, **fit_params):
+        """Evaluates each distinct candidate with one fit per fold."""
+        return self.fit_grouped(X, y, None, self.score_candidate_group,
+                                groups=groups, **fit_params)
+
+    def fit_grouped(self, X, y, grouped_param, score_group, groups=None,
+                    **fit_params):
+        """Evaluates the candidates by groups sharing all their
+        hyper-parameters except `grouped_param`, `score_group` returning the
+        test scores of a group of candidates on each fold."""
+        folds = self.get_folds(X, y, groups)
+        self.open_study(X, y, folds)
+        self.get_candidate_params(X)
+        self.seed_candidate_params()
+        base_estimator = clone(self.estimator)
+        test_scores = np.zeros((len(self.candidate_params), len(folds))) + 1000
+        failed = np.zeros(len(self.candidate_params), dtype=bool)
+        self.tracebacks_params = []
+        try:
+            with self.get_fit_context():
+                for group in self.group_candidates(grouped_param):
+                    known_scores = self.get_known_scores(group)
+                    if known_scores is not None:
+                        test_scores[group] = known_scores
+                        continue
+                    try:
+                        fit_begin = time.monotonic()
+                        test_scores[group] = score_group(base_estimator, X, y,
+                                                         folds, group)
+                        self.add_trials(group, test_scores[group],
+                                        (time.monotonic() - fit_begin) /
+                                        len(group))
+                    except BaseException:
+                        if self.track_tracebacks:
+                            failed[group] = True
+                            self.tracebacks.append(traceback.format_exc())
+                            self.tracebacks_params.append(
+                                self.candidate_params[group[-1]])
+                        else:
+                            raise
+        finally:
+            if self.study_ is not None:
+                self.study_.close()
+        if failed.all():
+            raise ValueError(
+                'No fits were performed. All HP combination returned errors \n\n' + '\n'.join(
+                    self.tracebacks))
+        self.cv_results_ = dict(("param_" + param_name, []) for param_name in
+                                self.candidate_params[0].keys())
+        self.cv_results_["mean_test_score"] = []
+        self.cv_results_["params"] = []
+        for candidate_index in np.where(np.logical_not(failed))[0]:
+            candidate_param = self.candidate_params[candidate_index]
+            for param_name, param_value in candidate_param.items():
+                self.cv_results_.setdefault("param_" + param_name,
+                                            []).append(param_value)
+            self.cv_results_["params"].append(candidate_param)
+            self.cv_results_["mean_test_score"].append(
+                np.mean(test_scores[candidate_index]))
+        self.cv_results_["mean_test_score"] = np.array(
+            self.cv_results_["mean_test_score"])
+        self.record_duplicates(
+            dict((candidate_index, row) for row, candidate_index
+                 in enumerate(np.where(np.logical_not(failed))[0])))
+        best_index = np.argmax(self.cv_results_["mean_test_score"])
+        self.best_params_ = self.cv_results_["params"][best_index]
+        self.best_score_ = self.cv_results_["mean_test_score"][best_index]
+        if self.refit:
+            self.best_estimator_ = clone(base_estimator)
+            self.best_estimator_.set_params(**self.best_params_)
+            self.best_estimator_.fit(X, y, **fit_params)
+        self.n_splits_ = len(folds)
+        return self
+
+    def group_candidates(self, grouped_param):
+        """Groups the indices of the candidates that share all their
+        hyper-parameters except `grouped_param`."""
+        groups = {}
+        for candidate_index, candidate_param in enumerate(
+                self.candidate_params):
+            shared_params = dict((param_name, param_value)
+                                 for param_name, param_value
+                                 in candidate_param.items()
+                                 if param_name != grouped_param)
+            groups.setdefault(get_params_key(shared_params),
+                              []).append(candidate_index)
+        return list(groups.values())
+
+    def open_study(self, X, y, folds):
+        """Opens the study store, if any, and identifies the current search
+        by the fingerprints of the dataset and of the folds, and by the
+        searched views, `view_name` for the monoview framework."""
+        if self.study_path is None:
+            self.study_ = None
+            return
+        self.study_ = HPSStudy(self.study_path)
+        if self.framework == "multiview":
+            sample_indices, view_indices = get_samples_views_indices(
+                X, self.available_indices, self.view_indices)
+            dataset = get_fingerprint(
+                [X.get_v(view_index, sample_indices)
+                 for view_index in view_indices] + [y[sample_indices]])
+            views = ",".join(X.get_view_name(view_index)
+                             for view_index in view_indices)
+        else:
+            dataset = get_fingerprint([X, y])
+            views = self.view_name if self.view_name is not None else ""
+        if isinstance(self.estimator, MultiClassWrapper):
+            classifier = self.estimator.estimator.__class__.__name__
+        else:
+            classifier = self.estimator.__class__.__name__
+        self.study_context_ = {
+            "dataset": dataset,
+            "folds": get_fingerprint([indices for fold in folds
+                                      for indices in fold]),
+            "classifier": classifier,
+            "views": views,
+            "scoring": "{}{}".format(self.scoring._score_func.__name__,
+                                     get_params_key(self.scoring._kwargs))}
+
+    def seed_candidate_params(self):
+        """Adds the best configurations of the previous studies to the
+        candidates. As the view names of the monoview searches are not
+        specific to a dataset, these are only seeded by the studies on the
+        same data."""
+        if self.study_ is None or not self.study_seed_top_k:
+            return
+        self.candidate_params += self.study_.get_top_params(
+            self.study_context_["classifier"], self.study_context_["views"],
+            self.study_context_["scoring"], self.study_seed_top_k,
+            dataset=self.study_context_["dataset"]
+            if self.framework == "monoview" else None)
+
+    def record_duplicates(self, candidate_rows):
+        """Adds the duplicated draws to `cv_results_` as copies of the row of
+        the candidate they duplicate, as they were not refitted.
+        `candidate_rows` maps the index of each evaluated candidate to its
+        row, and `cv_results_["duplicate_of"]` gives the row duplicated by
+        each entry (-1 for the evaluated ones)."""
+        duplicate_params = getattr(self, "duplicate_params", [])
+        if not duplicate_params:
+            return
+        nb_rows = len(self.cv_results_["params"])
+        duplicates = [(candidate_param, candidate_rows[candidate_index])
+                      for candidate_param, candidate_index in duplicate_params
+                      if candidate_index in candidate_rows]
+        rows = [row for _, row in duplicates]
+        for key, values in list(self.cv_results_.items()):
+            if len(values) != nb_rows:
+                continue
+            if key == "params":
+                values.extend(candidate_param
+                              for candidate_param, _ in duplicates)
+            elif isinstance(values, list):
+                values.extend([values[row] for row in rows])
+            else:
+                self.cv_results_[key] = values[
+                    np.concatenate([np.arange(nb_rows), rows]).astype(int)]
+        self.cv_results_["duplicate_of"] = [-1] * nb_rows + rows
+
+    def get_known_scores(self, group):
+        """Returns the stored fold scores of a group of candidates if all of
+        them have already been evaluated on the same data and folds."""
+        if self.study_ is None or not self.study_skip_known:
+            return None
+        known_scores = [self.study_.get_fold_scores(
+            self.study_context_["dataset"], self.study_context_["folds"],
+            self.study_context_["classifier"], self.study_context_["scoring"],
+            get_params_key(self.candidate_params[candidate_index]))
+            for candidate_index in group]
+        if any(fold_scores is None for fold_scores in known_scores):
+            return None
+        return np.array(known_scores)
+
+    def add_trials(self, group, group_scores, fit_time):
+        if self.study_ is None:
+            return
+        for candidate_index, fold_scores in zip(group, group_scores):
+            candidate_param = self.candidate_params[candidate_index]
+            self.study_.add_trial(
+                params_key=get_params_key(candidate_param),
+                fold_scores=fold_scores, fit_time=fit_time,
+                **self.study_context_)
+
+    def score_candidate_group(self, base_estimator, X, y, folds, group):
+        """All the candidates of the group are identical, so they are
+        evaluated only once."""
+        scores = np.zeros((len(group), len(folds)))
+        for fold_idx, (train_indices, test_indices) in enumerate(folds):
+            estimator = clone(base_estimator)
+            estimator.set_params(**self.candidate_params[group[0]])
+            self.fit_fold(estimator, X, y, train_indices)
+            scores[:, fold_idx] = self.score_predictions(
+                y[test_indices], self.predict_fold(estimator, X, test_indices))
+        return scores
+
+    def score_staged_group(self, base_estimator, X, y, folds, group):
+        stages = np.array([self.candidate_params[candidate_index]["n_estimators"]
+                           for candidate_index in group])
+        longest_param = self.candidate_params[group[np.argmax(stages)]]
+        scores = np.zeros((len(group), len(folds)))
+        for fold_idx, (train_indices, test_indices) in enumerate(folds):
+            estimator = clone(base_estimator)
+            estimator.set_params(**longest_param)
+            self.fit_fold(estimator, X, y, train_indices)
+            if hasattr(estimator, "staged_predict"):
+                scores[:, fold_idx] = self.score_stages(estimator, X, y,
+                                                        test_indices, stages)
+            else:
+                # The fitted estimator may have been wrapped (for multiclass
+                # for example) and lost its staged predictions.
+                for position, candidate_index in enumerate(group):
+                    estimator = clone(base_estimator)
+                    estimator.set_params(
+                        **self.candidate_params[candidate_index])
+                    self.fit_fold(estimator, X, y, train_indices)
+                    scores[position, fold_idx] = self.score_predictions(
+                        y[test_indices],
+                        self.predict_fold(estimator, X, test_indices))
+        return scores
+
+    def score_path_group(self, base_estimator, X, y, folds, group):
+        path_param = base_estimator.path_param
+        path_values = [self.candidate_params[candidate_index][path_param]
+                       for candidate_index in group]
+        scores = np.zeros((len(group), len(folds)))
+        for fold_idx, (train_indices, test_indices) in enumerate(folds):
+            estimator = clone(base_estimator)
+            estimator.set_params(**self.candidate_params[group[0]])
+            path_predictions = estimator.path_predict(X[train_indices],
+                                                      y[train_indices],
+                                                      X[test_indices],
+                                                      path_values)
+            for position, test_prediction in enumerate(path_predictions):
+                scores[position, fold_idx] = self.score_predictions(
+                    y[test_indices], test_prediction)
+        return scores
+
+    def score_stages(self, estimator, X, y, test_indices, stages):
+        """Scores the staged predictions of a fitted estimator for each asked
+        stage. If the boosting process stopped early, the stages after the
+        last one are scored with its predictions, as a full fit would."""
+        scores = np.zeros(len(stages))
+        scored = np.zeros(len(stages), dtype=bool)
+        for stage, test_prediction in enumerate(
+                self.predict_fold(estimator, X, test_indices, staged=True),
+                start=1):
+            stage_mask = stages == stage
+            if stage_mask.any():
+                scores[stage_mask] = self.score_predictions(
+                    y[test_indices], test_prediction)
+                scored[stage_mask] = True
+        if not scored.all():
+            scores[np.logical_not(scored)] = self.score_predictions(
+                y[test_indices], test_prediction)
+        return scores
+
+    def get_folds(self, X, y, groups=None):
+        if self.framework == "multiview":
+            return [(self.available_indices[train_indices],
+                     self.available_indices[test_indices])
+                    for train_indices, test_indices
+                    in self.cv.split(self.available_indices,
+                                     y[self.available_indices])]
+        else:
+            return list(self.cv.split(X, y, groups))
+
+    def fit_fold(self, estimator, X, y, train_indices):
+        if self.framework == "multiview":
+            estimator.fit(X, y, train_indices=train_indices,
+                          view_indices=self.view_indices)
+        else:
+            estimator.fit(X[train_indices], y[train_indices])
+
+    def predict_fold(self, estimator, X, test_indices, staged=False):
+        if staged:
+            predict = estimator.staged_predict
+        else:
+            predict = estimator.predict
+        if self.framework == "multiview":
+            return predict(X, test_indices, view_indices=self.view_indices)
+        else:
+            return predict(X[test_indices])
+
+    def score_predictions(self, y_true, y_pred):
+        """Scores the predictions with the sign of the scorer, so that the
+        greatest score is always the best one."""
+        return self.scoring._sign * self.scoring._score_func(
+            y_true, y_pred, **self.scoring._kwargs)
+
+    def get_fit_context(self):
+        """Context shared by the estimator between all the fits of a
+        multiview search run, if it defines one."""
+        if self.framework == "multiview" and hasattr(self.estimator,
+                                                     "get_hps_context"):
+            return self.estimator.get_hps_context()
+        return contextlib.nullcontext()
+
     @abstractmethod
     def get_candidate_params(self, X):  # pragma: no cover
         raise NotImplementedError
@@ -131,16 +489,25 @@ class HPSearch:
         return best_params
 
     def gen_report(self, output_file_name):
+        """Writes the evaluated candidates sorted by score, each one once,
+        with the number of times it was drawn if it was duplicated."""
         scores_array = self.cv_results_['mean_test_score']
-        sorted_indices = np.argsort(-scores_array)
-        tested_params = [self.cv_results_["params"][score_index]
-                         for score_index in sorted_indices]
-        scores_array = scores_array[sorted_indices]
+        duplicate_of = np.array(self.cv_results_.get(
+            "duplicate_of", [-1] * len(scores_array)), dtype=int)
+        nb_draws = 1 + np.bincount(duplicate_of[duplicate_of >= 0],
+                                   minlength=len(scores_array))
+        sorted_indices = [score_index for score_index
+                          in np.argsort(-scores_array, kind="stable")
+                          if duplicate_of[score_index] == -1]
         output_string = ""
-        for parameters, score in zip(tested_params, scores_array):
-            formatted_params = format_params(parameters)
+        for score_index in sorted_indices:
+            formatted_params = format_params(
+                self.cv_results_["params"][score_index])
             output_string += "\n{}\n\t\t{}".format(yaml.dump(formatted_params),
-                                                   score)
+                                                   scores_array[score_index])
+            if nb_draws[score_index] > 1:
+                output_string += "\n\t\tdrawn {} times".format(
+                    nb_draws[score_index])
         if self.tracebacks:
             output_string += "Failed : \n\n\n"
             for traceback, params in zip(self.tracebacks,
@@ -157,7 +524,9 @@ class Random(RandomizedSearchCV, HPSearch):
                  refit=False, n_jobs=1, scoring=None, cv=None,  available_indices=None,
                  random_state=None, view_indices=None,
                  framework="monoview",
-                 equivalent_draws=True, track_tracebacks=True):
+                 equivalent_draws=True, track_tracebacks=True,
+                 staged_eval=True, path_eval=False, study_path=None,
+                 study_skip_known=True, study_seed_top_k=0, view_name=None):
         param_distributions = self.get_param_distribs(estimator, param_distributions)
 
 
@@ -171,6 +540,12 @@ class Random(RandomizedSearchCV, HPSearch):
         self.view_indices = view_indices
         self.equivalent_draws = equivalent_draws
         self.track_tracebacks = track_tracebacks
+        self.staged_eval = staged_eval
+        self.path_eval = path_eval
+        self.study_path = study_path
+        self.study_skip_known = study_skip_known
+        self.study_seed_top_k = study_seed_top_k
+        self.view_name = view_name
         self.tracebacks = []
 
     def translate_uniform(self, args):
@@ -191,20 +566,44 @@ class Random(RandomizedSearchCV, HPSearch):
         return base_distribs
 
     def fit(self, X, y=None, groups=None, **fit_params):  # pragma: no cover
-        if self.framework == "monoview":
-            return RandomizedSearchCV.fit(self, X, y=y, groups=groups,
-                                          **fit_params)
+        return HPSearch.fit_search(self, X, y, self.param_distributions,
+                                   RandomizedSearchCV, groups=groups,
+                                   **fit_params)
 
-        elif self.framework == "multiview":
-            return HPSearch.fit_multiview(self, X, y=y, groups=groups,
-                                          **fit_params)
+    def _run_search(self, evaluate_candidates):
+        self.get_candidate_params(None)
+        evaluate_candidates(self.candidate_params)
 
     def get_candidate_params(self, X):
-        if self.equivalent_draws:
+        """Draws `n_iter` distinct candidates. The duplicated draws are
+        stored in `duplicate_params` with the index of the candidate they
+        duplicate and replaced by fresh draws."""
+        if self.equivalent_draws and self.framework == "multiview":
             self.n_iter = self.n_iter * X.nb_view
-        self.candidate_params = list(
-            ParameterSampler(self.param_distributions, self.n_iter,
-                             random_state=self.random_state))
+        self.duplicate_params = []
+        if all(isinstance(distrib, list)
+               for distrib in self.param_distributions.values()):
+            # ParameterSampler already samples lists without replacement.
+            self.candidate_params = list(
+                ParameterSampler(self.param_distributions, self.n_iter,
+                                 random_state=self.random_state))
+            return
+        self.candidate_params = []
+        candidate_indices = {}
+        # The number of draws is bounded, in case the space of parameters is
+        # smaller than n_iter.
+        for candidate_param in ParameterSampler(self.param_distributions,
+                                                10 * self.n_iter,
+                                                random_state=self.random_state):
+            params_key = get_params_key(candidate_param)
+            if params_key in candidate_indices:
+                self.duplicate_params.append(
+                    (candidate_param, candidate_indices[params_key]))
+            else:
+                candidate_indices[params_key] = len(self.candidate_params)
+                self.candidate_params.append(candidate_param)
+                if len(self.candidate_params) == self.n_iter:
+                    break
 
 
 
@@ -213,7 +612,9 @@ class Grid(GridSearchCV, HPSearch):
     def __init__(self, estimator, param_grid={}, refit=False, n_jobs=1,
                  scoring=None, cv=None,
                  available_indices=None, view_indices=None, framework="monoview",
-                 random_state=None, track_tracebacks=True):
+                 random_state=None, track_tracebacks=True, staged_eval=True,
+                 path_eval=False, study_path=None, study_skip_known=True,
+                 study_seed_top_k=0, view_name=None):
         scoring = HPSearch.get_scoring(self, scoring)
         GridSearchCV.__init__(self, estimator, param_grid, scoring=scoring,
                               n_jobs=n_jobs, refit=refit,
@@ -222,15 +623,17 @@ class Grid(GridSearchCV, HPSearch):
         self.available_indices = available_indices
         self.view_indices = view_indices
         self.track_tracebacks = track_tracebacks
+        self.staged_eval = staged_eval
+        self.path_eval = path_eval
+        self.study_path = study_path
+        self.study_skip_known = study_skip_known
+        self.study_seed_top_k = study_seed_top_k
+        self.view_name = view_name
         self.tracebacks = []
 
     def fit(self, X, y=None, groups=None, **fit_params):
-        if self.framework == "monoview":
-            return GridSearchCV.fit(self, X, y=y, groups=groups,
-                                    **fit_params)
-        elif self.framework == "multiview":
-            return HPSearch.fit_multiview(self, X, y=y, groups=groups,
-                                          **fit_params)
+        return HPSearch.fit_search(self, X, y, self.param_grid, GridSearchCV,
+                                   groups=groups, **fit_params)
 
     def get_candidate_params(self, X):
         self.candidate_params = list(ParameterGrid(self.param_grid))
@@ -283,6 +686,12 @@ class CustomUniform(CustomDist):
 
 
 
+def get_params_key(params):
+    """Canonical string describing a set of params, estimator-valued params
+    being described by their class name and their own params."""
+    return yaml.dump(format_params(params))
+
+
 def format_params(params, pref=""):
     if isinstance(params, dict):
         dictionary = {}
@@ -0,0 +1,261 @@
+import numpy as np
+
+# Author-Info
+__author__ = "Baptiste Bauvin"
+__status__ = "Prototype"  # Production, Development, Prototype
+
+
+def get_confusion_matrix(y_true, y_pred, labels):
+    """
+    Counts the confusion matrix of the predictions with a single
+    `np.bincount`.
+
+    Parameters
+    ----------
+    y_true : np.array, shape (n_samples,)
+        The real labels.
+    y_pred : np.array, shape (n_samples,)
+        The predicted labels.
+    labels : np.array, shape (n_labels,)
+        The sorted labels, containing all the ones of `y_true` and `y_pred`.
+
+    Returns
+    -------
+    confusion : np.array of int, shape (n_labels, n_labels)
+        The number of samples of each real label (rows) predicted as each
+        label (columns).
+    """
+    nb_labels = len(labels)
+    true_indices = np.searchsorted(labels, y_true)
+    pred_indices = np.searchsorted(labels, y_pred)
+    return np.bincount(true_indices * nb_labels + pred_indices,
+                       minlength=nb_labels * nb_labels).reshape(nb_labels,
+                                                                nb_labels)
+
+
+def get_class_confusion_matrices(confusion):
+    """
+    Stacks, for each label, the confusion matrix of the samples of this label
+    only, that is the matrix keeping only its row of `confusion`.
+
+    Returns an array of shape (..., n_labels, n_labels, n_labels) for
+    confusion matrices of shape (..., n_labels, n_labels).
+    """
+    nb_labels = confusion.shape[-1]
+    rows = np.eye(nb_labels, dtype=confusion.dtype)[:, :, np.newaxis]
+    return rows * confusion[..., np.newaxis, :, :]
+
+
+def get_confusion_metric(metric_name, metric_kwargs, labels):
+    """
+    Returns a function computing the score of the metric of the `metrics`
+    package from confusion matrices of any shape (..., n_labels, n_labels),
+    with the same result as the metric's `score` on the samples they count,
+    or None if the metric, with these arguments, can not be derived from a
+    confusion matrix.
+    """
+    if metric_name not in CONFUSION_METRICS:
+        return None
+    return CONFUSION_METRICS[metric_name](np.asarray(labels),
+                                          **metric_kwargs)
+
+
+def get_sums(confusion):
+    """The true positives, predicted and real counts of each label"""
+    true_positives = np.diagonal(confusion, axis1=-2, axis2=-1)
+    return (true_positives.astype(float), confusion.sum(axis=-2).astype(float),
+            confusion.sum(axis=-1).astype(float))
+
+
+def divide(numerator, denominator, zero_division):
+    """Divides, setting the `zero_division` value where the denominator is
+    null, as sklearn does"""
+    null = denominator == 0
+    result = numerator / np.where(null, 1, denominator)
+    return np.where(null, get_zero_division_value(zero_division), result)
+
+
+def get_zero_division_value(zero_division):
+    if isinstance(zero_division, str) and zero_division == "warn":
+        return 0.0
+    elif isinstance(zero_division, (int, float)) and zero_division in [0, 1]:
+        return float(zero_division)
+    else:
+        return np.nan
+
+
+def average_scores(scores, present, weights):
+    """
+    Averages the per-label scores over the labels present in the samples,
+    ignoring the NaNs, and weighting them by `weights` if they are not all
+    null.
+    """
+    valid = present & ~np.isnan(scores)
+    scores = np.where(valid, scores, 0)
+    if weights is None:
+        weights = np.ones(scores.shape)
+    weights = np.where(valid, weights, 0)
+    weights_sum = weights.sum(axis=-1)
+    # When all the weights are null, the scores are simply averaged.
+    weights = np.where(weights_sum[..., np.newaxis] == 0, valid, weights)
+    weights_sum = weights.sum(axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(weights_sum == 0, np.nan,
+                        (scores * weights).sum(axis=-1) / weights_sum)
+
+
+def get_set_wise_counts(labels, average, pos_label):
+    """
+    Returns a function giving, for confusion matrices, the (true positives,
+    predicted, real) counts on which a set-wise metric (precision, recall,
+    F-beta, jaccard) is computed and the (present labels, weights) arguments
+    of `average_scores` if the scores of the labels are averaged, or None if
+    the average can not be derived from a confusion matrix.
+    """
+    if average == "binary":
+        if len(labels) > 2 or pos_label not in labels:
+            return None
+        pos_index = int(np.searchsorted(labels, pos_label))
+
+        def counts(confusion):
+            sums = get_sums(confusion)
+            return tuple(sum_[..., pos_index:pos_index + 1]
+                         for sum_ in sums), None
+    elif average == "micro":
+        def counts(confusion):
+            sums = get_sums(confusion)
+            return tuple(sum_.sum(axis=-1, keepdims=True)
+                         for sum_ in sums), None
+    elif average in ["macro", "weighted"]:
+        def counts(confusion):
+            sums = get_sums(confusion)
+            present = (sums[1] + sums[2]) > 0
+            weights = sums[2] if average == "weighted" else None
+            return sums, (present, weights)
+    else:
+        return None
+    return counts
+
+
+def reduce_scores(scores, average_args):
+    if average_args is None:
+        return scores[..., 0]
+    return average_scores(scores, *average_args)
+
+
+def accuracy(confusion):
+    """The accuracy score of confusion matrices"""
+    true_positives, _, true_sums = get_sums(confusion)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return true_positives.sum(axis=-1) / true_sums.sum(axis=-1)
+
+
+def accuracy_score(label_values, multiclass=False, normalize=True, **kwargs):
+    if kwargs or not normalize:
+        return None
+    return accuracy
+
+
+def zero_one_loss(label_values, multiclass=False, normalize=True, **kwargs):
+    if kwargs or not normalize:
+        return None
+    return lambda confusion: 1 - accuracy(confusion)
+
+
+def hamming_loss(label_values, multiclass=False, **kwargs):
+    if kwargs:
+        return None
+    return lambda confusion: 1 - accuracy(confusion)
+
+
+def set_wise_score(label_values, output, beta=1.0, average="micro",
+                   multiclass=False, pos_label=1, zero_division="warn",
+                   **kwargs):
+    """The precision, recall or F-beta `output` score, as sklearn's
+    precision_recall_fscore_support computes it"""
+    counts = get_set_wise_counts(label_values, average, pos_label)
+    if counts is None or kwargs:
+        return None
+    beta2 = beta ** 2
+
+    def score(confusion):
+        (true_positives, pred_sums, true_sums), average_args = counts(
+            confusion)
+        precision = divide(true_positives, pred_sums, zero_division)
+        recall = divide(true_positives, true_sums, zero_division)
+        if output == "precision":
+            return reduce_scores(precision, average_args)
+        elif output == "recall":
+            return reduce_scores(recall, average_args)
+        if np.isposinf(beta):
+            f_score = recall
+        elif beta == 0:
+            f_score = precision
+        else:
+            denominator = beta2 * precision + recall
+            null = np.isclose(denominator, 0) | np.isclose(
+                pred_sums + true_sums, 0)
+            f_score = np.where(
+                null, get_zero_division_value(zero_division),
+                (1 + beta2) * precision * recall / np.where(null, 1,
+                                                            denominator))
+        return reduce_scores(f_score, average_args)
+    return score
+
+
+def fbeta_score(label_values, beta=2.0, **kwargs):
+    return set_wise_score(label_values, "f-score", beta=beta, **kwargs)
+
+
+def f1_score(label_values, **kwargs):
+    return set_wise_score(label_values, "f-score", **kwargs)
+
+
+def precision_score(label_values, **kwargs):
+    return set_wise_score(label_values, "precision", **kwargs)
+
+
+def recall_score(label_values, **kwargs):
+    return set_wise_score(label_values, "recall", **kwargs)
+
+
+def jaccard_score(label_values, average="binary", multiclass=False, pos_label=1,
+                  zero_division="warn", **kwargs):
+    counts = get_set_wise_counts(label_values, average, pos_label)
+    if counts is None or kwargs:
+        return None
+
+    def score(confusion):
+        (true_positives, pred_sums, true_sums), average_args = counts(
+            confusion)
+        return reduce_scores(
+            divide(true_positives, pred_sums + true_sums - true_positives,
+                   zero_division), average_args)
+    return score
+
+
+def matthews_corrcoef(label_values, **kwargs):
+    # The module's score ignores its keyword arguments.
+    def score(confusion):
+        true_positives, pred_sums, true_sums = get_sums(confusion)
+        nb_samples = pred_sums.sum(axis=-1)
+        cov_ytyp = true_positives.sum(axis=-1) * nb_samples - np.sum(
+            true_sums * pred_sums, axis=-1)
+        cov_ypyp = nb_samples ** 2 - np.sum(pred_sums * pred_sums, axis=-1)
+        cov_ytyt = nb_samples ** 2 - np.sum(true_sums * true_sums, axis=-1)
+        null = cov_ypyp * cov_ytyt == 0
+        return np.where(null, 0.0,
+                        cov_ytyp / np.sqrt(np.where(null, 1,
+                                                    cov_ytyt * cov_ypyp)))
+    return score
+
+
+CONFUSION_METRICS = {"accuracy_score": accuracy_score,
+                     "f1_score": f1_score,
+                     "fbeta_score": fbeta_score,
+                     "hamming_loss": hamming_loss,
+                     "jaccard_score": jaccard_score,
+                     "matthews_corrcoef": matthews_corrcoef,
+                     "precision_score": precision_score,
+                     "recall_score": recall_score,
+                     "zero_one_loss": zero_one_loss, }
@@ -0,0 +1,82 @@
+import numpy as np
+
+from .hyper_parameter_search import get_params_key
+from .multiclass import MultiClassWrapper
+
+# Author-Info
+__author__ = "Baptiste Bauvin"
+__status__ = "Prototype"  # Production, Development, Prototype
+
+
+class ModelRegistry:
+    """
+    Registry of the monoview estimators fitted during the monoview phase of a
+    benchmark, with their hyper-parameter search chosen config and their
+    train and test predictions, so that the fusion classifiers of the
+    multiview phase reuse them instead of refitting the same classifier on
+    the same view and train samples.
+
+    The estimators are keyed by (classifier name, estimator class, estimator
+    params, view index, train samples), the params of a multiclass wrapper
+    being the ones of the estimator it wraps, without the RandomState
+    objects, and their predictions by (method, samples). The registry is
+    active while used as a context manager.
+    """
+    active = None
+
+    def __init__(self):
+        self.models = {}
+        self.predictions = {}
+
+    def __enter__(self):
+        ModelRegistry.active = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        ModelRegistry.active = None
+        self.models = {}
+        self.predictions = {}
+
+    @staticmethod
+    def get_key(classifier_name, estimator, view_index, train_indices):
+        """Key of an unfitted estimator, to be computed before fitting it."""
+        if isinstance(estimator, MultiClassWrapper):
+            params = estimator.estimator.get_params()
+        else:
+            params = estimator.get_params()
+        return (classifier_name, estimator.__class__.__name__,
+                get_params_key(params), int(view_index),
+                np.asarray(train_indices, dtype=int).tobytes())
+
+    def add(self, key, estimator, config=None, predictions=None):
+        """
+        Registers a fitted estimator.
+
+        Parameters
+        ----------
+        key : tuple
+            The key given by `get_key` for the estimator before its fit.
+        estimator : fitted estimator
+        config : dict
+            The config chosen by the hyper-parameter search.
+        predictions : list
+            The (samples, predictions) couples of the estimator's `predict`.
+        """
+        self.models[key] = {"estimator": estimator, "config": config}
+        self.predictions[id(estimator)] = dict(
+            (("predict", np.asarray(sample_indices, dtype=int).tobytes()),
+             prediction)
+            for sample_indices, prediction in predictions or [])
+
+    def get_estimator(self, key):
+        """Returns the registered fitted estimator, or None"""
+        model = self.models.get(key)
+        if model is None:
+            return None
+        return model["estimator"]
+
+    def get_predictions(self, estimator, method, sample_indices):
+        """Returns the registered output of `method` of the fitted estimator
+        on the samples, or None"""
+        return self.predictions.get(id(estimator), {}).get(
+            (method, np.asarray(sample_indices, dtype=int).tobytes()))
@@ -2,6 +2,7 @@ import array
 
 import numpy as np
 import scipy.sparse as sp
+from joblib import Parallel, delayed
 from sklearn.base import clone, is_classifier, is_regressor
 from sklearn.multiclass import OneVsOneClassifier, OneVsRestClassifier
 from sklearn.multiclass import _ovr_decision_function
@@ -9,9 +10,12 @@ from sklearn.preprocessing import LabelBinarizer
 
 from .dataset import get_samples_views_indices
 
+# The probed multiclass support, by (class, params) of the estimators
+MULTICLASS_CAPABILITIES = {}
+
 
 def get_mc_estim(estimator, random_state, y=None, multiview=False,
-                 multiclass=False):
+                 multiclass=False, n_jobs=None):
     r"""Used to get a multiclass-compatible estimator if the one in param does not natively support multiclass.
     If perdict_proba is available in the asked estimator, a One Versus Rest wrapper is returned,
     else, a One Versus One wrapper is returned.
@@ -28,6 +32,9 @@ def get_mc_estim(estimator, random_state, y=None, multiview=False,
         The random state, used to generate a fake multiclass problem
     multiview : bool
         If True, mutliview-compatible wrappers are returned.
+    n_jobs : int or None
+        The number of threads used by the multiview wrappers to fit and
+        predict their binary problems.
 
     Returns
     -------
@@ -35,20 +42,39 @@ def get_mc_estim(estimator, random_state, y=None, multiview=False,
         Either the aksed estimator, or a multiclass-compatible wrapper over the asked estimator
     """
     if (y is not None and np.unique(y).shape[0] > 2) or multiclass:
-        if not clone(estimator).accepts_multi_class(random_state):
+        if not accepts_multi_class(estimator, random_state):
             if hasattr(estimator, "predict_proba"):
                 if multiview:
-                    estimator = MultiviewOVRWrapper(estimator)
+                    estimator = MultiviewOVRWrapper(estimator, n_jobs=n_jobs)
                 else:
                     estimator = OVRWrapper(estimator)
             else:
                 if multiview:
-                    estimator = MultiviewOVOWrapper(estimator)
+                    estimator = MultiviewOVOWrapper(estimator, n_jobs=n_jobs)
                 else:
                     estimator = OVOWrapper(estimator)
     return estimator
 
 
+def accepts_multi_class(estimator, random_state):
+    """
+    Whether the estimator natively supports multiclass problems, as declared
+    by its `native_multiclass` attribute. If it is not declared, it is found
+    by fitting a clone of the estimator on a fake multiclass problem, once for
+    each class and params.
+    """
+    declared = getattr(estimator, "native_multiclass", None)
+    if declared is not None:
+        return declared
+    # Imported here as hyper_parameter_search imports this module
+    from .hyper_parameter_search import get_params_key
+    key = (estimator.__class__, get_params_key(estimator.get_params()))
+    if key not in MULTICLASS_CAPABILITIES:
+        MULTICLASS_CAPABILITIES[key] = clone(estimator).accepts_multi_class(
+            random_state)
+    return MULTICLASS_CAPABILITIES[key]
+
+
 class MultiClassWrapper:
 
     # TODO : Has an effect on the init of the sub-classes.
@@ -160,16 +186,15 @@ class MultiviewOVRWrapper(MultiviewWrapper, OneVsRestClassifier):
         Y = Y.tocsc()
         self.classes_ = self.label_binarizer_.classes_
         columns = (col.toarray().ravel() for col in Y.T)
-        # In cases where individual estimators are very fast to train setting
-        # n_jobs > 1 in can results in slower performance due to the overhead
-        # of spawning threads.  See joblib issue #112.
-        self.estimators_ = [_multiview_fit_binary(
-            self.estimator, X, column, classes=[
-                "not %s" % self.label_binarizer_.classes_[i],
-                self.label_binarizer_.classes_[i]], train_indices=train_indices,
-            view_indices=view_indices)
-            for i, column in
-            enumerate(columns)]
+        # The multiview datasets can not be pickled, so the binary problems
+        # are fitted in a thread pool.
+        self.estimators_ = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+            delayed(_multiview_fit_binary)(
+                self.estimator, X, column, classes=[
+                    "not %s" % self.label_binarizer_.classes_[i],
+                    self.label_binarizer_.classes_[i]],
+                train_indices=train_indices, view_indices=view_indices)
+            for i, column in enumerate(columns))
         return self
 
     def predict(self, X, sample_indices=None, view_indices=None):
@@ -181,9 +206,8 @@ class MultiviewOVRWrapper(MultiviewWrapper, OneVsRestClassifier):
             maxima = np.empty(n_samples, dtype=float)
             maxima.fill(-np.inf)
             argmaxima = np.zeros(n_samples, dtype=int)
-            for i, e in enumerate(self.estimators_):
-                pred = _multiview_predict_binary(e, X, sample_indices,
-                                                 view_indices)
+            for i, pred in enumerate(self.predict_binaries(X, sample_indices,
+                                                           view_indices)):
                 np.maximum(maxima, pred, out=maxima)
                 argmaxima[maxima == pred] = i
             return self.classes_[argmaxima]
@@ -195,12 +219,9 @@ class MultiviewOVRWrapper(MultiviewWrapper, OneVsRestClassifier):
                 thresh = .5
             indices = array.array('i')
             indptr = array.array('i', [0])
-            for e in self.estimators_:
-                indices.extend(
-                    np.where(_multiview_predict_binary(e, X,
-                                                       sample_indices,
-                                                       view_indices) > thresh)[
-                        0])
+            for pred in self.predict_binaries(X, sample_indices,
+                                              view_indices):
+                indices.extend(np.where(pred > thresh)[0])
                 indptr.append(len(indices))
 
             data = np.ones(len(indices), dtype=int)
@@ -208,6 +229,15 @@ class MultiviewOVRWrapper(MultiviewWrapper, OneVsRestClassifier):
                                       shape=(n_samples, len(self.estimators_)))
             return self.label_binarizer_.inverse_transform(indicator)
 
+    def predict_binaries(self, X, sample_indices, view_indices):
+        """Yields the scores of each binary estimator, in order, computed in
+        a thread pool"""
+        return Parallel(n_jobs=self.n_jobs, prefer="threads",
+                        return_as="generator")(
+            delayed(_multiview_predict_binary)(estimator, X, sample_indices,
+                                               view_indices)
+            for estimator in self.estimators_)
+
     def get_params(self, deep=True):
         return self.format_params(
             OneVsRestClassifier.get_params(self, deep=deep), deep=deep)
@@ -215,13 +245,9 @@ class MultiviewOVRWrapper(MultiviewWrapper, OneVsRestClassifier):
 
 def _multiview_fit_ovo_binary(estimator, X, y, i, j, train_indices,
                               view_indices):
-    cond = np.logical_or(y == i, y == j)
-    # y = y[cond]
-    y_binary = np.empty(y.shape, np.int_)
-    y_binary[y == i] = 0
-    y_binary[y == j] = 1
-    indcond = np.arange(X.get_nb_samples())[cond]
-    train_indices = np.intersect1d(train_indices, indcond)
+    """Fits the estimator to separate class i from class j, on the
+    `train_indices`, that are the training samples of these classes"""
+    y_binary = np.equal(y, j).astype(np.int_)
     return _multiview_fit_binary(estimator,
                                  X,
                                  y_binary, train_indices, view_indices,
@@ -261,13 +287,19 @@ class MultiviewOVOWrapper(MultiviewWrapper, OneVsOneClassifier):
             raise ValueError("OneVsOneClassifier can not be fit when only one"
                              " class is present.")
         n_classes = self.classes_.shape[0]
-        estimators_indices = list(zip(*([_multiview_fit_ovo_binary(
-            self.estimator, X, y, self.classes_[i], self.classes_[j],
-            train_indices,
-            view_indices
-        )
-            for i in range(n_classes) for j in range(i + 1, n_classes)
-        ])))
+        train_indices = np.unique(train_indices)
+        # The sorted training samples of each class, merged for each pair
+        class_indices = [train_indices[y[train_indices] == class_]
+                         for class_ in self.classes_]
+        # The multiview datasets can not be pickled, so the pairs are fitted
+        # in a thread pool.
+        estimators_indices = list(zip(*Parallel(n_jobs=self.n_jobs,
+                                                prefer="threads")(
+            delayed(_multiview_fit_ovo_binary)(
+                self.estimator, X, y, self.classes_[i], self.classes_[j],
+                np.sort(np.concatenate((class_indices[i], class_indices[j]))),
+                view_indices)
+            for i in range(n_classes) for j in range(i + 1, n_classes))))
 
         self.estimators_ = estimators_indices[0]
         self.pairwise_indices_ = (
@@ -298,7 +330,7 @@ class MultiviewOVOWrapper(MultiviewWrapper, OneVsOneClassifier):
         Y = self.multiview_decision_function(X, sample_indices=sample_indices,
                                              view_indices=view_indices)
         if self.n_classes_ == 2:
-            return self.classes_[(Y > 0).astype(np.int)]
+            return self.classes_[(Y > 0).astype(int)]
         return self.classes_[Y.argmax(axis=1)]
 
     def multiview_decision_function(self, X, sample_indices,
@@ -311,15 +343,27 @@ class MultiviewOVOWrapper(MultiviewWrapper, OneVsOneClassifier):
         else:
             # TODO Gram matrix compatibility
             Xs = [X[:, idx] for idx in indices]
-        predictions = np.vstack(
-            [est.predict(Xi, sample_indices=sample_indices,
-                         view_indices=view_indices)
-             for est, Xi in zip(self.estimators_, Xs)]).T
-        confidences = np.ones(predictions.shape)
-        # confidences = np.vstack([_predict_binary(est, Xi)
-        #                          for est, Xi in zip(self.estimators_, Xs)]).T
-        Y = _ovr_decision_function(predictions,
-                                   confidences, len(self.classes_))
+        # Accumulates the votes and the confidences of each pair as they are
+        # predicted, as in sklearn's _ovr_decision_function with unit
+        # confidences.
+        n_classes = len(self.classes_)
+        votes = np.zeros((len(sample_indices), n_classes))
+        sum_of_confidences = np.zeros(n_classes)
+        pairs = [(i, j) for i in range(n_classes)
+                 for j in range(i + 1, n_classes)]
+        predictions = Parallel(n_jobs=self.n_jobs, prefer="threads",
+                               return_as="generator")(
+            delayed(est.predict)(Xi, sample_indices=sample_indices,
+                                 view_indices=view_indices)
+            for est, Xi in zip(self.estimators_, Xs))
+        for (i, j), prediction in zip(pairs, predictions):
+            votes[:, i] += prediction == 0
+            votes[:, j] += prediction == 1
+            sum_of_confidences[i] -= 1
+            sum_of_confidences[j] += 1
+        transformed_confidences = sum_of_confidences / (
+            3 * (np.abs(sum_of_confidences) + 1))
+        Y = votes + transformed_confidences
         if self.n_classes_ == 2:
             return Y[:, 1]
         return Y
@@ -0,0 +1,393 @@
+import json
+import os
+import pickle
+
+import h5py
+import numpy as np
+import pandas as pd
+from sklearn.metrics import confusion_matrix
+
+from .organization import secure_file_path
+
+# Author-Info
+__author__ = "Baptiste Bauvin"
+__status__ = "Prototype"  # Production, Development, Prototype
+
+
+class ResultsStore:
+    """
+    Consolidated results file of a benchmark, an HDF5 file with a group by
+    statistical iteration holding the labels, the train/test split and the
+    cross-validation folds, the predictions of all the classifiers as a
+    single int8/int16 matrix, their score tables, durations, configs and
+    feature importances, and the benchmark's config as an attribute.
+
+    While a store opened in a writing mode is used as a context manager, it
+    is active, and the experiments do not write their predictions, labels,
+    folds, confusion matrices, error data and feature importances pickles,
+    `export_csv` writing them afterwards from the store, at the same paths,
+    if needed.
+
+    Parameters
+    ----------
+    path : str
+        The path of the HDF5 file.
+    mode : str
+        The h5py mode in which the file is opened, "r" to query it.
+    """
+    active = None
+
+    def __init__(self, path, mode="r"):
+        self.path = path
+        self.mode = mode
+        self.file = None
+
+    def __enter__(self):
+        if self.mode != "r":
+            secure_file_path(self.path)
+            ResultsStore.active = self
+        self.file = h5py.File(self.path, self.mode)
+        if self.mode != "r":
+            self.file.attrs["directory"] = os.path.dirname(self.path)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if ResultsStore.active is self:
+            ResultsStore.active = None
+        self.file.close()
+        self.file = None
+
+    def save_config(self, config):
+        """Saves the benchmark's config, as JSON"""
+        self.file.attrs["config"] = json.dumps(config, default=to_json)
+
+    def add_iteration(self, arguments, results, labels, sample_ids=None,
+                      feature_importances=None, dataset_name=None):
+        """
+        Saves the results of a statistical iteration.
+
+        Parameters
+        ----------
+        arguments : dict
+            The benchmark argument dictionary of the iteration.
+        results : list of MonoviewResult and MultiviewResult objects
+            The results of the iteration's experiments.
+        labels : np.array
+            The labels of all the samples.
+        sample_ids : list of str
+            The ids of the samples.
+        feature_importances : dict of pd.DataFrame
+            The feature importances of the classifiers, for each view.
+        dataset_name : str
+            The name of the dataset file, used by the multiview experiments
+            to name their files, the database name if None.
+        """
+        group_name = get_group_name(arguments["flag"])
+        if group_name in self.file:
+            del self.file[group_name]
+        group = self.file.create_group(group_name)
+        group.attrs["directory"] = arguments["directory"]
+        group.attrs["database_name"] = arguments["args"]["name"]
+        group.attrs["dataset_name"] = dataset_name if dataset_name is not \
+            None else arguments["args"]["name"]
+        group.attrs["labels_dictionary"] = json.dumps(
+            dict((str(key), value)
+                 for key, value in arguments["labels_dictionary"].items()),
+            default=to_json)
+        group.attrs["metrics"] = json.dumps(arguments.get("metrics", {}),
+                                            default=to_json)
+        labels = np.asarray(labels)
+        label_dtype = get_label_dtype(labels)
+        group.create_dataset("labels", data=labels.astype(label_dtype))
+        train_indices, test_indices = arguments["classification_indices"]
+        group.create_dataset("train_indices", data=train_indices)
+        group.create_dataset("test_indices", data=test_indices)
+        if "k_folds" in arguments:
+            folds = np.zeros(len(train_indices), dtype=np.int8)
+            train_labels = labels[train_indices]
+            for fold_index, (_, test_cv_indices) in enumerate(
+                    arguments["k_folds"].split(
+                        np.arange(len(train_labels)), train_labels)):
+                folds[test_cv_indices] = fold_index
+            group.create_dataset("folds", data=folds)
+        if sample_ids is not None:
+            group.create_dataset("sample_ids", data=np.array(
+                sample_ids, dtype=object), dtype=h5py.string_dtype())
+
+        classifiers = group.create_group("classifiers")
+        classifiers.create_dataset(
+            "names", dtype=h5py.string_dtype(),
+            data=np.array([classifier_result.get_classifier_name()
+                           for classifier_result in results], dtype=object))
+        classifiers.create_dataset(
+            "infos", dtype=h5py.string_dtype(),
+            data=np.array([json.dumps(get_result_info(classifier_result),
+                                      default=to_json)
+                           for classifier_result in results], dtype=object))
+        classifiers.create_dataset(
+            "predictions", compression="gzip",
+            data=np.array([classifier_result.full_labels_pred
+                           for classifier_result in results],
+                          dtype=label_dtype).reshape((len(results),
+                                                      len(labels))))
+        classifiers.create_dataset("durations", data=np.array(
+            [[classifier_result.hps_duration, classifier_result.fit_duration,
+              classifier_result.pred_duration]
+             for classifier_result in results],
+            dtype=float).reshape((len(results), 3)))
+        scores = group.create_group("scores")
+        class_scores = group.create_group("class_scores")
+        for metric in arguments.get("metrics", {}) if results else []:
+            scores.create_dataset(metric, data=np.array(
+                [classifier_result.metrics_scores[metric]
+                 for classifier_result in results],
+                dtype=float).reshape((len(results), 2)))
+            class_scores.create_dataset(metric, data=np.array(
+                [classifier_result.class_metric_scores[metric]
+                 for classifier_result in results], dtype=float))
+        importances = group.create_group("feature_importances")
+        for view_name, dataframe in (feature_importances or {}).items():
+            view_group = importances.create_group(view_name)
+            view_group.create_dataset("values", data=dataframe.to_numpy(
+                dtype=float))
+            view_group.create_dataset("feature_ids", dtype=h5py.string_dtype(),
+                                      data=np.array(dataframe.index,
+                                                    dtype=object))
+            view_group.create_dataset("classifier_names",
+                                      dtype=h5py.string_dtype(),
+                                      data=np.array(dataframe.columns,
+                                                    dtype=object))
+
+    def get_config(self):
+        return json.loads(self.file.attrs["config"])
+
+    def iterations(self):
+        """The sorted indices of the stored statistical iterations"""
+        return sorted(int(name.split("_")[-1]) for name in self.file)
+
+    def get_iteration(self, iteration):
+        return self.file[get_group_name(iteration)]
+
+    def get_directory(self, iteration):
+        return self.get_iteration(iteration).attrs["directory"]
+
+    def get_relative_directory(self, iteration):
+        """The result directory of the iteration, relative to the one of the
+        store when it was written"""
+        return os.path.relpath(self.get_directory(iteration),
+                               self.file.attrs["directory"])
+
+    def get_database_name(self, iteration):
+        return self.get_iteration(iteration).attrs["database_name"]
+
+    def get_dataset_name(self, iteration):
+        return self.get_iteration(iteration).attrs["dataset_name"]
+
+    def get_labels_dictionary(self, iteration):
+        return dict((int(key), value) for key, value in json.loads(
+            self.get_iteration(iteration).attrs[
+                "labels_dictionary"]).items())
+
+    def get_labels(self, iteration):
+        return self.get_iteration(iteration)["labels"][()]
+
+    def get_split(self, iteration):
+        """The train and test indices"""
+        group = self.get_iteration(iteration)
+        return group["train_indices"][()], group["test_indices"][()]
+
+    def get_folds(self, iteration):
+        """The cross-validation fold of each train sample"""
+        return self.get_iteration(iteration)["folds"][()]
+
+    def get_sample_ids(self, iteration):
+        return list(self.get_iteration(iteration)["sample_ids"].asstr()[()])
+
+    def get_classifier_names(self, iteration):
+        return list(self.get_iteration(iteration)[
+                        "classifiers/names"].asstr()[()])
+
+    def get_classifier_infos(self, iteration):
+        """The name, view and config of each classifier"""
+        return [json.loads(info) for info in self.get_iteration(iteration)[
+            "classifiers/infos"].asstr()[()]]
+
+    def get_predictions(self, iteration, classifier_names=None):
+        """
+        The (n_classifiers, n_samples) matrix of the predictions of the
+        classifiers, all of them or the ones in `classifier_names`, in this
+        order.
+        """
+        predictions = self.get_iteration(iteration)["classifiers/predictions"]
+        if classifier_names is None:
+            return predictions[()]
+        names = self.get_classifier_names(iteration)
+        return predictions[()][[names.index(classifier_name)
+                                for classifier_name in classifier_names]]
+
+    def get_durations(self, iteration):
+        return pd.DataFrame(self.get_iteration(iteration)[
+                                "classifiers/durations"][()],
+                            index=self.get_classifier_names(iteration),
+                            columns=["hps", "fit", "pred"])
+
+    def get_metrics(self, iteration):
+        return list(self.get_iteration(iteration)["scores"])
+
+    def get_metrics_dict(self, iteration):
+        """The metrics of the iteration with their configuration"""
+        return json.loads(self.get_iteration(iteration).attrs["metrics"])
+
+    def get_scores(self, iteration, metric):
+        """The train and test scores (rows) of each classifier (columns)"""
+        return pd.DataFrame(np.transpose(
+            self.get_iteration(iteration)["scores"][metric][()]),
+            index=["train", "test"],
+            columns=self.get_classifier_names(iteration))
+
+    def get_class_scores(self, iteration, metric):
+        """The train and test scores of each class (rows) of each classifier
+        (columns)"""
+        class_scores = self.get_iteration(iteration)["class_scores"][metric][
+            ()]
+        label_names = list(self.get_labels_dictionary(iteration).values())
+        return pd.DataFrame(
+            class_scores.reshape((class_scores.shape[0], -1)).transpose(),
+            index=pd.MultiIndex.from_product([["train", "test"],
+                                              label_names]),
+            columns=self.get_classifier_names(iteration))
+
+    def get_feature_importances(self, iteration):
+        """The feature importances of the classifiers, for each view"""
+        feature_importances = {}
+        for view_name, view_group in self.get_iteration(iteration)[
+                "feature_importances"].items():
+            feature_importances[view_name] = pd.DataFrame(
+                view_group["values"][()],
+                index=list(view_group["feature_ids"].asstr()[()]),
+                columns=list(view_group["classifier_names"].asstr()[()]))
+        return feature_importances
+
+    def export_csv(self, iterations=None):
+        """
+        Writes the files the experiments write without a store, in their
+        result directories : the iterations' labels, train indices, folds
+        and error data, and for each classifier, in its
+        `<classifier>/<view>/<classifier>-<database>-<view>-` (monoview) or
+        `<classifier>/<classifier>-<dataset>-` (multiview) prefix, its
+        confusion matrix, and for the monoview ones, their predictions,
+        labels and feature importances pickle.
+        """
+        for iteration in iterations or self.iterations():
+            directory = self.get_directory(iteration)
+            database_name = self.get_database_name(iteration)
+            labels = self.get_labels(iteration)
+            train_indices, test_indices = self.get_split(iteration)
+            train_labels = labels[train_indices]
+            secure_file_path(os.path.join(directory, "train_labels.csv"))
+            np.savetxt(os.path.join(directory, "train_labels.csv"),
+                       train_labels, delimiter=",")
+            np.savetxt(os.path.join(directory, "train_indices.csv"),
+                       train_indices, delimiter=",")
+            if "folds" in self.get_iteration(iteration):
+                folds = self.get_folds(iteration)
+                nb_folds = int(folds.max()) + 1 if len(folds) else 0
+                min_fold_len = int(len(train_labels) / max(nb_folds, 1))
+                for fold_index in range(nb_folds):
+                    file_name = os.path.join(
+                        directory, "folds",
+                        "test_labels_fold_" + str(fold_index) + ".csv")
+                    secure_file_path(file_name)
+                    np.savetxt(file_name, train_labels[
+                        folds == fold_index][:min_fold_len], delimiter=",")
+            predictions = self.get_predictions(iteration)
+            feature_importances = self.get_feature_importances(iteration)
+            for info, full_pred in zip(self.get_classifier_infos(iteration),
+                                       predictions):
+                classifier_name = info["classifier_name"]
+                confusion = confusion_matrix(y_true=labels[test_indices],
+                                             y_pred=full_pred[test_indices])
+                if "view_name" not in info:
+                    file_name = os.path.join(
+                        directory, classifier_name,
+                        classifier_name + "-" +
+                        self.get_dataset_name(iteration) + "-")
+                    secure_file_path(file_name)
+                    np.savetxt(file_name + "confusion_matrix.csv", confusion,
+                               delimiter=",")
+                    continue
+                view_name = info["view_name"]
+                file_name = os.path.join(
+                    directory, classifier_name, view_name,
+                    classifier_name + "-" + database_name + "-" + view_name +
+                    "-")
+                secure_file_path(file_name)
+                np.savetxt(file_name + "confusion_matrix.csv", confusion,
+                           delimiter=", ")
+                np.savetxt(file_name + "full_pred.csv", full_pred,
+                           delimiter=",")
+                np.savetxt(file_name + "train_pred.csv",
+                           full_pred[train_indices], delimiter=",")
+                np.savetxt(file_name + "train_labels.csv", train_labels,
+                           delimiter=",")
+                np.savetxt(file_name + "test_labels.csv",
+                           labels[test_indices], delimiter=",")
+                if info.get("feature_importances", False):
+                    importances = feature_importances[view_name][
+                        classifier_name]
+                    # Named as by BaseMonoviewClassifier.get_feature_importance
+                    with open(os.path.join(directory, classifier_name,
+                                           view_name) +
+                              "feature_importances.pickle", "wb") as handle:
+                        pickle.dump(dict(
+                            (feature_id, importance) for feature_id, importance
+                            in importances.items() if importance != 0),
+                            handle)
+            errors = np.equal(predictions, labels).astype(int)
+            errors[:, labels == -100] = -100
+            base_file_name = os.path.join(directory, database_name + "-")
+            np.savetxt(base_file_name + "2D_plot_data.csv",
+                       np.transpose(errors), delimiter=",")
+            np.savetxt(base_file_name + "bar_plot_data.csv",
+                       np.sum(errors, axis=0) / max(len(errors), 1),
+                       delimiter=",")
+
+
+def to_json(value):
+    """Converts the numpy values to python ones and the other non JSON
+    serializable values to strings"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    elif isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def get_group_name(iteration):
+    return "iteration_{}".format(iteration)
+
+
+def get_label_dtype(labels):
+    """The smallest of int8 and int16 holding the labels"""
+    if len(labels) == 0 or (np.min(labels) >= np.iinfo(np.int8).min
+                            and np.max(labels) <= np.iinfo(np.int8).max):
+        return np.int8
+    return np.int16
+
+
+def get_result_info(classifier_result):
+    """The description of a classifier result, to rebuild it from the
+    store"""
+    info = {"classifier_name": classifier_result.classifier_name,
+            "config": classifier_result.classifier_config}
+    if hasattr(classifier_result, "view_name"):
+        info.update({"view_index": classifier_result.view_index,
+                     "view_name": classifier_result.view_name,
+                     "n_features": classifier_result.n_features,
+                     "feature_importances": hasattr(classifier_result.clf,
+                                                    "feature_importances_")})
+    return info
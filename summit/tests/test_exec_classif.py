@@ -58,6 +58,14 @@ class Test_initBenchmark(unittest.TestCase):
                          {'monoview': ['decision_tree'],
                           'multiview': ['weighted_linear_late_fusion']})
 
+    def test_all(self):
+        benchmark_output = exec_classif.init_benchmark(
+            cl_type=["monoview", "multiview"], monoview_algos=["all"],
+            multiview_algos=["all"])
+        self.assertEqual(len(benchmark_output["monoview"]), 13)
+        self.assertIn("svm_jumbo_fusion", benchmark_output["multiview"])
+        self.assertNotIn("additions", benchmark_output["multiview"])
+
 
 class Test_Functs(unittest.TestCase):
 
@@ -1,4 +1,5 @@
 import os
+import pickle
 import unittest
 
 import h5py
@@ -58,6 +59,67 @@ class TestConfigGenerator(unittest.TestCase):
                                                     'max_depth': 103,
                                                     'splitter': 'best'}})
 
+    def test_shared(self):
+        cfg_gen = multiview_utils.ConfigGenerator.get(("decision_tree",))
+        self.assertIs(cfg_gen, multiview_utils.ConfigGenerator.get(
+            ("decision_tree",)))
+        self.assertIsNot(cfg_gen, multiview_utils.ConfigGenerator.get(
+            ("decision_tree", "knn")))
+        self.assertEqual(cfg_gen.distribs["decision_tree"].keys(),
+                         {"max_depth", "criterion", "splitter"})
+        self.assertIs(cfg_gen.distribs["decision_tree"]["criterion"],
+                      multiview_utils.get_monoview_metadata(
+                          "decision_tree")["distribs"][1])
+
+    def test_lazy(self):
+        cfg_gen = multiview_utils.ConfigGenerator(["svm_poly"])
+        multiview_utils.MONOVIEW_METADATA.pop("svm_poly", None)
+        self.assertIsNone(cfg_gen.classifiers_distribs)
+        cfg_gen.rvs(np.random.RandomState(42))
+        self.assertIn("svm_poly", multiview_utils.MONOVIEW_METADATA)
+
+
+class TestSharedDistribution(unittest.TestCase):
+
+    def test_sub_classes(self):
+        class FakeDistribution(multiview_utils.SharedDistribution):
+
+            def __init__(self, param=0):
+                self.param = param
+
+        class FakeSubDistribution(FakeDistribution):
+            pass
+
+        self.assertIs(FakeDistribution.get(), FakeDistribution.get())
+        self.assertEqual(FakeDistribution.get(1).param, 1)
+        self.assertIsInstance(FakeSubDistribution.get(),
+                              FakeSubDistribution)
+
+
+class FakeNamedClassifier:
+    short_name = "named"
+
+
+class TestMultiviewResult(unittest.TestCase):
+
+    def setUp(self):
+        self.result = multiview_utils.MultiviewResult(
+            "weighted_linear_late_fusion", {}, {"accuracy_score": [0.7, 0.8]},
+            np.zeros(4), 0, 1, 2, {}, FakeNamedClassifier())
+
+    def test_display_name(self):
+        self.assertEqual(self.result.get_classifier_name(), "named")
+        unknown = multiview_utils.MultiviewResult("unknown", {}, {}, None, 0,
+                                                  0, 0, {}, "")
+        self.assertEqual(unknown.get_classifier_name(), "unknown")
+
+    def test_serialization(self):
+        self.assertFalse(hasattr(self.result, "__dict__"))
+        result = pickle.loads(pickle.dumps(self.result))
+        self.assertEqual(result.get_classifier_name(), "named")
+        self.assertEqual(result.metrics_scores, {"accuracy_score": [0.7, 0.8]})
+        self.assertEqual(result.pred_duration, 2)
+
 
 class TestFunctions(unittest.TestCase):
 
@@ -0,0 +1,66 @@
+import unittest
+
+import numpy as np
+
+from summit.multiview_platform.multiview_classifiers.additions import \
+    aggregation_utils
+
+
+class Test_aggregation(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.random_state = np.random.RandomState(42)
+        cls.decisions = cls.random_state.randint(0, 3, (4, 50))
+        cls.weights = cls.random_state.uniform(size=4)
+        cls.probas = cls.random_state.uniform(size=(4, 50, 3))
+        cls.probas /= cls.probas.sum(axis=2, keepdims=True)
+
+    def test_weighted_votes(self):
+        votes = np.zeros((50, 3))
+        for view_index, view_decisions in enumerate(self.decisions):
+            for sample_index, decision in enumerate(view_decisions):
+                votes[sample_index, decision] += self.weights[view_index]
+        np.testing.assert_array_equal(
+            aggregation_utils.weighted_votes(self.decisions, self.weights, 3),
+            votes)
+
+    def test_weighted_votes_out_of_range(self):
+        decisions = np.array([[0, 1], [1, 2]])
+        self.assertRaises(IndexError, aggregation_utils.weighted_votes,
+                          decisions, np.ones(2), 2)
+        self.assertRaises(IndexError, aggregation_utils.weighted_votes,
+                          -decisions, np.ones(2), 3)
+
+    def test_weighted_sum(self):
+        np.testing.assert_array_almost_equal(
+            aggregation_utils.weighted_sum(self.probas, self.weights),
+            np.sum([probas * weight for probas, weight
+                    in zip(self.probas, self.weights)], axis=0))
+
+    def test_product_of_experts(self):
+        np.testing.assert_array_equal(
+            np.argmax(aggregation_utils.product_of_experts(self.probas,
+                                                           self.weights),
+                      axis=1),
+            np.argmax(np.prod([np.power(probas, weight) for probas, weight
+                               in zip(self.probas, self.weights)], axis=0),
+                      axis=1))
+
+    def test_product_of_experts_underflow(self):
+        probas = np.tile(np.array([[[1e-300, 2e-300]]]), (10, 1, 1))
+        np.testing.assert_array_equal(
+            np.argmax(aggregation_utils.product_of_experts(probas,
+                                                           np.ones(10)),
+                      axis=1), [1])
+
+    def test_product_of_experts_null_weight(self):
+        probas = np.array([[[0.0, 1.0]], [[0.7, 0.3]]])
+        scores = aggregation_utils.product_of_experts(probas,
+                                                      np.array([0.0, 1.0]))
+        np.testing.assert_array_almost_equal(scores, np.log([[0.7, 0.3]]))
+
+    def test_nb_maxima(self):
+        np.testing.assert_array_equal(
+            aggregation_utils.nb_maxima(np.array([[1, 2, 2], [3, 0, 1]])),
+            [2, 1])
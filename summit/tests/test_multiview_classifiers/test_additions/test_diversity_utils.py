@@ -1,7 +1,12 @@
+import itertools
 import unittest
 import numpy as np
 
 import summit.multiview_platform.multiview_classifiers.additions.diversity_utils as du
+from summit.multiview_platform.multiview_classifiers import entropy_fusion, \
+    difficulty_fusion, disagree_fusion, double_fault_fusion
+from summit.multiview_platform.multiview_classifiers.additions import \
+    fusion_utils
 
 
 class FakeDataset():
@@ -70,6 +75,156 @@ class Test_DiversityFusion(unittest.TestCase):
                                classifiers_config=self.classifiers_config)
         clf.fit(self.X, self.y, self.train_indices, self.views_indices)
 
+    def test_parallel_pool(self):
+        rs = np.random.RandomState(42)
+        y = rs.randint(0, 2, 40)
+        X = FakeDataset(rs.randint(0, 100, (3, 40, 5)), y)
+        train_indices = np.arange(30)
+        decisions = []
+        for nb_cores in [1, 2]:
+            clf = entropy_fusion.EntropyFusion(
+                random_state=42, classifier_names=self.classifier_names,
+                classifier_configs=self.classifiers_config,
+                nb_cores=nb_cores)
+            decisions.append(clf.fit_monoview_estimators(X, y, train_indices,
+                                                         [0, 1, 2]))
+            self.assertEqual(len(clf.monoview_estimators), 2)
+            self.assertEqual(len(clf.monoview_estimators[0]), 3)
+        np.testing.assert_array_equal(decisions[0], decisions[1])
+        np.testing.assert_array_equal(
+            decisions[1][1, 2],
+            clf.monoview_estimators[1][2].predict(X.get_v(2, train_indices)))
+
+    def test_parallel_pool_memo(self):
+        rs = np.random.RandomState(42)
+        y = rs.randint(0, 2, 40)
+        X = CountingDataset(rs.randint(0, 100, (3, 40, 5)), y)
+        train_indices = np.arange(30)
+        with fusion_utils.MonoviewMemo() as memo:
+            clf = entropy_fusion.EntropyFusion(
+                random_state=42, classifier_names=self.classifier_names,
+                classifier_configs=self.classifiers_config, nb_cores=2)
+            decisions = clf.fit_monoview_estimators(X, y, train_indices,
+                                                    [0, 1, 2])
+            self.assertEqual(len(memo.estimators), 6)
+            X.nb_get_v = 0
+            other_clf = entropy_fusion.EntropyFusion(
+                random_state=42, classifier_names=self.classifier_names,
+                classifier_configs=self.classifiers_config, nb_cores=2)
+            other_decisions = other_clf.fit_monoview_estimators(
+                X, y, train_indices, [0, 1, 2])
+            self.assertEqual(X.nb_get_v, 0)
+            self.assertIs(other_clf.monoview_estimators[1][2],
+                          clf.monoview_estimators[1][2])
+        np.testing.assert_array_equal(decisions, other_decisions)
+
+
+class CountingDataset(FakeDataset):
+
+    nb_get_v = 0
+
+    def get_v(self, view_index, sample_indices):
+        self.nb_get_v += 1
+        return FakeDataset.get_v(self, view_index, sample_indices)
+
+
+class Test_GlobalDiversitySearch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.random_state = np.random.RandomState(42)
+        cls.classifiers_decisions = cls.random_state.randint(
+            0, 2, size=(5, 4, 30))
+        cls.y = cls.random_state.randint(0, 2, 30)
+        cls.correct = np.logical_not(np.logical_xor(cls.classifiers_decisions,
+                                                    cls.y))
+
+    def loop_search(self, clf):
+        combinations = list(itertools.combinations_with_replacement(range(5),
+                                                                    4))
+        div_measure = [clf.diversity_measure(self.classifiers_decisions,
+                                             combination, self.y)
+                       for combination in combinations]
+        return np.array(combinations[int(np.argmax(div_measure))])
+
+    def test_exhaustive_matches_loop(self):
+        for clf in [entropy_fusion.EntropyFusion(),
+                    difficulty_fusion.DifficultyFusion()]:
+            clf.block_size = 4 * 30 * 7
+            clf.search_rows = 11
+            np.testing.assert_array_equal(clf.exhaustive_search(self.correct, 5,
+                                                                4),
+                                          self.loop_search(clf))
+
+    def test_block_measure_matches_measure(self):
+        combination = [1, 3, 4, 0]
+        nb_correct = self.correct[combination, np.arange(4)].sum(axis=0)
+        for clf in [entropy_fusion.EntropyFusion(),
+                    difficulty_fusion.DifficultyFusion()]:
+            self.assertAlmostEqual(
+                clf.block_diversity_measure(nb_correct.reshape(1, -1), 4)[0],
+                clf.diversity_measure(self.classifiers_decisions, combination,
+                                      self.y))
+
+    def test_beam_search(self):
+        clf = entropy_fusion.EntropyFusion(max_combinations=40)
+        combination = clf.beam_search(self.correct, 5, 4)
+        self.assertEqual(combination.shape, (4,))
+        self.assertTrue(np.all(np.diff(combination) >= 0))
+        clf.max_combinations = 10 ** 6
+        np.testing.assert_array_equal(clf.beam_search(self.correct, 5, 4),
+                                      self.loop_search(clf))
+
+    def test_beam_search_one_view(self):
+        clf = difficulty_fusion.DifficultyFusion(max_combinations=2)
+        correct = self.correct[:, :1]
+        np.testing.assert_array_equal(clf.beam_search(correct, 5, 1),
+                                      np.array([1]))
+
+
+class Test_CoupleDiversitySearch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.random_state = np.random.RandomState(42)
+        cls.classifiers_decisions = cls.random_state.randint(
+            0, 2, size=(4, 3, 21))
+        cls.y = cls.random_state.randint(0, 2, 21)
+
+    def loop_search(self, clf):
+        combinations = list(itertools.combinations_with_replacement(range(4),
+                                                                    3))
+        div_measure = []
+        for combination in combinations:
+            div_measure.append(np.mean([
+                np.mean(clf.diversity_measure(
+                    self.classifiers_decisions[combination[first], first],
+                    self.classifiers_decisions[combination[second], second],
+                    self.y))
+                for first, second in itertools.combinations(range(3), 2)]))
+        return np.array(combinations[int(np.argmax(div_measure))])
+
+    def test_pair_diversity(self):
+        for clf in [disagree_fusion.DisagreeFusion(),
+                    double_fault_fusion.DoubleFaultFusion()]:
+            pair_diversity = clf.get_pair_diversity(
+                clf.pairwise_bits(self.classifiers_decisions, self.y))
+            self.assertEqual(pair_diversity.shape, (4, 3, 4, 3))
+            self.assertAlmostEqual(
+                pair_diversity[1, 0, 2, 2],
+                np.mean(clf.diversity_measure(
+                    self.classifiers_decisions[1, 0],
+                    self.classifiers_decisions[2, 2], self.y)))
+
+    def test_exhaustive_matches_loop(self):
+        for clf in [disagree_fusion.DisagreeFusion(),
+                    double_fault_fusion.DoubleFaultFusion()]:
+            pair_diversity = clf.get_pair_diversity(
+                clf.pairwise_bits(self.classifiers_decisions, self.y))
+            np.testing.assert_array_equal(
+                clf.search_combination(pair_diversity, 4, 3),
+                self.loop_search(clf))
+
 
 if __name__ == '__main__':
     unittest.main()
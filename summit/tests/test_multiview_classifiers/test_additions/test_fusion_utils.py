@@ -0,0 +1,166 @@
+import unittest
+import numpy as np
+
+from summit.multiview_platform.multiview_classifiers.additions import \
+    fusion_utils
+from summit.multiview_platform.multiview_classifiers import \
+    majority_voting_fusion, weighted_linear_late_fusion
+from summit.multiview_platform.monoview_classifiers.decision_tree import \
+    DecisionTree
+from summit.multiview_platform.utils.dataset import RAMDataset
+from summit.multiview_platform.utils.model_registry import ModelRegistry
+
+
+class Test_MonoviewMemo(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.random_state = np.random.RandomState(42)
+        cls.y = cls.random_state.randint(0, 2, 20)
+        cls.dataset = RAMDataset(
+            views=[cls.random_state.uniform(size=(20, 3)) for _ in range(2)],
+            labels=cls.y, are_sparse=[False, False],
+            view_names=["ViewN0", "ViewN1"], labels_names=["0", "1"])
+        cls.train_indices = np.arange(10)
+
+    def fit_voting(self, weights):
+        clf = majority_voting_fusion.MajorityVoting(
+            42, classifiers_names="decision_tree",
+            classifier_configs={"decision_tree": {"max_depth": 2}},
+            weights=weights)
+        return clf.fit(self.dataset, self.y, train_indices=self.train_indices)
+
+    def test_shared_estimators(self):
+        with fusion_utils.MonoviewMemo() as memo:
+            first = self.fit_voting(np.array([0.2, 0.8]))
+            second = self.fit_voting(np.array([0.8, 0.2]))
+            self.assertEqual(len(memo.estimators), 2)
+            for first_estim, second_estim in zip(first.monoview_estimators,
+                                                 second.monoview_estimators):
+                self.assertIs(first_estim, second_estim)
+            first.predict(self.dataset, np.arange(10, 20))
+            second.predict(self.dataset, np.arange(10, 20))
+            self.assertEqual(len(memo.predictions), 2)
+        self.assertIsNone(fusion_utils.MonoviewMemo.active)
+
+    def test_binarized_labels(self):
+        # As the binary problems of a one-vs-rest wrapper
+        with fusion_utils.MonoviewMemo() as memo:
+            clf = majority_voting_fusion.MajorityVoting(
+                42, classifiers_names="decision_tree",
+                classifier_configs={"decision_tree": {"max_depth": 2}},
+                weights=np.array([0.5, 0.5]))
+            first = clf.fit(self.dataset, self.y,
+                            train_indices=self.train_indices
+                            ).monoview_estimators[0]
+            second = clf.fit(self.dataset, 1 - self.y,
+                             train_indices=self.train_indices
+                             ).monoview_estimators[0]
+            self.assertEqual(len(memo.estimators), 4)
+            self.assertIsNot(first, second)
+
+    def test_no_memo(self):
+        first = self.fit_voting(np.array([0.2, 0.8]))
+        second = self.fit_voting(np.array([0.8, 0.2]))
+        self.assertIsNot(first.monoview_estimators[0],
+                         second.monoview_estimators[0])
+
+
+class Test_ModelRegistry_reuse(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.random_state = np.random.RandomState(42)
+        cls.y = cls.random_state.randint(0, 2, 20)
+        cls.dataset = RAMDataset(
+            views=[cls.random_state.uniform(size=(20, 3)) for _ in range(2)],
+            labels=cls.y, are_sparse=[False, False],
+            view_names=["ViewN0", "ViewN1"], labels_names=["0", "1"])
+        cls.train_indices = np.arange(10)
+        cls.test_indices = np.arange(10, 20)
+
+    def register(self, registry, view_index, max_depth):
+        estimator = DecisionTree(max_depth=max_depth, random_state=42)
+        key = registry.get_key("decision_tree", estimator, view_index,
+                               self.train_indices)
+        estimator.fit(self.dataset.get_v(view_index, self.train_indices),
+                      self.y[self.train_indices])
+        test_pred = 1 - estimator.predict(
+            self.dataset.get_v(view_index, self.test_indices))
+        registry.add(key, estimator, config={"max_depth": max_depth},
+                     predictions=[(self.test_indices, test_pred)])
+        return estimator, test_pred
+
+    def fit_voting(self, nb_cores=1):
+        clf = majority_voting_fusion.MajorityVoting(
+            42, classifiers_names="decision_tree",
+            classifier_configs={"decision_tree": {"max_depth": 2}},
+            nb_cores=nb_cores)
+        return clf.fit(self.dataset, self.y, train_indices=self.train_indices)
+
+    def test_reuse(self):
+        for nb_cores in [1, 2]:
+            with ModelRegistry() as registry:
+                registered, test_pred = self.register(registry, 0, 2)
+                self.register(registry, 1, 3)
+                clf = self.fit_voting(nb_cores)
+                self.assertIs(clf.monoview_estimators[0], registered)
+                self.assertIsNot(clf.monoview_estimators[1],
+                                 registry.get_estimator(
+                                     registry.get_key(
+                                         "decision_tree",
+                                         DecisionTree(max_depth=3), 1,
+                                         self.train_indices)))
+                # The registered predictions are returned without predicting
+                np.testing.assert_array_equal(
+                    clf.predict_monoview_estimators(
+                        [(estimator, view_index) for view_index, estimator
+                         in enumerate(clf.monoview_estimators)],
+                        self.dataset, self.test_indices)[0], test_pred)
+
+
+class Test_parallel_views(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.random_state = np.random.RandomState(42)
+        cls.y = cls.random_state.randint(0, 2, 30)
+        cls.dataset = RAMDataset(
+            views=[cls.random_state.uniform(size=(30, 3)) for _ in range(3)],
+            labels=cls.y, are_sparse=[False, False, False],
+            view_names=["ViewN0", "ViewN1", "ViewN2"],
+            labels_names=["0", "1"])
+        cls.train_indices = np.arange(20)
+        cls.test_indices = np.arange(20, 30)
+
+    def fit_voting(self, classifier_name, nb_cores):
+        clf = weighted_linear_late_fusion.WeightedLinearLateFusion(
+            42, classifiers_names=classifier_name,
+            classifier_configs={classifier_name: {"n_estimators": 3}
+                                if classifier_name == "adaboost" else {}},
+            nb_cores=nb_cores)
+        return clf.fit(self.dataset, self.y, train_indices=self.train_indices)
+
+    def test_releases_gil(self):
+        clf = self.fit_voting("decision_tree", 1)
+        self.assertTrue(fusion_utils.releases_gil(clf.monoview_estimators[0]))
+        clf = self.fit_voting("adaboost", 1)
+        self.assertFalse(fusion_utils.releases_gil(
+            clf.monoview_estimators[0]))
+
+    def test_same_predictions(self):
+        for classifier_name in ["decision_tree", "adaboost"]:
+            serial = self.fit_voting(classifier_name, 1)
+            parallel = self.fit_voting(classifier_name, 2)
+            np.testing.assert_array_equal(
+                serial.predict(self.dataset, self.test_indices),
+                parallel.predict(self.dataset, self.test_indices))
+
+    def test_process_pool_memo(self):
+        with fusion_utils.MonoviewMemo() as memo:
+            first = self.fit_voting("adaboost", 2)
+            second = self.fit_voting("adaboost", 2)
+            self.assertEqual(len(memo.estimators), 3)
+            for first_estim, second_estim in zip(first.monoview_estimators,
+                                                 second.monoview_estimators):
+                self.assertIs(first_estim, second_estim)
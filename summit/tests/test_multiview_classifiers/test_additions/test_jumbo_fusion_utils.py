@@ -2,6 +2,10 @@ import unittest
 import numpy as np
 
 import summit.multiview_platform.multiview_classifiers.additions.jumbo_fusion_utils as ju
+from summit.multiview_platform.multiview_classifiers import svm_jumbo_fusion
+from summit.multiview_platform.multiview_classifiers.additions import \
+    fusion_utils
+from summit.multiview_platform.utils.dataset import RAMDataset
 
 
 class FakeDataset():
@@ -20,3 +24,45 @@ class FakeDataset():
 
 
 # TODO
+
+
+class Test_stacking(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.random_state = np.random.RandomState(42)
+        cls.y = cls.random_state.randint(0, 2, 40)
+        cls.dataset = RAMDataset(
+            views=[cls.random_state.uniform(size=(40, 3)) for _ in range(2)],
+            labels=cls.y, are_sparse=[False, False],
+            view_names=["ViewN0", "ViewN1"], labels_names=["0", "1"])
+        cls.train_indices = np.arange(30)
+
+    def fit_jumbo(self, C=1.0, stacking=True):
+        clf = svm_jumbo_fusion.SVMJumboFusion(
+            random_state=42, classifiers_names=["decision_tree"],
+            classifier_configs={"decision_tree": {"max_depth": 2}}, C=C,
+            stacking=stacking)
+        return clf.fit(self.dataset, self.y, train_indices=self.train_indices)
+
+    def test_out_of_fold_decisions(self):
+        clf = self.fit_jumbo()
+        decisions = clf.get_stacking_decisions(self.dataset, self.y,
+                                               self.train_indices, [0, 1])
+        self.assertEqual(decisions.shape, (30, 2))
+        in_sample = clf.predict_monoview(self.dataset,
+                                         sample_indices=self.train_indices,
+                                         view_indices=[0, 1])
+        self.assertFalse(np.array_equal(decisions, in_sample))
+        self.assertEqual(clf.predict(self.dataset, np.arange(30, 40)).shape,
+                         (10,))
+
+    def test_shared_decisions(self):
+        with fusion_utils.MonoviewMemo() as memo:
+            first = self.fit_jumbo(C=1.0)
+            second = self.fit_jumbo(C=0.5)
+            self.assertEqual(len(memo.decisions), 1)
+            self.assertIs(first.monoview_estimators[0][0],
+                          second.monoview_estimators[0][0])
+            self.assertNotEqual(first.aggregation_estimator.C,
+                                second.aggregation_estimator.C)
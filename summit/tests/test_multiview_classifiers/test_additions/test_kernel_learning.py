@@ -0,0 +1,74 @@
+import unittest
+
+import numpy as np
+
+from summit.multiview_platform.multiview_classifiers import mvml, \
+    lp_norm_mkl
+from summit.multiview_platform.multiview_classifiers.additions import \
+    kernel_learning
+from summit.multiview_platform.utils.dataset import RAMDataset
+
+
+class FullKernelMVML(mvml.MVMLClassifier):
+
+    landmark_kernels = False
+
+
+class Test_KernelClassifier(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.random_state = np.random.RandomState(42)
+        cls.y = cls.random_state.randint(0, 2, 60)
+        cls.dataset = RAMDataset(
+            views=[cls.random_state.uniform(size=(60, 4)) for _ in range(2)],
+            labels=cls.y, are_sparse=[False, False],
+            view_names=["ViewN0", "ViewN1"], labels_names=["0", "1"])
+        cls.train_indices = np.arange(40)
+        cls.test_indices = np.arange(40, 60)
+
+    def test_landmark_kernels(self):
+        predictions = []
+        # Only the 20 landmark columns of each view are computed, instead of
+        # the 40 columns of the full kernels
+        for classifier_class, kernel_shape in [
+                (mvml.MVMLClassifier, (40, 40)), (FullKernelMVML, (40, 80))]:
+            clf = classifier_class(random_state=42, nystrom_param=0.5,
+                                   kernel_params={"gamma": 0.5}, n_loops=3,
+                                   learn_A=4)
+            clf.fit(self.dataset, self.y, self.train_indices)
+            self.assertEqual(clf.K_.shape, kernel_shape)
+            predictions.append(clf.predict(self.dataset, self.test_indices))
+        np.testing.assert_array_equal(predictions[0], predictions[1])
+
+    def test_kernel_cache(self):
+        clf = lp_norm_mkl.LPNormMKL(random_state=42,
+                                    kernel_params={"gamma": 0.5})
+        expected = clf.fit(self.dataset, self.y,
+                           self.train_indices).predict(self.dataset,
+                                                       self.test_indices)
+        with clf.get_hps_context() as cache:
+            for lmbda in [0.1, 0.5]:
+                clf = lp_norm_mkl.LPNormMKL(random_state=42, lmbda=lmbda,
+                                            kernel_params={"gamma": 0.5})
+                clf.fit(self.dataset, self.y, self.train_indices)
+                predictions = clf.predict(self.dataset, self.test_indices)
+                if lmbda == 0.1:
+                    np.testing.assert_array_equal(predictions, expected)
+            # One train and one test kernel per view
+            self.assertEqual(len(cache.kernels), 4)
+        self.assertIsNone(kernel_learning.KernelCache.active)
+
+    def test_kernel_cache_bound(self):
+        with kernel_learning.KernelCache(max_nbytes=100) as cache:
+            first = cache.get_kernel("first", lambda: np.zeros(10))
+            cache.get_kernel("second", lambda: np.zeros(5))
+            self.assertEqual(list(cache.kernels), ["second"])
+            self.assertEqual(cache.nbytes, 40)
+            cache.get_kernel("third", lambda: np.zeros(5))
+            self.assertIs(cache.get_kernel("second", lambda: None),
+                          cache.kernels["second"])
+            cache.get_kernel("fourth", lambda: np.zeros(5))
+            self.assertEqual(list(cache.kernels), ["second", "fourth"])
+            self.assertIsNot(cache.get_kernel("first", lambda: np.zeros(10)),
+                             first)
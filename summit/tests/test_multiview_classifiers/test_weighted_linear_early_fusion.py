@@ -2,11 +2,14 @@ import unittest
 
 import numpy as np
 import os
+import pickle
 
 from summit.tests.utils import rm_tmp, tmp_path, test_dataset
 
 from summit.multiview_platform.multiview_classifiers import \
     weighted_linear_early_fusion
+from summit.multiview_platform.multiview_classifiers.additions import \
+    fusion_utils
 
 
 class Test_WeightedLinearEarlyFusion(unittest.TestCase):
@@ -78,3 +81,62 @@ class Test_WeightedLinearEarlyFusion(unittest.TestCase):
         np.testing.assert_array_equal(X, self.dataset.get_v(0)[
                                       np.array([1, 2, 3]), :])
         np.testing.assert_array_equal(sample_indices, np.array([1, 2, 3]))
+
+    def test_transform_data_to_monoview_weighted(self):
+        classifier = weighted_linear_early_fusion.WeightedLinearEarlyFusion(
+            random_state=self.random_state, view_weights=[0.25, 0.75],
+            monoview_classifier_name=self.monoview_classifier_name,
+            monoview_classifier_config=self.monoview_classifier_config)
+        _, X = classifier.transform_data_to_monoview(self.dataset, None,
+                                                     np.array([0, 1]))
+        np.testing.assert_array_almost_equal(X, np.concatenate(
+            (self.dataset.get_v(0) * 0.5, self.dataset.get_v(1) * 1.5),
+            axis=1))
+        with fusion_utils.MonoviewMemo() as memo:
+            _, memo_X = classifier.transform_data_to_monoview(
+                self.dataset, None, np.array([0, 1]))
+            classifier.set_params(
+                monoview_classifier_name=self.monoview_classifier_name,
+                monoview_classifier_config=self.monoview_classifier_config,
+                view_weights=[0.5, 0.5])
+            _, uniform_X = classifier.transform_data_to_monoview(
+                self.dataset, None, np.array([0, 1]))
+            self.assertEqual(len(memo.concatenations), 1)
+        np.testing.assert_array_almost_equal(memo_X, X)
+        np.testing.assert_array_equal(uniform_X, np.concatenate(
+            (self.dataset.get_v(0), self.dataset.get_v(1)), axis=1))
+
+    def test_drawn_weights(self):
+        candidate = weighted_linear_early_fusion.ViewWeightsGenerator.get(
+        ).rvs(np.random.RandomState(42))
+        fitted_weights = []
+        for _ in range(2):
+            classifier = weighted_linear_early_fusion.WeightedLinearEarlyFusion(
+                random_state=self.random_state,
+                monoview_classifier_name=self.monoview_classifier_name,
+                monoview_classifier_config=self.monoview_classifier_config)
+            classifier.set_params(
+                monoview_classifier_name=self.monoview_classifier_name,
+                monoview_classifier_config=self.monoview_classifier_config,
+                view_weights=candidate)
+            classifier.fit(self.dataset, test_dataset.get_labels(), None,
+                           None)
+            fitted_weights.append(classifier.view_weights)
+        np.testing.assert_array_equal(fitted_weights[0], fitted_weights[1])
+        self.assertIsInstance(candidate,
+                              weighted_linear_early_fusion.WeightDistribution)
+
+    def test_predict_buffer(self):
+        self.classifier.fit(self.dataset, test_dataset.get_labels(), None,
+                            None)
+        self.classifier.predict(self.dataset, None, None)
+        buffer = self.classifier.predict_buffer_
+        self.classifier.predict(self.dataset, None, None)
+        self.assertIs(self.classifier.predict_buffer_, buffer)
+        self.assertNotIn("predict_buffer_", self.classifier.__getstate__())
+        unpickled = pickle.loads(pickle.dumps(self.classifier))
+        self.assertIs(self.classifier.predict_buffer_, buffer)
+        self.assertFalse(hasattr(unpickled, "predict_buffer_"))
+        np.testing.assert_array_equal(
+            unpickled.predict(self.dataset, None, None),
+            self.classifier.predict(self.dataset, None, None))
@@ -0,0 +1,78 @@
+import subprocess
+import sys
+import unittest
+
+from summit.multiview_platform import metrics, monoview_classifiers, \
+    multiview_classifiers
+from summit.multiview_platform.plugin_registry import PluginRegistry
+
+
+class Test_manifests(unittest.TestCase):
+
+    def test_monoview(self):
+        registry = monoview_classifiers.registry
+        self.assertEqual(sorted(registry.manifest), registry.names())
+        for name in registry.names():
+            self.assertEqual(
+                registry.manifest[name]["need_probas"],
+                monoview_classifiers.probe(
+                    getattr(monoview_classifiers, name))["need_probas"])
+            self.assertEqual(
+                registry.manifest[name]["classifier_class_name"],
+                getattr(monoview_classifiers, name).classifier_class_name)
+            module = getattr(monoview_classifiers, name)
+            declared = getattr(getattr(module, module.classifier_class_name)(),
+                               "native_multiclass", None)
+            if declared is not None:
+                self.assertEqual(registry.manifest[name]["multiclass"],
+                                 declared)
+
+    def test_multiview(self):
+        registry = multiview_classifiers.registry
+        self.assertEqual(sorted(registry.manifest), registry.names())
+        for name in registry.names():
+            self.assertEqual(
+                registry.manifest[name]["classifier_class_name"],
+                getattr(multiview_classifiers, name).classifier_class_name)
+
+    def test_metrics(self):
+        registry = metrics.registry
+        self.assertEqual(sorted(registry.manifest), registry.names())
+
+
+class Test_PluginRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = PluginRegistry(monoview_classifiers.__name__,
+                                       monoview_classifiers.__path__,
+                                       {"decision_tree": {"need_probas": 0}},
+                                       monoview_classifiers.probe)
+
+    def test_flags(self):
+        self.assertEqual(self.registry.get_flag("decision_tree",
+                                                "need_probas"), 0)
+        # Not in the manifest, so probed
+        self.assertEqual(self.registry.get_flags("lasso"),
+                         {"classifier_class_name": "Lasso",
+                          "need_probas": False})
+        self.assertIsNone(self.registry.get_flag("lasso", "multiclass"))
+
+    def test_load(self):
+        self.assertIs(self.registry.load("knn"), monoview_classifiers.knn)
+        self.assertNotIn("additions", self.registry.names())
+        self.registry.load("additions")
+        with self.assertRaises(AttributeError):
+            self.registry.load("unknown")
+
+    def test_lazy_import(self):
+        code = ("import sys\n"
+                "from summit.multiview_platform import monoview_classifiers\n"
+                "from summit.multiview_platform.multiview import "
+                "multiview_utils\n"
+                "monoview_classifiers.registry.names()\n"
+                "assert 'summit.multiview_platform.monoview_classifiers.knn' "
+                "not in sys.modules\n"
+                "monoview_classifiers.knn\n"
+                "assert 'summit.multiview_platform.monoview_classifiers.knn' "
+                "in sys.modules\n")
+        subprocess.check_call([sys.executable, "-c", code])
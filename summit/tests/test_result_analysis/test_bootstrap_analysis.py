@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+
+from summit.multiview_platform.multiview.multiview_utils import MultiviewResult
+
+from summit.multiview_platform.result_analysis.bootstrap_analysis import \
+    get_bootstrap_intervals
+
+
+class Test_get_bootstrap_intervals(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rs = np.random.RandomState(42)
+        cls.labels = cls.rs.randint(0, 3, size=200)
+        cls.test_indices = np.arange(50, 200)
+        noisy_pred = np.where(cls.rs.uniform(size=200) < 0.7, cls.labels,
+                              cls.rs.randint(0, 3, size=200))
+        cls.results = [MultiviewResult("perfect", "", {}, cls.labels.copy(),
+                                       0, 0, 0, {}, "clf"),
+                       MultiviewResult("noisy", "", {}, noisy_pred,
+                                       0, 0, 0, {}, "clf")]
+        cls.accuracy = np.mean(noisy_pred[cls.test_indices]
+                               == cls.labels[cls.test_indices])
+
+    def test_simple(self):
+        intervals = get_bootstrap_intervals(
+            {"accuracy_score*": {}, "f1_score": {"average": "macro"}},
+            self.results, self.labels, self.test_indices, nb_bootstrap=500,
+            random_state=np.random.RandomState(42))
+        self.assertEqual(list(intervals["accuracy_score*"].columns),
+                         ["perfect", "noisy"])
+        np.testing.assert_array_equal(intervals["accuracy_score*"]["perfect"],
+                                      [1, 1])
+        np.testing.assert_array_equal(intervals["f1_score"]["perfect"],
+                                      [1, 1])
+        lower, upper = intervals["accuracy_score*"]["noisy"]
+        self.assertLess(lower, self.accuracy)
+        self.assertGreater(upper, self.accuracy)
+        # The normal approximation of the 95% interval of an accuracy.
+        half_width = 1.96 * np.sqrt(self.accuracy * (1 - self.accuracy)
+                                    / len(self.test_indices))
+        self.assertAlmostEqual(upper - lower, 2 * half_width, delta=0.02)
+
+    def test_not_derived_metric(self):
+        intervals = get_bootstrap_intervals(
+            {"accuracy_score": {}, "f1_score": {"average": None,
+                                                "labels": [0]}},
+            self.results, self.labels, self.test_indices, nb_bootstrap=200,
+            confidence=0.9, random_state=np.random.RandomState(42))
+        lower, upper = intervals["f1_score"]["noisy"]
+        self.assertLessEqual(lower, upper)
+        np.testing.assert_array_equal(intervals["f1_score"]["perfect"],
+                                      [1, 1])
@@ -4,7 +4,9 @@ import numpy as np
 from summit.multiview_platform.monoview.monoview_utils import MonoviewResult
 from summit.multiview_platform.multiview.multiview_utils import MultiviewResult
 
-from summit.multiview_platform.result_analysis.error_analysis import get_sample_errors, gen_error_data, gen_error_data_glob
+from summit.multiview_platform.result_analysis.error_analysis import get_sample_errors, gen_error_data, gen_error_data_glob, \
+    get_difficulty_order, get_hardest_samples, bin_sample_errors, \
+    get_bin_names
 
 
 class Test_get_sample_errors(unittest.TestCase):
@@ -78,3 +80,39 @@ class Test_gen_error_data_glob(unittest.TestCase):
         np.testing.assert_array_equal(error_on_samples, np.sum(
             np.array([ada_sum, mv_sum]), axis=0) / (nb_classifiers * stats_iter))
         self.assertEqual(classifier_names, ["ada-1", "mv"])
+
+
+class Test_get_difficulty_order(unittest.TestCase):
+
+    def test_simple(self):
+        data = np.array([[1, 1], [0, 1], [-100, -100], [0, 0], [1, 0]])
+        labels = np.array([0, 0, 0, 1, 1])
+        np.testing.assert_array_equal(get_difficulty_order(data, labels),
+                                      [1, 0, 2, 3, 4])
+
+
+class Test_get_hardest_samples(unittest.TestCase):
+
+    def test_simple(self):
+        data = np.array([[1, 1], [0, 1], [-100, -100], [0, 0], [1, 0]])
+        np.testing.assert_array_equal(get_hardest_samples(data, 2), [3, 1])
+        np.testing.assert_array_equal(get_hardest_samples(data, 10),
+                                      [3, 1, 4, 0])
+
+
+class Test_bin_sample_errors(unittest.TestCase):
+
+    def test_simple(self):
+        data = np.array([[1, 1], [0, 1], [-100, -100], [-100, -100], [0, 0],
+                         [1, 0], [1, 1]])
+        binned_data, bin_starts = bin_sample_errors(data, 3)
+        np.testing.assert_array_equal(bin_starts, [0, 2, 4])
+        np.testing.assert_array_equal(binned_data, [[0.5, 1], [-100, -100],
+                                                    [2 / 3, 1 / 3]])
+
+    def test_more_bins_than_samples(self):
+        data = np.array([[1], [0]])
+        binned_data, bin_starts = bin_sample_errors(data, 5)
+        np.testing.assert_array_equal(binned_data, data)
+        self.assertEqual(get_bin_names(bin_starts, 2, ["a", "b"]),
+                         ["a to a (1 samples)", "b to b (1 samples)"])
@@ -6,7 +6,7 @@ import os
 from summit.multiview_platform.monoview.monoview_utils import MonoviewResult
 from summit.multiview_platform.multiview.multiview_utils import MultiviewResult
 
-from summit.multiview_platform.result_analysis.execution import format_previous_results, get_arguments, analyze_iterations
+from summit.multiview_platform.result_analysis.execution import format_previous_results, get_arguments, analyze_iterations, RunningStatistics
 from summit.tests.utils import rm_tmp, tmp_path, test_dataset
 
 class FakeClf():
@@ -103,6 +103,30 @@ class Test_format_previous_results(unittest.TestCase):
         self.assertEqual(durations_mean.at["ada-1", 'plif'], 0.5)
 
 
+class Test_RunningStatistics(unittest.TestCase):
+
+    def test_missing_cells(self):
+        random_state = np.random.RandomState(42)
+        dataframes = [pd.DataFrame(random_state.uniform(size=(2, 3)),
+                                   index=["train", "test"],
+                                   columns=["ada-1", "mv", "dt-1"]),
+                      pd.DataFrame(random_state.uniform(size=(2, 2)),
+                                   index=["train", "test"],
+                                   columns=["mv", "svm-0"]),
+                      pd.DataFrame([[np.nan, 0.5]], index=["test"],
+                                   columns=["ada-1", "mv"])]
+        statistics = RunningStatistics()
+        for dataframe in dataframes:
+            statistics.add(dataframe)
+        concatenated = pd.concat(dataframes)
+        grouped = concatenated.groupby(concatenated.index)
+        pd.testing.assert_frame_equal(statistics.get_mean(), grouped.mean())
+        pd.testing.assert_frame_equal(statistics.get_std(),
+                                      grouped.std(ddof=0))
+        pd.testing.assert_frame_equal(statistics.get_std(ddof=1),
+                                      grouped.std())
+
+
 class Test_get_arguments(unittest.TestCase):
 
     def setUp(self):
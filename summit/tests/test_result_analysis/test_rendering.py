@@ -0,0 +1,48 @@
+import os
+import unittest
+
+from summit.multiview_platform.result_analysis.rendering import FigurePool, \
+    render
+from summit.tests.utils import rm_tmp, tmp_path
+
+
+def write_file(file_name, content):
+    with open(file_name, "w") as file:
+        file.write(content)
+
+
+def fail():
+    raise ValueError("fail")
+
+
+class Test_FigurePool(unittest.TestCase):
+
+    def setUp(self):
+        rm_tmp()
+        os.mkdir(tmp_path)
+
+    def tearDown(self):
+        rm_tmp()
+
+    def test_inline(self):
+        with FigurePool() as pool:
+            self.assertIs(FigurePool.active, pool)
+            render(write_file, os.path.join(tmp_path, "a.txt"), "a")
+        self.assertIsNone(FigurePool.active)
+        self.assertTrue(os.path.isfile(os.path.join(tmp_path, "a.txt")))
+
+    def test_processes(self):
+        content = ["a"]
+        with FigurePool(nb_cores=1):
+            render(write_file, os.path.join(tmp_path, "a.txt"), content[0])
+            for index in range(3):
+                render(write_file, os.path.join(tmp_path,
+                                                "{}.txt".format(index)), "b")
+        with open(os.path.join(tmp_path, "a.txt")) as file:
+            self.assertEqual(file.read(), "a")
+        self.assertEqual(len(os.listdir(tmp_path)), 4)
+
+    def test_error(self):
+        with self.assertRaises(ValueError):
+            with FigurePool(nb_cores=2):
+                render(fail)
@@ -0,0 +1,90 @@
+import os
+import unittest
+
+import numpy as np
+
+from summit.multiview_platform.metrics import accuracy_score, f1_score
+from summit.multiview_platform.monoview.monoview_utils import MonoviewResult
+from summit.multiview_platform.multiview.multiview_utils import \
+    MultiviewResult
+from summit.multiview_platform.result_analysis.stored_analysis import \
+    get_metrics_dict, get_stored_arguments, get_stored_results
+from summit.multiview_platform.utils.results_store import ResultsStore
+from summit.tests.utils import rm_tmp, tmp_path
+
+
+class Test_get_metrics_dict(unittest.TestCase):
+
+    def test_stored(self):
+        stored_metrics = {"accuracy_score*": {}, "f1_score": {"average":
+                                                                  "macro"}}
+        self.assertEqual(get_metrics_dict(stored_metrics), stored_metrics)
+
+    def test_new_metrics(self):
+        metrics_dict = get_metrics_dict(
+            {"accuracy_score*": {}, "f1_score": {"average": "macro"}},
+            metrics=["f1_score", "matthews_corrcoef"],
+            metric_princ="matthews_corrcoef")
+        self.assertEqual(metrics_dict, {"f1_score": {"average": "macro"},
+                                        "matthews_corrcoef*": {}})
+
+    def test_missing_principal(self):
+        with self.assertRaises(ValueError):
+            get_metrics_dict({"accuracy_score*": {}}, metrics=["f1_score"])
+
+
+class Test_get_stored_results(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rm_tmp()
+        os.mkdir(tmp_path)
+        rs = np.random.RandomState(42)
+        cls.labels = rs.randint(0, 2, size=30)
+        cls.preds = rs.randint(0, 2, size=(2, 30))
+        cls.train_indices, cls.test_indices = np.arange(20), np.arange(20, 30)
+        scores = {"accuracy_score*": [0.5, 0.5]}
+        class_scores = {"accuracy_score*": ([0.5, 0.5], [0.5, 0.5])}
+        results = [
+            MonoviewResult(1, "dt", "view1", scores, cls.preds[0], {}, None,
+                           3, 0.1, 0.2, 0.3, class_scores),
+            MultiviewResult("mv", {}, scores, cls.preds[1], 1.0, 2.0, 3.0,
+                            class_scores, "clf")]
+        arguments = {"flag": 0, "directory": os.path.join(tmp_path, ""),
+                     "args": {"name": "db"},
+                     "labels_dictionary": {0: "a", 1: "b"},
+                     "classification_indices": [cls.train_indices,
+                                                cls.test_indices],
+                     "metrics": {"accuracy_score*": {}}}
+        cls.path = os.path.join(tmp_path, "results.hdf5")
+        with ResultsStore(cls.path, mode="w") as store:
+            store.save_config({"nb_bootstrap": 0})
+            store.add_iteration(arguments, results, cls.labels)
+
+    @classmethod
+    def tearDownClass(cls):
+        rm_tmp()
+
+    def test_results(self):
+        metrics_dict = {"accuracy_score*": {}, "f1_score": {}}
+        with ResultsStore(self.path) as store:
+            results = get_stored_results(store, 0, metrics_dict, ["a", "b"])
+            arguments = get_stored_arguments(store, 0, store.get_config(),
+                                             "out", metrics_dict)
+        self.assertEqual([result.get_classifier_name() for result in results],
+                         ["dt-view1", "mv"])
+        self.assertIsInstance(results[0], MonoviewResult)
+        self.assertEqual(results[0].view_index, 1)
+        self.assertEqual(results[1].fit_duration, 2.0)
+        for result, pred in zip(results, self.preds):
+            np.testing.assert_array_equal(result.full_labels_pred, pred)
+            self.assertAlmostEqual(
+                result.metrics_scores["f1_score"][1],
+                f1_score.score(self.labels[self.test_indices],
+                         pred[self.test_indices]))
+            self.assertAlmostEqual(
+                result.metrics_scores["accuracy_score*"][0],
+                accuracy_score.score(self.labels[self.train_indices],
+                               pred[self.train_indices]))
+        self.assertEqual(arguments["directory"], os.path.join("out", "."))
+        self.assertEqual(arguments["args"], {"nb_bootstrap": 0, "name": "db"})
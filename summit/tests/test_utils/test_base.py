@@ -7,6 +7,7 @@ from sklearn.model_selection import StratifiedKFold
 from sklearn.metrics import accuracy_score, f1_score
 
 from summit.tests.utils import rm_tmp, tmp_path
+from summit.multiview_platform import metrics
 from summit.multiview_platform.utils import base
 
 
@@ -113,6 +114,34 @@ class Test_ResultAnalyzer(unittest.TestCase):
         np.testing.assert_array_equal(train_score, self.train_accuracy)
         np.testing.assert_array_equal(test_score, self.test_accuracy)
 
+    def test_get_metric_scores_from_confusion(self):
+        RA = base.ResultAnalyser(self.classifier, self.classification_indices,
+                                 self.k_folds, self.hps_method,
+                                 self.metrics_list,
+                                 self.n_iter, self.class_label_names,
+                                 self.pred,
+                                 self.directory, self.base_file_name,
+                                 self.labels, self.database_name,
+                                 self.nb_cores, self.duration, [""])
+        for metric, metric_kwargs in [("f1_score", {"average": "macro"}),
+                                      ("matthews_corrcoef", {}),
+                                      ("zero_one_loss", {})]:
+            metric_module = getattr(metrics, metric)
+            cl_train, cl_test, train_score, test_score = RA.get_metric_score(
+                metric, metric_kwargs)
+            for indices, class_scores, score in [
+                    (self.train_indices, cl_train, train_score),
+                    (self.test_indices, cl_test, test_score)]:
+                self.assertAlmostEqual(score, metric_module.score(
+                    self.labels[indices], self.pred[indices],
+                    **metric_kwargs))
+                for label, class_score in zip(range(self.n_classes),
+                                              class_scores):
+                    class_indices = indices[self.labels[indices] == label]
+                    self.assertAlmostEqual(class_score, metric_module.score(
+                        self.labels[class_indices], self.pred[class_indices],
+                        **metric_kwargs))
+
     def test_get_all_metrics_scores(self):
         RA = base.ResultAnalyser(self.classifier, self.classification_indices,
                                  self.k_folds, self.hps_method,
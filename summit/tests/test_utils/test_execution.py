@@ -5,7 +5,7 @@ import numpy as np
 
 from summit.tests.utils import rm_tmp, tmp_path, test_dataset
 
-from summit.multiview_platform.utils import execution
+from summit.multiview_platform.utils import configuration, execution
 
 
 class Test_parseTheArgs(unittest.TestCase):
@@ -16,6 +16,27 @@ class Test_parseTheArgs(unittest.TestCase):
     def test_empty_args(self):
         args = execution.parse_the_args([])
 
+    def test_plan(self):
+        self.assertFalse(execution.parse_the_args([]).plan)
+        self.assertTrue(execution.parse_the_args(["--plan"]).plan)
+
+
+class Test_get_plan(unittest.TestCase):
+
+    def test_simple(self):
+        args = configuration.pass_default_config(
+            name="plausible", type=["monoview", "multiview"],
+            algos_monoview=["all"],
+            algos_multiview=["weighted_linear_late_fusion", "unknown"],
+            metrics="all")
+        plan = execution.get_plan(args)
+        self.assertIn("Datasets : plausible", plan)
+        self.assertIn("Monoview classifiers (13) :", plan)
+        self.assertIn("\tsvm_rbf : classifier_class_name=SVMRBF, "
+                      "multiclass=True, need_probas=True", plan)
+        self.assertIn("\tunknown : not available", plan)
+        self.assertNotIn("log_loss", plan)
+
 
 class Test_init_log_file(unittest.TestCase):
 
@@ -0,0 +1,65 @@
+import os
+import unittest
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from summit.tests.utils import rm_tmp, tmp_path
+from summit.multiview_platform.utils import hps_study
+
+
+class Test_HPSStudy(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rm_tmp()
+        os.mkdir(tmp_path)
+        cls.study = hps_study.HPSStudy(os.path.join(tmp_path, "study.db"))
+        cls.study.add_trial("data", "folds", "Clf", "", "acc", "a: 1\n",
+                            np.array([0.5, 0.7]), 1.0)
+        cls.study.add_trial("data", "folds", "Clf", "", "acc", "a: 2\n",
+                            np.array([0.9, 0.9]), 1.0)
+        cls.study.add_trial("other_data", "folds", "Clf", "", "acc",
+                            "a: 3\n", np.array([0.8, 0.8]), 1.0)
+        cls.study.add_trial("data", "folds", "Clf", "", "acc",
+                            "a: DecisionTreeClassifier\na__max_depth: 1\n",
+                            np.array([1.0, 1.0]), 1.0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.study.close()
+        rm_tmp()
+
+    def test_get_fold_scores(self):
+        np.testing.assert_array_equal(
+            self.study.get_fold_scores("data", "folds", "Clf", "acc",
+                                       "a: 1\n"), np.array([0.5, 0.7]))
+        self.assertIsNone(self.study.get_fold_scores("data", "other_folds",
+                                                     "Clf", "acc", "a: 1\n"))
+
+    def test_get_top_params(self):
+        self.assertEqual(self.study.get_top_params("Clf", "", "acc", 2),
+                         [{"a": 2}, {"a": 3}])
+        self.assertEqual(self.study.get_top_params("Clf", "", "acc", 2,
+                                                   dataset="data"),
+                         [{"a": 2}, {"a": 1}])
+
+    def test_load_params(self):
+        self.assertEqual(hps_study.load_params("a: [1, 2]\nb: c\n"),
+                         {"a": [1, 2], "b": "c"})
+        self.assertIsNone(hps_study.load_params(
+            "a: DecisionTreeClassifier\na__max_depth: 1\n"))
+        self.assertIsNone(hps_study.load_params(
+            "a: !!python/object:numpy.random.RandomState {}\n"))
+
+
+class Test_get_fingerprint(unittest.TestCase):
+
+    def test_simple(self):
+        array = np.array([[0, 1], [2, 0]])
+        self.assertEqual(hps_study.get_fingerprint([array]),
+                         hps_study.get_fingerprint([array.copy()]))
+        self.assertNotEqual(hps_study.get_fingerprint([array]),
+                            hps_study.get_fingerprint([array.T]))
+        self.assertEqual(hps_study.get_fingerprint([csr_matrix(array)]),
+                         hps_study.get_fingerprint([csr_matrix(array)]))
@@ -1,18 +1,22 @@
 import os
+import sqlite3
 import unittest
 
 import h5py
 import numpy as np
 from sklearn.model_selection import StratifiedKFold
-from sklearn.metrics import accuracy_score, make_scorer
+from sklearn.metrics import accuracy_score, make_scorer, zero_one_loss
 from summit.tests.utils import rm_tmp, tmp_path, test_dataset
-from sklearn.base import BaseEstimator
+from sklearn.base import BaseEstimator, clone
+from sklearn.svm import SVC
 import sys
 
 
 from summit.multiview_platform.utils.dataset import HDF5Dataset
 from summit.multiview_platform.utils import hyper_parameter_search
 from summit.multiview_platform.multiview_classifiers import weighted_linear_early_fusion
+from summit.multiview_platform.monoview_classifiers import lasso, sgd, \
+    svm_linear
 
 
 class FakeEstim(BaseEstimator):
@@ -53,6 +57,47 @@ class FakeEstimMV(BaseEstimator):
         return {"param1":"", "param2":""}
 
 
+class FakeStagedEstim(BaseEstimator):
+    fitted_n_estimators = []
+
+    def __init__(self, n_estimators=1, param1=None):
+        self.n_estimators = n_estimators
+        self.param1 = param1
+
+    def fit(self, X, y):
+        self.fitted_n_estimators.append(self.n_estimators)
+        self.classes_ = np.unique(y)
+        return self
+
+    def predict(self, X):
+        return list(self.staged_predict(X))[-1]
+
+    def staged_predict(self, X):
+        # The predictions are only right from the third stage on.
+        for stage in range(self.n_estimators):
+            if stage < 2:
+                yield np.zeros(X.shape[0]) - 1
+            else:
+                yield X[:, 0]
+
+    def gen_distribs(self):
+        return {"n_estimators": "", "param1": ""}
+
+
+class FakeFailingStagedEstim(FakeStagedEstim):
+
+    def fit(self, X, y):
+        if self.param1 == 1:
+            raise ValueError("Fake failure")
+        return FakeStagedEstim.fit(self, X, y)
+
+
+class FakeFailingEstimMV(FakeEstimMV):
+
+    def fit(self, X, y, train_indices=None, view_indices=None):
+        raise ValueError("Fake failure")
+
+
 class Test_Random(unittest.TestCase):
 
     @classmethod
@@ -147,6 +192,286 @@ class Test_Random(unittest.TestCase):
         self.assertEqual(RSCV.best_params_["param1"], "return exact")
 
 
+class Test_deduplication(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.X = np.array([[0], [1], [0], [1], [0], [1], [0], [1]])
+        cls.y = cls.X[:, 0]
+        cls.param_distributions = {
+            "n_estimators": hyper_parameter_search.CustomRandint(low=1,
+                                                                 high=4),
+            "param1": [0]}
+
+    def setUp(self):
+        FakeStagedEstim.fitted_n_estimators = []
+
+    def test_fit(self):
+        random_search = hyper_parameter_search.Random(
+            FakeStagedEstim(), self.param_distributions, n_iter=5,
+            scoring=make_scorer(accuracy_score),
+            cv=StratifiedKFold(n_splits=2), random_state=42,
+            equivalent_draws=False, staged_eval=False)
+        random_search.fit(self.X, self.y)
+        self.assertEqual(sorted(params["n_estimators"] for params
+                                in random_search.candidate_params), [1, 2, 3])
+        self.assertEqual(len(FakeStagedEstim.fitted_n_estimators), 6)
+        self.assertGreater(len(random_search.duplicate_params), 0)
+        duplicate_of = random_search.cv_results_["duplicate_of"]
+        self.assertEqual(len(duplicate_of),
+                         len(random_search.cv_results_["mean_test_score"]))
+        for result_index, candidate_index in enumerate(duplicate_of):
+            if candidate_index >= 0:
+                self.assertEqual(
+                    random_search.cv_results_["mean_test_score"][result_index],
+                    random_search.cv_results_["mean_test_score"][
+                        candidate_index])
+        for param_name in self.param_distributions:
+            self.assertEqual(
+                len(random_search.cv_results_["param_" + param_name]),
+                len(duplicate_of))
+
+    def test_report(self):
+        rm_tmp()
+        random_search = hyper_parameter_search.Random(
+            FakeStagedEstim(), self.param_distributions, n_iter=5,
+            scoring=make_scorer(accuracy_score),
+            cv=StratifiedKFold(n_splits=2), random_state=42,
+            equivalent_draws=False, staged_eval=False)
+        random_search.fit(self.X, self.y)
+        random_search.gen_report(os.path.join(tmp_path, ""))
+        with open(os.path.join(tmp_path, "hps_report.txt")) as report_file:
+            report = report_file.read()
+        rm_tmp()
+        for n_estimators in [1, 2, 3]:
+            self.assertEqual(report.count(
+                "n_estimators: {}\n".format(n_estimators)), 1)
+        self.assertEqual(report.count("drawn"), len(set(
+            random_search.cv_results_["duplicate_of"]) - {-1}))
+
+    def test_failed_candidates(self):
+        random_search = hyper_parameter_search.Random(
+            FakeFailingStagedEstim(),
+            dict(self.param_distributions, param1=[0, 1]), n_iter=8,
+            scoring=make_scorer(accuracy_score),
+            cv=StratifiedKFold(n_splits=2), random_state=42,
+            equivalent_draws=False)
+        random_search.fit(self.X, self.y)
+        cv_results = random_search.cv_results_
+        self.assertGreater(len(random_search.tracebacks), 0)
+        self.assertIn(0, cv_results["duplicate_of"])
+        for param_name in ["n_estimators", "param1"]:
+            self.assertEqual(len(cv_results["param_" + param_name]),
+                             len(cv_results["params"]))
+        for result_index, row in enumerate(cv_results["duplicate_of"]):
+            if row >= 0:
+                self.assertEqual(cv_results["params"][result_index],
+                                 cv_results["params"][row])
+                self.assertEqual(cv_results["mean_test_score"][result_index],
+                                 cv_results["mean_test_score"][row])
+
+    def test_all_failed_multiview(self):
+        random_search = hyper_parameter_search.Random(
+            FakeFailingEstimMV(),
+            {"param1": [0], "param2": hyper_parameter_search.CustomRandint(
+                low=1, high=2)}, n_iter=3, refit=True,
+            scoring=make_scorer(accuracy_score),
+            cv=StratifiedKFold(n_splits=2), random_state=42,
+            available_indices=np.arange(10), framework="multiview",
+            equivalent_draws=False)
+        with self.assertRaises(ValueError):
+            random_search.fit(test_dataset,
+                              np.array([0, 1, 0, 1, 0, 1, 0, 1, 0, 1]))
+        self.assertEqual(len(random_search.candidate_params), 1)
+
+
+class Test_fit_staged(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.X = np.array([[0], [1], [0], [1], [0], [1], [0], [1]])
+        cls.y = cls.X[:, 0]
+        cls.param_grid = {"n_estimators": [1, 2, 3, 5], "param1": [0, 1]}
+
+    def setUp(self):
+        FakeStagedEstim.fitted_n_estimators = []
+
+    def test_one_fit_per_group_and_fold(self):
+        grid = hyper_parameter_search.Grid(FakeStagedEstim(),
+                                           param_grid=self.param_grid,
+                                           scoring=make_scorer(accuracy_score),
+                                           cv=StratifiedKFold(n_splits=2))
+        grid.fit(self.X, self.y)
+        self.assertEqual(FakeStagedEstim.fitted_n_estimators, [5, 5, 5, 5])
+        np.testing.assert_array_equal(grid.cv_results_["mean_test_score"],
+                                      np.array([0, 0, 0, 0, 1, 1, 1, 1]))
+        self.assertEqual(grid.best_params_, {"n_estimators": 3, "param1": 0})
+
+    def test_early_stopped(self):
+        grid = hyper_parameter_search.Grid(FakeStagedEstim(),
+                                           param_grid=self.param_grid,
+                                           scoring=make_scorer(accuracy_score),
+                                           cv=StratifiedKFold(n_splits=2))
+        stages = np.array([1, 2, 10])
+        scores = grid.score_stages(FakeStagedEstim(n_estimators=3), self.X,
+                                   self.y, np.arange(4), stages)
+        np.testing.assert_array_equal(scores, np.array([0, 0, 1]))
+
+    def test_not_staged(self):
+        random_search = hyper_parameter_search.Random(
+            FakeStagedEstim(), self.param_grid, n_iter=8,
+            scoring=make_scorer(accuracy_score),
+            cv=StratifiedKFold(n_splits=2), random_state=42,
+            equivalent_draws=False, staged_eval=False)
+        random_search.fit(self.X, self.y)
+        self.assertEqual(len(FakeStagedEstim.fitted_n_estimators), 16)
+
+
+class Test_fit_path(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.random_state = np.random.RandomState(42)
+        cls.X = cls.random_state.uniform(size=(30, 5))
+        cls.y = (cls.X[:, 0] > 0.5).astype(int)
+        cls.param_distributions = {"C": [0.01, 0.1, 1.0, 10.0]}
+
+    def search(self, path_eval, estimator=None, param_distributions=None):
+        random_search = hyper_parameter_search.Random(
+            svm_linear.SVMLinear(random_state=42) if estimator is None
+            else estimator,
+            self.param_distributions if param_distributions is None
+            else param_distributions,
+            n_iter=4, scoring=make_scorer(accuracy_score),
+            cv=StratifiedKFold(n_splits=2), random_state=42,
+            equivalent_draws=False, path_eval=path_eval)
+        return random_search.fit(self.X, self.y)
+
+    def test_same_scores(self):
+        path_search = self.search(True)
+        search = self.search(False)
+        self.assertEqual([params["C"] for params in path_search.cv_results_["params"]],
+                         [params["C"] for params in search.cv_results_["params"]])
+        np.testing.assert_array_almost_equal(
+            path_search.cv_results_["mean_test_score"],
+            search.cv_results_["mean_test_score"])
+
+    def test_same_alpha_predictions(self):
+        alphas = [0.0001, 0.001, 0.01, 0.1]
+        estimator = lasso.Lasso(random_state=42)
+        path_predictions = clone(estimator).path_predict(
+            self.X[:20], self.y[:20], self.X[20:], alphas)
+        for alpha, path_prediction in zip(alphas, path_predictions):
+            np.testing.assert_array_equal(
+                path_prediction,
+                clone(estimator).set_params(alpha=alpha).fit(
+                    self.X[:20], self.y[:20]).predict(self.X[20:]))
+        # A warm start would change the predictions of the SGD, that is
+        # evaluated with independent fits.
+        sgd_distributions = {"alpha": alphas, "loss": ["hinge"],
+                             "penalty": ["l2"]}
+        path_search = self.search(True, sgd.SGD(random_state=42),
+                                  sgd_distributions)
+        search = self.search(False, sgd.SGD(random_state=42),
+                             sgd_distributions)
+        self.assertFalse(path_search.can_follow_path(sgd_distributions))
+        np.testing.assert_array_equal(
+            path_search.cv_results_["mean_test_score"],
+            search.cv_results_["mean_test_score"])
+
+    def test_svc_params(self):
+        estimator = svm_linear.SVMLinear(random_state=42)
+        estimator.class_weight = {0: 10, 1: 1}
+        estimator.tol = 0.1
+        path_predictions = estimator.path_predict(
+            self.X[:20], self.y[:20], self.X[20:], [0.01, 1.0])
+        for C, path_prediction in zip([0.01, 1.0], path_predictions):
+            np.testing.assert_array_equal(
+                path_prediction,
+                SVC(C=C, kernel="linear", class_weight={0: 10, 1: 1},
+                    tol=0.1, max_iter=1000, random_state=42).fit(
+                    self.X[:20], self.y[:20]).predict(self.X[20:]))
+
+
+class Test_study(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rm_tmp()
+        os.mkdir(tmp_path)
+        cls.X = np.array([[0], [1], [0], [1], [0], [1], [0], [1]])
+        cls.y = cls.X[:, 0]
+
+    @classmethod
+    def tearDownClass(cls):
+        rm_tmp()
+
+    def setUp(self):
+        FakeStagedEstim.fitted_n_estimators = []
+
+    def search(self, param_grid, X=None, estimator=None, **study_kwargs):
+        grid = hyper_parameter_search.Grid(
+            FakeStagedEstim() if estimator is None else estimator,
+            param_grid=param_grid, scoring=make_scorer(accuracy_score),
+            cv=StratifiedKFold(n_splits=2), staged_eval=False,
+            study_path=os.path.join(tmp_path, "study.db"), **study_kwargs)
+        return grid.fit(self.X if X is None else X, self.y)
+
+    def test_skip_known_and_seed(self):
+        self.search({"n_estimators": [1, 3], "param1": [0]})
+        self.assertEqual(FakeStagedEstim.fitted_n_estimators, [1, 1, 3, 3])
+        grid = self.search({"n_estimators": [1, 3], "param1": [0]})
+        self.assertEqual(len(FakeStagedEstim.fitted_n_estimators), 4)
+        np.testing.assert_array_equal(grid.cv_results_["mean_test_score"],
+                                      np.array([0, 1]))
+        grid = self.search({"n_estimators": [2], "param1": [0]},
+                           study_seed_top_k=1)
+        self.assertEqual(grid.best_params_, {"n_estimators": 3, "param1": 0})
+        self.assertEqual(len(FakeStagedEstim.fitted_n_estimators), 6)
+
+    def test_seed_monoview_views(self):
+        self.search({"n_estimators": [5], "param1": [1]}, view_name="view0")
+        grid = self.search({"n_estimators": [4], "param1": [1]},
+                           view_name="view1", study_seed_top_k=1)
+        self.assertEqual(grid.candidate_params,
+                         [{"n_estimators": 4, "param1": 1}])
+        grid = self.search({"n_estimators": [4], "param1": [1]},
+                           X=1 - self.X, view_name="view0",
+                           study_seed_top_k=1)
+        self.assertEqual(grid.candidate_params,
+                         [{"n_estimators": 4, "param1": 1}])
+        grid = self.search({"n_estimators": [4], "param1": [1]},
+                           view_name="view0", study_seed_top_k=1)
+        self.assertEqual(grid.candidate_params,
+                         [{"n_estimators": 4, "param1": 1},
+                          {"n_estimators": 5, "param1": 1}])
+
+    def test_multiview_loss(self):
+        y = np.array([0, 1, 0, 1, 0])
+        results = []
+        for study_path in [None, os.path.join(tmp_path, "loss_study.db")]:
+            grid = hyper_parameter_search.Grid(
+                FakeEstimMV(), param_grid={"param1": ["return exact", None]},
+                scoring=make_scorer(zero_one_loss, greater_is_better=False),
+                cv=StratifiedKFold(n_splits=2), framework="multiview",
+                available_indices=np.arange(5), study_path=study_path)
+            grid.fit(test_dataset, y)
+            results.append((grid.best_params_, grid.best_score_))
+        self.assertEqual(results[0], ({"param1": "return exact"}, 0))
+        self.assertEqual(results[1], results[0])
+
+    def test_closed_on_error(self):
+        grid = hyper_parameter_search.Grid(
+            FakeFailingEstimMV(), param_grid={"param1": [0]},
+            scoring=make_scorer(accuracy_score),
+            cv=StratifiedKFold(n_splits=2), track_tracebacks=False,
+            study_path=os.path.join(tmp_path, "study.db"))
+        with self.assertRaises(ValueError):
+            grid.fit(self.X, self.y)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            grid.study_.connection.execute("SELECT * FROM trials")
+
+
 class Test_Grid(unittest.TestCase):
 
     @classmethod
@@ -0,0 +1,94 @@
+import unittest
+
+import numpy as np
+from sklearn.metrics import confusion_matrix
+
+from summit.multiview_platform import metrics
+from summit.multiview_platform.utils import metric_engine
+
+
+class Test_confusion_matrices(unittest.TestCase):
+
+    def setUp(self):
+        self.rs = np.random.RandomState(42)
+        self.labels = np.array([0, 1, 3])
+        self.y_true = self.rs.choice(self.labels, size=40)
+        self.y_pred = self.rs.choice(self.labels, size=40)
+
+    def test_confusion_matrix(self):
+        np.testing.assert_array_equal(
+            metric_engine.get_confusion_matrix(self.y_true, self.y_pred,
+                                               self.labels),
+            confusion_matrix(self.y_true, self.y_pred, labels=self.labels))
+
+    def test_class_confusion_matrices(self):
+        confusion = metric_engine.get_confusion_matrix(self.y_true,
+                                                       self.y_pred,
+                                                       self.labels)
+        class_confusions = metric_engine.get_class_confusion_matrices(
+            confusion)
+        for index, label in enumerate(self.labels):
+            mask = self.y_true == label
+            np.testing.assert_array_equal(
+                class_confusions[index],
+                confusion_matrix(self.y_true[mask], self.y_pred[mask],
+                                 labels=self.labels))
+
+
+class Test_get_confusion_metric(unittest.TestCase):
+
+    def setUp(self):
+        self.rs = np.random.RandomState(42)
+
+    def check_metric(self, metric_name, metric_kwargs, nb_labels):
+        y_true = self.rs.randint(0, nb_labels, size=30)
+        y_pred = self.rs.randint(0, nb_labels, size=30)
+        labels = np.union1d(y_true, y_pred)
+        score = metric_engine.get_confusion_metric(metric_name,
+                                                   metric_kwargs, labels)
+        self.assertIsNotNone(score)
+        confusion = metric_engine.get_confusion_matrix(y_true, y_pred, labels)
+        metric_module = getattr(metrics, metric_name)
+        self.assertAlmostEqual(
+            score(confusion),
+            metric_module.score(y_true, y_pred, **metric_kwargs))
+        class_scores = score(
+            metric_engine.get_class_confusion_matrices(confusion))
+        for label, class_score in zip(labels, class_scores):
+            mask = y_true == label
+            if mask.any():
+                self.assertAlmostEqual(class_score, metric_module.score(
+                    y_true[mask], y_pred[mask], **metric_kwargs))
+
+    def test_multiclass(self):
+        for metric_name in ["accuracy_score", "f1_score", "fbeta_score",
+                            "hamming_loss", "matthews_corrcoef",
+                            "precision_score", "recall_score",
+                            "zero_one_loss"]:
+            self.check_metric(metric_name, {}, 4)
+        for average in ["micro", "macro", "weighted"]:
+            for metric_name in ["f1_score", "jaccard_score",
+                                "precision_score", "recall_score"]:
+                self.check_metric(metric_name, {"average": average}, 4)
+        self.check_metric("fbeta_score", {"beta": 0.5, "average": "macro",
+                                          "zero_division": 1}, 4)
+
+    def test_binary(self):
+        for metric_name in ["f1_score", "jaccard_score", "precision_score",
+                            "recall_score"]:
+            self.check_metric(metric_name, {"average": "binary"}, 2)
+        self.check_metric("jaccard_score", {}, 2)
+        self.check_metric("matthews_corrcoef", {}, 2)
+
+    def test_not_derived(self):
+        labels = np.arange(3)
+        self.assertIsNone(metric_engine.get_confusion_metric(
+            "roc_auc_score", {}, labels))
+        self.assertIsNone(metric_engine.get_confusion_metric(
+            "f1_score", {"average": None}, labels))
+        self.assertIsNone(metric_engine.get_confusion_metric(
+            "jaccard_score", {}, labels))
+        self.assertIsNone(metric_engine.get_confusion_metric(
+            "f1_score", {"average": "macro", "labels": [0]}, labels))
+        self.assertIsNone(metric_engine.get_confusion_metric(
+            "accuracy_score", {"sample_weight": np.ones(3)}, labels))
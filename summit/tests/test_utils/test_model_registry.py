@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+
+from summit.multiview_platform.monoview_classifiers.adaboost import Adaboost
+from summit.multiview_platform.monoview_classifiers.decision_tree import \
+    DecisionTree
+from summit.multiview_platform.utils.model_registry import ModelRegistry
+from summit.multiview_platform.utils.multiclass import OVRWrapper
+
+
+def rs(seed):
+    return np.random.RandomState(seed)
+
+
+class Test_ModelRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.train_indices = np.arange(10)
+
+    def test_key(self):
+        key = ModelRegistry.get_key("decision_tree",
+                                    DecisionTree(max_depth=2,
+                                                 random_state=rs(1)),
+                                    0, self.train_indices)
+        self.assertEqual(key, ModelRegistry.get_key(
+            "decision_tree",
+            DecisionTree(max_depth=2, random_state=rs(3)), 0,
+            list(self.train_indices)))
+        self.assertNotEqual(key, ModelRegistry.get_key(
+            "decision_tree", DecisionTree(max_depth=3), 0,
+            self.train_indices))
+        self.assertNotEqual(key, ModelRegistry.get_key(
+            "decision_tree", DecisionTree(max_depth=2), 1,
+            self.train_indices))
+        self.assertNotEqual(key, ModelRegistry.get_key(
+            "decision_tree", OVRWrapper(DecisionTree(max_depth=2)), 0,
+            self.train_indices))
+
+    def test_key_estimator_param(self):
+        # Adaboost's own estimator parameter is not a wrapped estimator.
+        key = ModelRegistry.get_key("adaboost", Adaboost(n_estimators=5),
+                                    0, self.train_indices)
+        self.assertNotEqual(key, ModelRegistry.get_key(
+            "adaboost", Adaboost(n_estimators=6), 0, self.train_indices))
+
+    def test_add_get(self):
+        estimator = DecisionTree(max_depth=2)
+        prediction = np.ones(5)
+        with ModelRegistry() as registry:
+            key = registry.get_key("decision_tree", estimator, 0,
+                                   self.train_indices)
+            registry.add(key, estimator, config={"max_depth": 2},
+                         predictions=[(np.arange(5), prediction)])
+            self.assertIs(ModelRegistry.active, registry)
+            self.assertIs(registry.get_estimator(key), estimator)
+            self.assertIs(registry.get_predictions(estimator, "predict",
+                                                   np.arange(5)), prediction)
+            self.assertIsNone(registry.get_predictions(estimator, "predict",
+                                                       np.arange(4)))
+            self.assertIsNone(registry.get_predictions(
+                estimator, "predict_proba", np.arange(5)))
+        self.assertIsNone(ModelRegistry.active)
+        self.assertIsNone(registry.get_estimator(key))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,9 @@ import unittest
 
 import numpy as np
 from sklearn.base import BaseEstimator
+from sklearn.multiclass import _ovr_decision_function
 
+from summit.multiview_platform.utils import multiclass
 from summit.multiview_platform.utils.multiclass import get_mc_estim, \
     OVRWrapper, OVOWrapper, MultiviewOVOWrapper, MultiviewOVRWrapper
 
@@ -76,6 +78,45 @@ class Test_get_mc_estim(unittest.TestCase):
         self.assertIsInstance(returned_estimator, MultiviewOVRWrapper)
 
 
+class FakeProbedEstim(BaseEstimator):
+    probes = 0
+
+    def __init__(self, param=1):
+        self.param = param
+
+    def accepts_multi_class(self, random_state):
+        FakeProbedEstim.probes += 1
+        return self.param > 1
+
+
+class FakeDeclaredEstim(FakeProbedEstim):
+
+    def __init__(self, param=1):
+        FakeProbedEstim.__init__(self, param)
+        self.native_multiclass = True
+
+
+class Test_accepts_multi_class(unittest.TestCase):
+
+    def setUp(self):
+        self.random_state = np.random.RandomState(42)
+        FakeProbedEstim.probes = 0
+
+    def test_cached_probe(self):
+        for _ in range(3):
+            self.assertFalse(multiclass.accepts_multi_class(
+                FakeProbedEstim(param=1), self.random_state))
+        self.assertEqual(FakeProbedEstim.probes, 1)
+        self.assertTrue(multiclass.accepts_multi_class(
+            FakeProbedEstim(param=2), self.random_state))
+        self.assertEqual(FakeProbedEstim.probes, 2)
+
+    def test_declared(self):
+        self.assertTrue(multiclass.accepts_multi_class(
+            FakeDeclaredEstim(param=1), self.random_state))
+        self.assertEqual(FakeProbedEstim.probes, 0)
+
+
 class FakeMVClassifier(BaseEstimator):
 
     def __init__(self, short_name="None"):
@@ -170,5 +211,51 @@ class Test_MultiviewOVOWrapper_fit(unittest.TestCase):
                                           self.sample_indices)
 
 
+class FakeMVClassifierRandom(FakeMVClassifier):
+
+    def fit(self, X, y, train_indices=None, view_indices=None):
+        self.train_indices = train_indices
+        self.seed = int(np.sum(train_indices * y[train_indices]))
+        return self
+
+    def predict(self, X, sample_indices=None, view_indices=None):
+        return np.random.RandomState(self.seed).randint(
+            0, 2, sample_indices.shape[0])
+
+
+class Test_MultiviewOVOWrapper_streamed(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.random_state = np.random.RandomState(42)
+        cls.X = FakeDset(n_samples=60)
+        cls.y = cls.random_state.randint(0, 4, 60)
+        cls.train_indices = cls.random_state.permutation(40)
+        cls.sample_indices = np.arange(40, 60)
+
+    def test_pair_indices(self):
+        wrapper = MultiviewOVOWrapper(FakeMVClassifierRandom())
+        wrapper.fit(self.X, self.y, train_indices=self.train_indices,
+                    view_indices="None")
+        pairs = [(i, j) for i in range(4) for j in range(i + 1, 4)]
+        for (i, j), estimator in zip(pairs, wrapper.estimators_):
+            expected = np.sort(self.train_indices[
+                np.isin(self.y[self.train_indices], [i, j])])
+            np.testing.assert_array_equal(estimator.train_indices, expected)
+
+    def test_decision_function(self):
+        wrapper = MultiviewOVOWrapper(FakeMVClassifierRandom(), n_jobs=2)
+        wrapper.fit(self.X, self.y, train_indices=self.train_indices,
+                    view_indices="None")
+        decision = wrapper.multiview_decision_function(
+            self.X, sample_indices=self.sample_indices, view_indices="None")
+        predictions = np.vstack([
+            estimator.predict(self.X, sample_indices=self.sample_indices)
+            for estimator in wrapper.estimators_]).T
+        np.testing.assert_array_almost_equal(
+            decision, _ovr_decision_function(predictions,
+                                             np.ones(predictions.shape), 4))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,145 @@
+import os
+import pickle
+import unittest
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import confusion_matrix
+from sklearn.model_selection import StratifiedKFold
+from sklearn.tree import DecisionTreeClassifier
+
+from summit.multiview_platform.monoview.monoview_utils import MonoviewResult
+from summit.multiview_platform.multiview.multiview_utils import \
+    MultiviewResult
+from summit.multiview_platform.utils.results_store import ResultsStore
+from summit.tests.utils import rm_tmp, tmp_path
+
+
+class Test_ResultsStore(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rm_tmp()
+        os.mkdir(tmp_path)
+        cls.rs = np.random.RandomState(42)
+        cls.labels = cls.rs.randint(0, 3, size=20)
+        cls.classification_indices = [np.arange(12), np.arange(12, 20)]
+        classifier = DecisionTreeClassifier(max_depth=3).fit(
+            cls.rs.randint(0, 2, size=(20, 2)), cls.labels)
+        cls.metrics = {"accuracy_score*": {}, "f1_score": {}}
+        cls.results = [
+            MonoviewResult(0, "dt", "view0",
+                           {"accuracy_score*": [0.9, 0.8],
+                            "f1_score": [0.91, 0.81]},
+                           cls.rs.randint(0, 3, size=20), {"max_depth": 3},
+                           classifier, np.int64(4), 0.1, 0.2, 0.3,
+                           {"accuracy_score*": ([1, 0.9, 0.8], [0.8, 0.7, 1]),
+                            "f1_score": ([1, 0.9, 0.8], [0.8, 0.7, 1])}),
+            MultiviewResult("mv", {"alpha": np.float64(0.5)},
+                            {"accuracy_score*": [0.7, 0.6],
+                             "f1_score": [0.71, 0.61]},
+                            cls.rs.randint(0, 3, size=20), 1.0, 2.0, 3.0,
+                            {"accuracy_score*": ([1, 1, 1], [0, 0, 0]),
+                             "f1_score": ([1, 1, 1], [0, 0, 0])}, "clf")]
+        cls.arguments = {"flag": 1, "directory": os.path.join(tmp_path,
+                                                              "iter_2"),
+                         "args": {"name": "db"},
+                         "labels_dictionary": {0: "a", 1: "b", 2: "c"},
+                         "classification_indices": cls.classification_indices,
+                         "k_folds": StratifiedKFold(n_splits=2),
+                         "metrics": cls.metrics}
+        cls.feature_importances = {"view0": pd.DataFrame(
+            {"dt": [0.0, 0.75]}, index=["f0", "f1"])}
+        cls.path = os.path.join(tmp_path, "results.hdf5")
+        with ResultsStore(cls.path, mode="w") as store:
+            cls.active = ResultsStore.active is store
+            store.save_config({"name": "db", "stats_iter": 2})
+            store.add_iteration(cls.arguments, cls.results, cls.labels,
+                                sample_ids=["s{}".format(index)
+                                            for index in range(20)],
+                                feature_importances=cls.feature_importances,
+                                dataset_name="db_file")
+
+    @classmethod
+    def tearDownClass(cls):
+        rm_tmp()
+
+    def test_active(self):
+        self.assertTrue(self.active)
+        self.assertIsNone(ResultsStore.active)
+
+    def test_query(self):
+        with ResultsStore(self.path) as store:
+            self.assertIsNone(ResultsStore.active)
+            self.assertEqual(store.get_config(),
+                             {"name": "db", "stats_iter": 2})
+            self.assertEqual(store.iterations(), [1])
+            self.assertEqual(store.get_relative_directory(1), "iter_2")
+            self.assertEqual(store.get_metrics_dict(1), self.metrics)
+            self.assertEqual(store.get_classifier_names(1),
+                             ["dt-view0", "mv"])
+            self.assertEqual(store.get_labels_dictionary(1),
+                             {0: "a", 1: "b", 2: "c"})
+            self.assertEqual(store.get_sample_ids(1)[3], "s3")
+            predictions = store.get_predictions(1)
+            self.assertEqual(predictions.dtype, np.int8)
+            np.testing.assert_array_equal(predictions, [
+                result.full_labels_pred for result in self.results])
+            np.testing.assert_array_equal(
+                store.get_predictions(1, ["mv"]),
+                [self.results[1].full_labels_pred])
+            np.testing.assert_array_equal(store.get_labels(1), self.labels)
+            train_indices, test_indices = store.get_split(1)
+            np.testing.assert_array_equal(test_indices, np.arange(12, 20))
+            self.assertEqual(set(store.get_folds(1)), {0, 1})
+            pd.testing.assert_frame_equal(
+                store.get_scores(1, "accuracy_score*"),
+                pd.DataFrame([[0.9, 0.7], [0.8, 0.6]],
+                             index=["train", "test"],
+                             columns=["dt-view0", "mv"]))
+            self.assertEqual(
+                store.get_class_scores(1, "f1_score").loc[("test", "b"),
+                                                          "dt-view0"], 0.7)
+            self.assertEqual(store.get_durations(1).loc["mv", "fit"], 2.0)
+            pd.testing.assert_frame_equal(
+                store.get_feature_importances(1)["view0"],
+                self.feature_importances["view0"])
+            self.assertEqual(store.get_classifier_infos(1), [
+                {"classifier_name": "dt", "config": {"max_depth": 3},
+                 "view_index": 0, "view_name": "view0", "n_features": 4,
+                 "feature_importances": True},
+                {"classifier_name": "mv", "config": {"alpha": 0.5}}])
+
+    def test_export_csv(self):
+        with ResultsStore(self.path) as store:
+            store.export_csv()
+        directory = self.arguments["directory"]
+        file_name = os.path.join(directory, "dt", "view0", "dt-db-view0-")
+        np.testing.assert_array_equal(
+            np.loadtxt(file_name + "full_pred.csv", delimiter=","),
+            self.results[0].full_labels_pred)
+        np.testing.assert_array_equal(
+            np.loadtxt(file_name + "train_labels.csv", delimiter=","),
+            self.labels[:12])
+        np.testing.assert_array_equal(
+            np.loadtxt(file_name + "confusion_matrix.csv", delimiter=","),
+            confusion_matrix(self.labels[12:],
+                             self.results[0].full_labels_pred[12:]))
+        with open(os.path.join(directory, "dt", "view0") +
+                  "feature_importances.pickle", "rb") as handle:
+            self.assertEqual(pickle.load(handle), {"f1": 0.75})
+        np.testing.assert_array_equal(
+            np.loadtxt(os.path.join(directory, "mv",
+                                    "mv-db_file-confusion_matrix.csv"),
+                       delimiter=","),
+            confusion_matrix(self.labels[12:],
+                             self.results[1].full_labels_pred[12:]))
+        self.assertFalse(os.path.isdir(os.path.join(directory,
+                                                    "predictions")))
+        np.testing.assert_array_equal(
+            np.loadtxt(os.path.join(directory, "db-2D_plot_data.csv"),
+                       delimiter=","),
+            np.transpose([np.equal(result.full_labels_pred, self.labels)
+                          for result in self.results]))
+        self.assertTrue(os.path.isfile(os.path.join(
+            directory, "folds", "test_labels_fold_1.csv")))